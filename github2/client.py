@@ -1,4 +1,4 @@
-from github2.request import GithubRequest
+from github2.request import GithubRequest, run_batch
 from github2.issues import Issues
 from github2.repositories import Repositories
 from github2.users import Users
@@ -12,7 +12,11 @@ class Github(object):
 
     def __init__(self, username=None, api_token=None, requests_per_second=None,
                  access_token=None, cache=None, proxy_host=None,
-                 proxy_port=8080, github_url=None):
+                 proxy_port=8080, github_url=None, pool_size=None, burst=1,
+                 response_cache=None, cache_ttls=None, object_cache=None,
+                 retry_policy=None, coalesce_requests=True, json_codec=None,
+                 compression=True, profiler=None, tracer=None,
+                 compact_objects=False, raw_results=False):
         """
         An interface to GitHub's API:
             http://develop.github.com/
@@ -23,6 +27,11 @@ class Github(object):
            The ``cache`` and ``access_token`` parameters
         .. versionadded:: 0.4.0
            The ``proxy_host`` and ``proxy_port`` parameters
+        .. versionadded:: 0.7.0
+           The ``pool_size``, ``burst``, ``response_cache``, ``cache_ttls``,
+           ``object_cache``, ``retry_policy``, ``coalesce_requests``,
+           ``json_codec``, ``compression``, ``profiler``, ``tracer``,
+           ``compact_objects`` and ``raw_results`` parameters
 
         :param str username: your own GitHub username.
         :param str api_token: can be found at https://github.com/account
@@ -34,10 +43,61 @@ class Github(object):
             operating under (1 per second per GitHub at the moment),
             or None to disable delays.  The default is to disable delays (for
             backwards compatibility).
+        :param int burst: number of requests that may be made back-to-back
+            before ``requests_per_second`` applies, for example after a
+            period of inactivity.
         :param str cache: a directory for caching GitHub responses.
+        :param github2.cache.BaseCache response_cache: cache for decoded
+            responses, such as a :class:`~github2.cache.TieredCache`.  Unlike
+            ``cache``, entries are reused without any network request until
+            they expire.
+        :param dict cache_ttls: time to live in seconds for entries in
+            ``response_cache`` and ``object_cache``, keyed by the
+            ``domain/method`` of command methods or by ``domain``, for example
+            ``{"user/show": 3600, "issues/list": 60}`` for
+            :meth:`~github2.users.Users.show` and
+            :meth:`~github2.issues.Issues.list`.  A ``*`` key sets the
+            default, which is otherwise
+            :data:`~github2.request.DEFAULT_CACHE_TTL`.
+        :param github2.cache.BaseCache object_cache: in-memory cache for the
+            objects returned by API calls, such as a
+            :class:`~github2.cache.MemoryCache`.  Caches that serialise values,
+            such as a :class:`~github2.cache.DiskCache` or a
+            :class:`~github2.cache.TieredCache` with one, raise
+            :exc:`ValueError`.  Hits skip response decoding and object
+            construction entirely, and return copies of the cached objects.
         :param str proxy_host: the hostname for the HTTP proxy, if needed.
         :param str proxy_port: the hostname for the HTTP proxy, if needed (will
             default to 8080 if a proxy_host is set and no port is set).
+        :param int pool_size: maximum number of concurrent connections, which
+            allows a single client to be shared between threads.  The default
+            is a single connection that must not be shared between threads.
+        :param github2.request.RetryPolicy retry_policy: policy for retrying
+            idempotent requests that fail with connection errors or
+            transient server errors.  The default is not to retry.
+        :param bool coalesce_requests: share the response to a ``GET``
+            request with other threads making the identical request at the
+            same time, instead of sending duplicates.
+        :param str json_codec: name of the JSON codec to use, or a codec
+            instance.  The default is the fastest available codec, see
+            :func:`~github2.codec.get_codec`.
+        :param bool compression: ask for responses to be compressed, which
+            ``httplib2`` decompresses transparently.  Sizes before and after
+            decompression are counted in ``request.transfer``.
+        :param github2.profiler.Profiler profiler: profiler to record the
+            latency of each phase of API calls in.  The default is not to
+            profile calls.
+        :param github2.tracing.Tracer tracer: tracer to record spans for API
+            calls and their requests with.  The default is not to trace
+            calls.
+        :param bool compact_objects: return objects storing their attributes
+            in ``__slots__``, instead of a ``__dict__`` each.  See
+            :meth:`github2.core.BaseDataType.compact`.
+        :param raw_results: default for the ``raw`` argument of API calls.
+            ``True`` or ``"dict"`` returns decoded results as dicts and lists,
+            ``"bytes"`` returns undecoded response bodies, and ``"columns"``
+            returns :class:`~github2.columns.ColumnSet` tables, instead of data
+            type objects.  See :meth:`github2.core.GithubCommand.get_values`.
         """
 
         self.request = GithubRequest(username=username, api_token=api_token,
@@ -45,7 +105,18 @@ class Github(object):
                                      access_token=access_token, cache=cache,
                                      proxy_host=proxy_host,
                                      proxy_port=proxy_port,
-                                     github_url=github_url)
+                                     github_url=github_url,
+                                     pool_size=pool_size, burst=burst,
+                                     response_cache=response_cache,
+                                     cache_ttls=cache_ttls,
+                                     object_cache=object_cache,
+                                     retry_policy=retry_policy,
+                                     coalesce_requests=coalesce_requests,
+                                     json_codec=json_codec,
+                                     compression=compression,
+                                     profiler=profiler, tracer=tracer,
+                                     compact_objects=compact_objects,
+                                     raw_results=raw_results)
         self.issues = Issues(self.request)
         self.users = Users(self.request)
         self.repos = Repositories(self.request)
@@ -54,6 +125,30 @@ class Github(object):
         self.teams = Teams(self.request)
         self.pull_requests = PullRequests(self.request)
 
+    def batch(self, calls, max_workers=None):
+        """Make several API calls concurrently
+
+        Calls are run by up to ``max_workers`` threads, which defaults to
+        ``pool_size``, and still respect ``requests_per_second``.  Without a
+        connection pool calls are made one after another::
+
+            >>> github = Github(pool_size=8)
+            >>> results = github.batch([(github.repos.show, project)
+            ...                         for project in projects])
+            >>> repos = [repo for repo, error in results if error is None]
+
+        .. versionadded:: 0.7.0
+
+        :param list calls: tuples of a command method, such as
+            ``github.repos.show``, and its positional arguments
+        :param int max_workers: maximum number of calls in flight
+        :rtype: list
+        :return: ``(result, error)`` tuples in the order of ``calls``, where
+            ``error`` is the exception raised by a failed call
+        """
+        return run_batch(self.request.propagate(calls),
+                         self.request.batch_workers(max_workers))
+
     def project_for_user_repo(self, user, repo):
         """Return Github identifier for a user's repository
 
@@ -73,6 +168,19 @@ class Github(object):
         blobs = self.request.get("blob/all", project, tree_sha)
         return blobs.get("blobs")
 
+    def stream_all_blobs(self, project, tree_sha):
+        """Iterate over all blobs for a specific tree, decoding them as
+        they're used
+
+        .. versionadded:: 0.7.0
+
+        :param str project: GitHub project
+        :param str tree_sha: object ID of tree
+        :return: iterator of ``(path, sha)`` tuples
+        :see: :meth:`get_all_blobs`
+        """
+        return self.request.stream("blobs", "blob/all", project, tree_sha)
+
     def get_blob_info(self, project, tree_sha, path):
         """Get the blob for a file within a specific tree
 
@@ -119,3 +227,25 @@ class Github(object):
                                                   project,
                                                   "network_data_chunk"]),
                                                   data)
+
+    def stream_network_data(self, project, nethash, start=None, end=None):
+        """Iterate over the commits in a chunk of Github network data,
+        decoding them as they're used
+
+        .. versionadded:: 0.7.0
+
+        :param str project: GitHub project
+        :param str nethash: identifier provided by ``get_network_meta``
+        :param int start: optional start point for data
+        :param int stop: optional end point for data
+        :see: :meth:`get_network_data`
+        """
+        data = {"nethash": nethash}
+        if start:
+            data["start"] = start
+        if end:
+            data["end"] = end
+
+        url = "/".join([self.request.github_url, project,
+                        "network_data_chunk"])
+        return self.request.stream_request(url, "commits", data)
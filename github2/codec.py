@@ -0,0 +1,105 @@
+"""JSON codecs for :class:`github2.request.GithubRequest`
+
+The fastest available codec is selected by default, with the standard
+library's :mod:`json` module as the fallback.  Codecs
+decode responses straight from the bytes received where the character set
+allows it, saving a full copy of the body.
+
+.. versionadded:: 0.7.0
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+#: Character sets that are valid UTF-8, and may be decoded from bytes
+UTF8_CHARSETS = ("utf-8", "utf8", "ascii", "us-ascii")
+
+#: Whether :func:`json.loads` accepts bytes, as it does since Python 3.6
+try:
+    JSON_DECODES_BYTES = json.loads("[]".encode("ascii")) == []
+except TypeError:
+    JSON_DECODES_BYTES = False
+
+
+class JsonCodec(object):
+    """JSON codec using the standard library's :mod:`json` module"""
+
+    #: Name used to select the codec
+    name = "json"
+
+    def loads(self, content, charset="utf-8"):
+        """Decode a JSON document
+
+        :param bytes content: encoded document
+        :param str charset: character set of ``content``
+        """
+        if JSON_DECODES_BYTES and charset.lower() in UTF8_CHARSETS:
+            return json.loads(content)
+        return json.loads(content.decode(charset))
+
+    def dumps(self, value):
+        """Encode a JSON document
+
+        :param value: value to encode
+        :rtype: bytes
+        :return: UTF-8 encoded document
+        """
+        return json.dumps(value).encode("utf-8")
+
+
+class OrjsonCodec(JsonCodec):
+    """JSON codec using orjson_
+
+    Documents orjson rejects are passed to the standard library instead, so
+    that errors are reported consistently.
+
+    .. _orjson: https://github.com/ijl/orjson
+    """
+
+    name = "orjson"
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError("orjson is not installed")
+
+    def loads(self, content, charset="utf-8"):
+        if charset.lower() not in UTF8_CHARSETS:
+            content = content.decode(charset)
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # Use the standard library's result, or error, instead
+            if isinstance(content, bytes):
+                content = content.decode("utf-8")
+            return json.loads(content)
+
+    def dumps(self, value):
+        return orjson.dumps(value)
+
+
+#: Codecs in order of preference
+CODECS = [OrjsonCodec, JsonCodec]
+
+
+def get_codec(name=None):
+    """Create a JSON codec
+
+    :param str name: name of the codec to use, or ``None`` to use the first
+        available codec in :data:`CODECS`
+    :raise ValueError: if the named codec doesn't exist
+    :raise ImportError: if the named codec isn't available
+    """
+    for codec in CODECS:
+        if name is None:
+            try:
+                return codec()
+            except ImportError:
+                continue
+        elif codec.name == name:
+            return codec()
+    raise ValueError("Unknown JSON codec %r" % name)
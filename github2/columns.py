@@ -0,0 +1,176 @@
+"""Columnar result sets for large listings
+
+A :class:`ColumnSet` holds a listing as one column per attribute of its data
+type, instead of one object per value::
+
+    >>> from github2.client import Github
+    >>> github = Github()
+    >>> commits = github.commits.list("JNRowe/misc-overlay", raw="columns")
+    >>> dates = commits["committed_date"]
+    >>> frame = commits.to_pandas()
+
+Columns are :mod:`numpy` arrays if NumPy is installed, with dates in
+``datetime64`` columns, and plain lists otherwise.  Exporting to pandas or
+Arrow requires those packages.
+
+.. versionadded:: 0.7.0
+"""
+
+from datetime import datetime
+
+from dateutil import tz
+
+
+_UTC = tz.tzutc()
+
+
+def _import_numpy():
+    """Import NumPy when the first columns are built
+
+    :return: the :mod:`numpy` module, or ``None`` if it isn't installed
+    """
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _utc(value):
+    if value is not None and value.tzinfo is not None:
+        value = value.astimezone(_UTC).replace(tzinfo=None)
+    return value
+
+
+def _array(numpy, values):
+    """Convert a column's values to the most specific NumPy array"""
+    present = [value for value in values if value is not None]
+    if present and all([isinstance(value, datetime) for value in present]):
+        # datetime64 has no timezones, so aware dates are stored as UTC
+        values = [_utc(value) for value in values]
+        return numpy.array(values, dtype="datetime64[s]")
+    if len(present) == len(values):
+        if all([isinstance(value, bool) for value in values]):
+            return numpy.array(values, dtype=bool)
+        if all([isinstance(value, int) and not isinstance(value, bool)
+                for value in values]):
+            return numpy.array(values, dtype="int64")
+    if present and all([_is_number(value) for value in present]):
+        # Missing numbers become NaN
+        return numpy.array([value is None and float("nan") or value
+                            for value in values], dtype="float64")
+    array = numpy.empty(len(values), dtype=object)
+    # Assigned one by one, as NumPy would broadcast values that are lists
+    for index, value in enumerate(values):
+        array[index] = value
+    return array
+
+
+class ColumnSet(object):
+    """Listing stored as one column per attribute
+
+    Columns are named after the attributes of the data type, in the order of
+    its ``_meta``, and values are converted by the attributes as they would be
+    for objects.  Keys that aren't attributes of the data type are dropped.
+    Without a data type, columns are named after the keys of the values, in
+    the order they are first seen.
+
+    Missing values are ``None`` in list and object columns, ``NaT`` in
+    ``datetime64`` columns and ``NaN`` in float columns.  Dates are naive or
+    timezone-aware as set by :data:`github2.core.NAIVE`, and aware dates are
+    stored as UTC in ``datetime64`` columns.
+
+    Only listings of objects can be stored as columns, not listings of names
+    or other plain values.
+    """
+
+    def __init__(self, datatype, values):
+        """Build columns from decoded values
+
+        :param github2.core.BaseDataType datatype: data type of the values,
+            or ``None``
+        :param values: iterable of decoded values, such as the dicts of a
+            ``raw`` listing
+        :raise ValueError: if the values aren't dicts
+        """
+        self.datatype = datatype
+        if datatype is not None:
+            names = list(datatype._meta)
+        else:
+            names = []
+        lists = dict([(name, []) for name in names])
+        length = 0
+        for value in values:
+            if not isinstance(value, dict):
+                raise ValueError("Only listings of objects can be stored as "
+                                 "columns, not of %s values"
+                                 % type(value).__name__)
+            for name in value:
+                if name not in lists and datatype is None:
+                    names.append(name)
+                    lists[name] = [None] * length
+            for name in names:
+                lists[name].append(value.get(name))
+            length += 1
+        if datatype is not None:
+            for name, attr in datatype._meta.items():
+                lists[name] = [attr.to_python(value)
+                               for value in lists[name]]
+        self.names = names
+        self.length = length
+        numpy = _import_numpy()
+        if numpy is None:
+            self.columns = lists
+        else:
+            self.columns = dict([(name, _array(numpy, lists[name]))
+                                 for name in names])
+
+    def __repr__(self):
+        return "<ColumnSet: %d %s rows, %d columns>" % (
+            self.length, getattr(self.datatype, "__name__", "dict"),
+            len(self.names))
+
+    def __len__(self):
+        return self.length
+
+    def __getitem__(self, name):
+        """Column for an attribute
+
+        :param str name: attribute name
+        """
+        return self.columns[name]
+
+    def __iter__(self):
+        return iter(self.names)
+
+    def rows(self):
+        """Iterate over the values as dicts, as a ``raw`` listing would
+
+        Values are converted, so dates are :class:`~datetime.datetime`
+        objects, or NumPy ``datetime64`` values.
+        """
+        columns = [self.columns[name] for name in self.names]
+        for index in range(self.length):
+            yield dict(zip(self.names, [column[index]
+                                        for column in columns]))
+
+    def to_pandas(self):
+        """Convert to a :class:`pandas.DataFrame`
+
+        :raise ImportError: if pandas isn't installed
+        """
+        import pandas
+        return pandas.DataFrame(self.columns, columns=self.names)
+
+    def to_arrow(self):
+        """Convert to a :class:`pyarrow.Table`
+
+        :raise ImportError: if pyarrow isn't installed
+        """
+        import pyarrow
+        return pyarrow.table([self.columns[name] for name in self.names],
+                             names=self.names)
@@ -1,5 +1,5 @@
 from github2.core import (BaseData, GithubCommand, Attribute, DateAttribute,
-                          repr_string)
+                          DEFAULT_PREFETCH, repr_string)
 
 
 class Commit(BaseData):
@@ -27,7 +27,7 @@ class Commit(BaseData):
 class Commits(GithubCommand):
     domain = "commits"
 
-    def list(self, project, branch="master", file=None, page=1):
+    def list(self, project, branch="master", file=None, page=1, raw=None):
         """List commits on a project
 
         .. warning::
@@ -39,15 +39,55 @@ class Commits(GithubCommand):
         :param str branch: branch name, or ``master`` if not given
         :param str file: optional file filter
         :param int page: optional page number
+        :param raw: return decoded dicts, body bytes or columns instead of
+            objects, see :meth:`~github2.core.GithubCommand.get_values`
         """
         return self.get_values("list", project, branch, file, filter="commits",
-                               datatype=Commit, page=page)
+                               datatype=Commit, page=page, raw=raw)
 
-    def show(self, project, sha):
+    def stream_list(self, project, branch="master", file=None, page=1,
+                    raw=None):
+        """Iterate over commits on a project, decoding them as they're used
+
+        .. versionadded:: 0.7.0
+
+        :param str project: project name
+        :param str branch: branch name, or ``master`` if not given
+        :param str file: optional file filter
+        :param int page: optional page number
+        :param raw: return decoded dicts, body bytes or columns instead of
+            objects, see :meth:`~github2.core.GithubCommand.get_values`
+        :see: :meth:`list`, :meth:`~github2.core.GithubCommand.stream_values`
+        """
+        return self.stream_values("list", project, branch, file,
+                                  filter="commits", datatype=Commit,
+                                  page=page, raw=raw)
+
+    def iter_list(self, project, branch="master", file=None,
+                  prefetch=DEFAULT_PREFETCH, raw=None):
+        """Iterate over all commits on a project, following pages
+
+        .. versionadded:: 0.7.0
+
+        :param str project: project name
+        :param str branch: branch name, or ``master`` if not given
+        :param str file: optional file filter
+        :param int prefetch: number of pages to fetch ahead
+        :param raw: return decoded dicts, body bytes or columns instead of
+            objects, see :meth:`~github2.core.GithubCommand.get_values`
+        :see: :meth:`list`, :class:`~github2.core.PageIterator`
+        """
+        return self.iter_values("list", project, branch, file,
+                                filter="commits", datatype=Commit,
+                                prefetch=prefetch, raw=raw)
+
+    def show(self, project, sha, raw=None):
         """Get a specific commit
 
         :param str project: project name
         :param str sha: commit id
+        :param raw: return decoded dicts, body bytes or columns instead of
+            objects, see :meth:`~github2.core.GithubCommand.get_values`
         """
         return self.get_value("show", project, sha,
-                              filter="commit", datatype=Commit)
+                              filter="commit", datatype=Commit, raw=raw)
@@ -59,6 +59,19 @@ class Organizations(GithubCommand):
         return self.get_values(organization, 'repositories',
                                filter="repositories", datatype=Repository)
 
+    def stream_repositories(self, organization=''):
+        """Iterate over repositories in an organization, decoding them as
+        they're used
+
+        .. versionadded:: 0.7.0
+
+        :param: str organization: organization to list repositories for
+        :see: :meth:`repositories`,
+            :meth:`~github2.core.GithubCommand.stream_values`
+        """
+        return self.stream_values(organization, 'repositories',
+                                  filter="repositories", datatype=Repository)
+
     def public_repositories(self, organization):
         """Get list of public repositories in an organization
 
@@ -0,0 +1,421 @@
+"""Latency profiling for API calls
+
+A :class:`Profiler` breaks every :meth:`~github2.core.GithubCommand.get_value`
+and :meth:`~github2.core.GithubCommand.get_values` call into the phases of the
+request pipeline, and aggregates a latency :class:`Histogram` for each phase
+of each endpoint.
+
+.. versionadded:: 0.7.0
+"""
+
+import logging
+import math
+import random
+import threading
+import time
+
+from collections import deque
+try:
+    import tracemalloc  # For Python 3.4+
+except ImportError:
+    tracemalloc = None
+
+
+#: Logger for profiler module
+LOGGER = logging.getLogger('github2.profiler')
+
+#: Timer used to measure latencies
+timer = getattr(time, "perf_counter", time.time)
+
+#: Phases of an API call, in pipeline order
+PHASES = (
+    # Waiting for the rate limiter, or the API quota
+    "throttle",
+    # Establishing connections, including DNS lookups and TLS handshakes
+    "connect",
+    # Waiting for response headers, after sending the request
+    "server",
+    # Reading response bodies from the network
+    "read",
+    # Waiting before retrying failed requests
+    "retry_wait",
+    # Parsing the response's character set
+    "charset",
+    # Decoding JSON
+    "parse",
+    # Building result objects, including parsing their dates
+    "construct",
+    # Time not accounted for by the other phases, such as cache lookups and
+    # decompression
+    "other",
+    # The whole call
+    "total",
+)
+
+
+class Histogram(object):
+    """Histogram of durations with logarithmic buckets
+
+    Buckets grow by ``growth`` from ``resolution`` seconds, so percentiles
+    are accurate to within the relative width of a bucket regardless of
+    scale, and memory use is bounded by the range of durations recorded.
+    """
+
+    def __init__(self, resolution=1e-6, growth=2 ** 0.125):
+        """Create an empty histogram
+
+        :param float resolution: smallest duration distinguished, in seconds
+        :param float growth: ratio between the bounds of successive buckets
+        """
+        self.resolution = resolution
+        self.growth = growth
+        self._log_growth = math.log(growth)
+        self.buckets = {}
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+
+    def add(self, seconds):
+        """Record a duration
+
+        :param float seconds: duration to record
+        """
+        if seconds > self.resolution:
+            bucket = int(math.log(seconds / self.resolution)
+                         / self._log_growth) + 1
+        else:
+            bucket = 0
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+        self.count += 1
+        self.total += seconds
+        if self.min is None or seconds < self.min:
+            self.min = seconds
+        if self.max is None or seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, percent):
+        """Estimate a percentile of the recorded durations
+
+        :param float percent: percentile to estimate, from 0 to 100
+        :return: duration in seconds, or ``None`` if the histogram is empty
+        """
+        if not self.count:
+            return None
+        rank = max(1, int(math.ceil(self.count * percent / 100.0)))
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= rank:
+                break
+        if bucket == 0:
+            estimate = self.resolution
+        else:
+            # Geometric midpoint of the bucket's bounds
+            estimate = self.resolution * self.growth ** (bucket - 0.5)
+        return min(max(estimate, self.min), self.max)
+
+    def summary(self):
+        """Summarise the recorded durations
+
+        :rtype: dict
+        :return: ``count``, ``total``, ``min``, ``max``, ``mean``, ``p50``,
+            ``p95`` and ``p99`` values, in seconds
+        """
+        mean = None
+        if self.count:
+            mean = self.total / self.count
+        return {
+            "count": self.count,
+            "total": self.total,
+            "min": self.min,
+            "max": self.max,
+            "mean": mean,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+        }
+
+
+def format_call(call):
+    """Describe a profiled call, for logging
+
+    :param dict call: call, as kept in :attr:`Profiler.slow_calls`
+    :rtype: str
+    """
+    phases = call["phases"]
+    timings = ", ".join(["%s %.3fs" % (phase, phases[phase])
+                         for phase in PHASES
+                         if phase in phases and phase != "total"])
+    text = "%s took %.3fs (%s), %d request(s) of %d bytes (%d on the wire)" \
+        % (call["endpoint"], phases["total"], timings,
+           call.get("requests", 0), call.get("decoded_bytes", 0),
+           call.get("wire_bytes", 0))
+    if call.get("memory"):
+        text += ", %d bytes allocated" % call["memory"]["allocated"]
+    return text
+
+
+class Profiler(object):
+    """Per-endpoint, per-phase latency profiler
+
+    Calls are identified by an endpoint name, such as ``issues/list`` for
+    :meth:`~github2.issues.Issues.list`.  Phases are summed over all of the
+    requests made by a call, including retries, and only phases that
+    occurred are recorded, see :data:`PHASES`.  Time spent outside the
+    recorded phases is reported as ``other``.
+
+    Calls taking at least ``slow_threshold`` seconds are logged with their
+    timings and response sizes, and kept in :attr:`slow_calls`.
+
+    A ``memory_sample_rate`` fraction of calls are measured with
+    :mod:`tracemalloc`, which is only tracing while a sampled call is in
+    progress.  The memory still allocated once a call returns, mostly its
+    result objects, is aggregated per endpoint, see :meth:`memory_stats`.
+    Only one call is sampled at a time, but allocations made by other
+    threads meanwhile are included.
+
+    Each thread profiles its own calls, so a profiler may be shared by a
+    client's threads.
+    """
+
+    def __init__(self, clock=timer, slow_threshold=None,
+                 memory_sample_rate=0, memory_snapshots=False,
+                 history=100, random=random.random):
+        """Create a new profiler
+
+        :param func clock: function returning a time in seconds, for
+            measuring whole calls
+        :param float slow_threshold: duration in seconds from which calls
+            are logged, or ``None`` to disable logging
+        :param float memory_sample_rate: fraction of calls to measure the
+            memory use of, from 0 to 1
+        :param bool memory_snapshots: compare :mod:`tracemalloc` snapshots
+            taken around sampled calls, to find where their memory was
+            allocated.  This is much slower than measuring totals.
+        :param int history: number of slow and sampled calls to keep
+        :param func random: function returning a random float in
+            ``[0, 1)``, used to sample calls
+        """
+        if memory_sample_rate and tracemalloc is None:
+            raise ValueError("Memory sampling requires tracemalloc")
+        self.clock = clock
+        self.slow_threshold = slow_threshold
+        self.memory_sample_rate = memory_sample_rate
+        self.memory_snapshots = memory_snapshots
+        self.random = random
+        #: Recent calls slower than ``slow_threshold``
+        self.slow_calls = deque(maxlen=history)
+        #: Recent calls measured with :mod:`tracemalloc`
+        self.memory_samples = deque(maxlen=history)
+        self._histograms = {}
+        self._memory = {}
+        self._sampling = False
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def active(self):
+        """Check whether the current thread is profiling a call
+
+        :rtype: bool
+        """
+        return bool(getattr(self._local, "calls", None))
+
+    def start(self, endpoint):
+        """Start profiling a call on the current thread
+
+        Calls started within another call are profiled separately.
+
+        :param str endpoint: name of the call, such as ``issues/list``
+        """
+        calls = getattr(self._local, "calls", None)
+        if calls is None:
+            calls = self._local.calls = []
+        sample = None
+        if self.memory_sample_rate and not calls \
+                and self.random() < self.memory_sample_rate:
+            sample = self._start_sample()
+        calls.append({"endpoint": endpoint, "started": self.clock(),
+                      "phases": {}, "counters": {}, "sample": sample})
+
+    def record(self, phase, seconds):
+        """Add time spent in a phase to the current thread's call
+
+        Time recorded without a call in progress is ignored.
+
+        :param str phase: phase name
+        :param float seconds: time spent
+        """
+        calls = getattr(self._local, "calls", None)
+        if calls:
+            phases = calls[-1]["phases"]
+            phases[phase] = phases.get(phase, 0.0) + seconds
+
+    def count(self, name, value=1):
+        """Add to a counter of the current thread's call
+
+        Counters, such as the ``requests`` made and their ``wire_bytes`` and
+        ``decoded_bytes``, are reported for slow and sampled calls.
+
+        :param str name: counter name
+        :param int value: amount to add
+        """
+        calls = getattr(self._local, "calls", None)
+        if calls:
+            counters = calls[-1]["counters"]
+            counters[name] = counters.get(name, 0) + value
+
+    def finish(self):
+        """Finish profiling the current thread's call
+
+        :rtype: dict
+        :return: seconds spent in each phase of the call
+        """
+        call = self._local.calls.pop()
+        endpoint, phases = call["endpoint"], call["phases"]
+        phases["total"] = self.clock() - call["started"]
+        other = phases["total"] - sum([seconds
+                                       for phase, seconds in phases.items()
+                                       if phase != "total"])
+        if other > 0:
+            phases["other"] = other
+        memory = None
+        if call["sample"] is not None:
+            memory = self._finish_sample(call["sample"])
+        self._lock.acquire()
+        try:
+            histograms = self._histograms.setdefault(endpoint, {})
+            for phase, seconds in phases.items():
+                if phase not in histograms:
+                    histograms[phase] = Histogram()
+                histograms[phase].add(seconds)
+            if memory is not None:
+                if endpoint not in self._memory:
+                    self._memory[endpoint] = Histogram(resolution=1)
+                self._memory[endpoint].add(max(0, memory["allocated"]))
+        finally:
+            self._lock.release()
+        slow = self.slow_threshold is not None \
+            and phases["total"] >= self.slow_threshold
+        if slow or memory is not None:
+            report = dict(call["counters"], endpoint=endpoint,
+                          phases=phases, memory=memory)
+            if memory is not None:
+                self.memory_samples.append(report)
+            if slow:
+                self.slow_calls.append(report)
+                LOGGER.warning("slow call %s", format_call(report))
+        return phases
+
+    def _start_sample(self):
+        """Start measuring memory, unless another call is being measured"""
+        self._lock.acquire()
+        try:
+            if self._sampling:
+                return None
+            self._sampling = True
+        finally:
+            self._lock.release()
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        elif hasattr(tracemalloc, "reset_peak"):  # For Python 3.9+
+            tracemalloc.reset_peak()
+        snapshot = None
+        if self.memory_snapshots:
+            snapshot = tracemalloc.take_snapshot()
+        return started_tracing, tracemalloc.get_traced_memory()[0], snapshot
+
+    def _finish_sample(self, sample):
+        """Stop measuring memory
+
+        :return: bytes ``allocated`` and still in use, ``peak`` bytes in use
+            during the call, and the ``top`` allocating source lines if
+            snapshots are enabled
+        """
+        started_tracing, before, snapshot = sample
+        top = None
+        if snapshot is not None:
+            stats = tracemalloc.take_snapshot().compare_to(snapshot, "lineno")
+            top = [("%s:%d" % (stat.traceback[0].filename,
+                               stat.traceback[0].lineno),
+                    stat.size_diff, stat.count_diff)
+                   for stat in stats[:10]]
+        current, peak = tracemalloc.get_traced_memory()
+        if started_tracing:
+            tracemalloc.stop()
+        self._lock.acquire()
+        try:
+            self._sampling = False
+        finally:
+            self._lock.release()
+        return {"allocated": current - before,
+                "peak": max(0, peak - before), "top": top}
+
+    def reset(self):
+        """Discard all recorded latencies and memory samples"""
+        self._lock.acquire()
+        try:
+            self._histograms = {}
+            self._memory = {}
+            self.slow_calls.clear()
+            self.memory_samples.clear()
+        finally:
+            self._lock.release()
+
+    def stats(self):
+        """Latency summaries
+
+        :rtype: dict
+        :return: :meth:`Histogram.summary` dicts keyed by endpoint, then
+            phase
+        """
+        self._lock.acquire()
+        try:
+            return dict([(endpoint, dict([(phase, histogram.summary())
+                                          for phase, histogram
+                                          in histograms.items()]))
+                         for endpoint, histograms
+                         in self._histograms.items()])
+        finally:
+            self._lock.release()
+
+    def memory_stats(self):
+        """Summaries of the memory allocated by sampled calls
+
+        :rtype: dict
+        :return: :meth:`Histogram.summary` dicts keyed by endpoint, in bytes
+        """
+        self._lock.acquire()
+        try:
+            return dict([(endpoint, histogram.summary())
+                         for endpoint, histogram in self._memory.items()])
+        finally:
+            self._lock.release()
+
+    def report(self):
+        """Format latencies as a table, slowest endpoints first
+
+        Durations are given in milliseconds.
+
+        :rtype: str
+        """
+        stats = self.stats()
+        lines = ["%-32s %-10s %7s %9s %9s %9s %10s"
+                 % ("endpoint", "phase", "count", "p50", "p95", "p99",
+                    "total")]
+        endpoints = sorted(stats, key=lambda e: -stats[e]["total"]["total"])
+        for endpoint in endpoints:
+            name = endpoint
+            for phase in PHASES:
+                if phase not in stats[endpoint]:
+                    continue
+                summary = stats[endpoint][phase]
+                lines.append("%-32s %-10s %7d %9.3f %9.3f %9.3f %10.3f"
+                             % (name, phase, summary["count"],
+                                summary["p50"] * 1000,
+                                summary["p95"] * 1000,
+                                summary["p99"] * 1000,
+                                summary["total"] * 1000))
+                name = ""
+        return "\n".join(lines)
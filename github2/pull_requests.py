@@ -1,5 +1,5 @@
 from github2.core import (BaseData, GithubCommand, Attribute, DateAttribute,
-                          repr_string)
+                          DEFAULT_PREFETCH, repr_string)
 
 
 class PullRequest(BaseData):
@@ -93,3 +93,16 @@ class PullRequests(GithubCommand):
         """
         return self.get_values(project, state, filter="pulls",
                                datatype=PullRequest, page=page)
+
+    def iter_list(self, project, state="open", prefetch=DEFAULT_PREFETCH):
+        """Iterate over all pull requests for a project, following pages
+
+        .. versionadded:: 0.7.0
+
+        :param str project: Github project
+        :param str state: can be either ``open`` or ``closed``
+        :param int prefetch: number of pages to fetch ahead
+        :see: :meth:`list`, :class:`~github2.core.PageIterator`
+        """
+        return self.iter_values(project, state, filter="pulls",
+                                datatype=PullRequest, prefetch=prefetch)
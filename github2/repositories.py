@@ -1,5 +1,5 @@
 from github2.core import (BaseData, GithubCommand, Attribute, DateAttribute,
-                          requires_auth)
+                          DEFAULT_PREFETCH, requires_auth)
 
 from github2.users import User
 
@@ -36,35 +36,42 @@ class Repository(BaseData):
 class Repositories(GithubCommand):
     domain = "repos"
 
-    def search(self, query):
+    def search(self, query, raw=None):
         """Get all repositories that match term.
 
         .. warning:
            Returns at most 100 repositories
 
         :param str query: term to search issues for
+        :param raw: return decoded dicts, body bytes or columns instead of
+            objects, see :meth:`~github2.core.GithubCommand.get_values`
         """
         return self.get_values("search", query, filter="repositories",
-                               datatype=Repository)
+                               datatype=Repository, raw=raw)
 
-    def show(self, project):
+    def show(self, project, raw=None):
         """Get repository object for project.
 
         :param str project: GitHub project
+        :param raw: return decoded dicts, body bytes or columns instead of
+            objects, see :meth:`~github2.core.GithubCommand.get_values`
         """
         return self.get_value("show", project, filter="repository",
-                              datatype=Repository)
+                              datatype=Repository, raw=raw)
 
     @requires_auth
-    def pushable(self):
+    def pushable(self, raw=None):
         """Return a list of repos you can push to that are not your own.
 
         .. versionadded:: 0.3.0
+
+        :param raw: return decoded dicts, body bytes or columns instead of
+            objects, see :meth:`~github2.core.GithubCommand.get_values`
         """
         return self.get_values("pushable", filter="repositories",
-                               datatype=Repository)
+                               datatype=Repository, raw=raw)
 
-    def list(self, user=None, page=1):
+    def list(self, user=None, page=1, raw=None):
         """Return a list of all repositories for a user.
 
         .. deprecated: 0.4.0
@@ -74,51 +81,79 @@ class Repositories(GithubCommand):
 
         :param str user: Github user name to list repositories for
         :param int page: optional page number
+        :param raw: return decoded dicts, body bytes or columns instead of
+            objects, see :meth:`~github2.core.GithubCommand.get_values`
         """
         user = user or self.request.username
         return self.get_values("show", user, filter="repositories",
-                               datatype=Repository, page=page)
+                               datatype=Repository, page=page, raw=raw)
+
+    def iter_list(self, user=None, prefetch=DEFAULT_PREFETCH, raw=None):
+        """Iterate over all repositories for a user, following pages
+
+        .. versionadded:: 0.7.0
+
+        :param str user: Github user name to list repositories for
+        :param int prefetch: number of pages to fetch ahead
+        :param raw: return decoded dicts, body bytes or columns instead of
+            objects, see :meth:`~github2.core.GithubCommand.get_values`
+        :see: :meth:`list`, :class:`~github2.core.PageIterator`
+        """
+        user = user or self.request.username
+        return self.iter_values("show", user, filter="repositories",
+                                datatype=Repository, prefetch=prefetch,
+                                raw=raw)
 
     @requires_auth
-    def watch(self, project):
+    def watch(self, project, raw=None):
         """Watch a project
 
         :param str project: GitHub project
+        :param raw: return decoded dicts, body bytes or columns instead of
+            objects, see :meth:`~github2.core.GithubCommand.get_values`
         """
         return self.get_value("watch", project, filter='repository',
-                              datatype=Repository)
+                              datatype=Repository, raw=raw)
 
     @requires_auth
-    def unwatch(self, project):
+    def unwatch(self, project, raw=None):
         """Unwatch a project
 
         :param str project: GitHub project
+        :param raw: return decoded dicts, body bytes or columns instead of
+            objects, see :meth:`~github2.core.GithubCommand.get_values`
         """
         return self.get_value("unwatch", project, filter='repository',
-                              datatype=Repository)
+                              datatype=Repository, raw=raw)
 
     @requires_auth
-    def fork(self, project):
+    def fork(self, project, raw=None):
         """Fork a project
 
         :param str project: GitHub project
+        :param raw: return decoded dicts, body bytes or columns instead of
+            objects, see :meth:`~github2.core.GithubCommand.get_values`
         """
         return self.get_value("fork", project, filter="repository",
-                              datatype=Repository)
+                              datatype=Repository, raw=raw)
 
     @requires_auth
-    def create(self, project, description=None, homepage=None, public=True):
+    def create(self, project, description=None, homepage=None, public=True,
+               raw=None):
         """Create a repository
 
         :param str project: new project name
         :param str description: optional project description
         :param str homepage: optional project homepage
         :param bool public: whether to make a public project
+        :param raw: return decoded dicts, body bytes or columns instead of
+            objects, see :meth:`~github2.core.GithubCommand.get_values`
         """
         repo_data = {"name": project, "description": description,
                      "homepage": homepage, "public": str(int(public))}
         return self.get_value("create", post_data=repo_data,
-                              filter="repository", datatype=Repository)
+                              filter="repository", datatype=Repository,
+                              raw=raw)
 
     @requires_auth
     def delete(self, project):
@@ -147,13 +182,14 @@ class Repositories(GithubCommand):
         """
         return self.make_request("set/public", project)
 
-    def list_collaborators(self, project):
+    def list_collaborators(self, project, raw=None):
         """Lists all the collaborators in a project
 
         :param str project: GitHub project
+        :param raw: see :meth:`~github2.core.GithubCommand.get_values`
         """
         return self.get_values("show", project, "collaborators",
-                               filter="collaborators")
+                               filter="collaborators", raw=raw)
 
     @requires_auth
     def add_collaborator(self, project, username):
@@ -175,57 +211,86 @@ class Repositories(GithubCommand):
         return self.make_request("collaborators", project, "remove",
                                  username, method="POST")
 
-    def network(self, project):
+    def network(self, project, raw=None):
         """Get network data for project
 
         :param str project: Github project
+        :param raw: return decoded dicts, body bytes or columns instead of
+            objects, see :meth:`~github2.core.GithubCommand.get_values`
         """
         return self.get_values("show", project, "network", filter="network",
-                               datatype=Repository)
+                               datatype=Repository, raw=raw)
 
-    def languages(self, project):
+    def languages(self, project, raw=None):
         """Get programming language data for project
 
         :param str project: Github project
+        :param raw: see :meth:`~github2.core.GithubCommand.get_values`
         """
         return self.get_values("show", project, "languages",
-                               filter="languages")
+                               filter="languages", raw=raw)
 
-    def tags(self, project):
+    def tags(self, project, raw=None):
         """Get tags for project
 
         :param str project: Github project
+        :param raw: see :meth:`~github2.core.GithubCommand.get_values`
         """
-        return self.get_values("show", project, "tags", filter="tags")
+        return self.get_values("show", project, "tags", filter="tags", raw=raw)
 
-    def branches(self, project):
+    def branches(self, project, raw=None):
         """Get branch names for project
 
         :param str project: Github project
+        :param raw: see :meth:`~github2.core.GithubCommand.get_values`
         """
-        return self.get_values("show", project, "branches", filter="branches")
+        return self.get_values("show", project, "branches", filter="branches",
+                               raw=raw)
 
-    def watchers(self, project):
+    def watchers(self, project, raw=None):
         """Get list of watchers for project
 
         :param str project: Github project
+        :param raw: see :meth:`~github2.core.GithubCommand.get_values`
         """
-        return self.get_values("show", project, "watchers", filter="watchers")
+        return self.get_values("show", project, "watchers", filter="watchers",
+                               raw=raw)
 
-    def watching(self, for_user=None, page=None):
+    def watching(self, for_user=None, page=None, raw=None):
         """Lists all the repos a user is watching
 
         :param str for_user: optional Github user name to list repositories for
         :param int page: optional page number
+        :param raw: return decoded dicts, body bytes or columns instead of
+            objects, see :meth:`~github2.core.GithubCommand.get_values`
         """
         for_user = for_user or self.request.username
         return self.get_values("watched", for_user, filter="repositories",
-                               datatype=Repository, page=page)
+                               datatype=Repository, page=page, raw=raw)
+
+    def iter_watching(self, for_user=None, prefetch=DEFAULT_PREFETCH,
+                      raw=None):
+        """Iterate over all the repos a user is watching, following pages
+
+        .. versionadded:: 0.7.0
+
+        :param str for_user: optional Github user name to list repositories for
+        :param int prefetch: number of pages to fetch ahead
+        :param raw: return decoded dicts, body bytes or columns instead of
+            objects, see :meth:`~github2.core.GithubCommand.get_values`
+        :see: :meth:`watching`, :class:`~github2.core.PageIterator`
+        """
+        for_user = for_user or self.request.username
+        return self.iter_values("watched", for_user, filter="repositories",
+                                datatype=Repository, prefetch=prefetch,
+                                raw=raw)
 
-    def list_contributors(self, project):
+    def list_contributors(self, project, raw=None):
         """Lists all the contributors in a project
 
         :param str project: Github project
+        :param raw: return decoded dicts, body bytes or columns instead of
+            objects, see :meth:`~github2.core.GithubCommand.get_values`
         """
         return self.get_values("show", project, "contributors",
-                               filter="contributors", datatype=User)
+                               filter="contributors", datatype=User, raw=raw)
@@ -1,9 +1,13 @@
-import datetime
 import logging
+import random
 import re
+import socket
 import sys
+import threading
 import time
 
+from email.utils import (mktime_tz, parsedate_tz)
+from hashlib import md5
 try:
     # For Python 3
     from http.client import responses
@@ -14,6 +18,11 @@ except ImportError:  # For Python 2.5-2.7
         from BaseHTTPServer import BaseHTTPRequestHandler
         responses = dict([(k, v[0])
                           for k, v in BaseHTTPRequestHandler.responses.items()])
+try:
+    # For Python 3
+    from http.client import HTTPException
+except ImportError:  # For Python 2
+    from httplib import HTTPException
 try:
     import json as simplejson  # For Python 2.6+
 except ImportError:
@@ -21,21 +30,28 @@ except ImportError:
 from os import path
 try:
     # For Python 3
-    from urllib.parse import (parse_qs, quote, urlencode, urlsplit, urlunsplit)
+    from urllib.parse import (parse_qs, parse_qsl, quote, urlencode, urlsplit,
+                              urlunsplit)
 except ImportError:
     from urlparse import (urlsplit, urlunsplit)
     try:
-        from urlparse import parse_qs
+        from urlparse import (parse_qs, parse_qsl)
     except ImportError:
-        from cgi import parse_qs
+        from cgi import (parse_qs, parse_qsl)
     from urllib import urlencode, quote
 
 import httplib2
 
+from github2.codec import get_codec
+from github2.profiler import timer
+
 
 #: Hostname for API access
 DEFAULT_GITHUB_URL = "https://github.com"
 
+#: Time to live in seconds for cached responses, when not set in ``cache_ttls``
+DEFAULT_CACHE_TTL = 60
+
 #: Logger for requests module
 LOGGER = logging.getLogger('github2.request')
 
@@ -76,6 +92,252 @@ def charset_from_headers(headers):
     return charset
 
 
+def normalize_url(url):
+    """Normalise a URL for use as a lookup key
+
+    The scheme and host are lowercased, and query parameters are sorted so
+    that equivalent URLs produce the same key.
+
+    :param str url: URL to normalise
+    """
+    scheme, netloc, path, query, fragment = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(query, keep_blank_values=True)))
+    return urlunsplit((scheme.lower(), netloc.lower(), path or "/", query,
+                       ""))
+
+
+def parse_link_header(value):
+    """Parse a RFC 5988 ``Link`` header
+
+    :param str value: header value
+    :rtype: dict
+    :return: URLs keyed by their ``rel`` value
+    """
+    links = {}
+    for match in re.finditer(r'<([^>]*)>\s*;\s*rel="?([^",;]+)"?', value):
+        url, rels = match.groups()
+        for rel in rels.split():
+            links[rel] = url
+    return links
+
+
+def copy_json(value):
+    """Copy a decoded JSON document, so that it can be handed to a caller
+
+    Only lists and dicts are copied, as the other JSON types are immutable.
+    This is much faster than :func:`copy.deepcopy`.
+
+    .. versionadded:: 0.7.0
+
+    :param value: decoded document
+    """
+    if isinstance(value, dict):
+        return dict([(key, copy_json(item)) for key, item in value.items()])
+    elif isinstance(value, list):
+        return [copy_json(item) for item in value]
+    return value
+
+
+#: Pattern matching JSON whitespace
+JSON_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+def iter_json_items(text, key=None):
+    """Decode the items of a JSON array, or object, one at a time
+
+    Only the current item is held in memory as decoded objects, so large
+    listings can be processed without building the whole result first.
+
+    .. versionadded:: 0.7.0
+
+    :param str text: JSON document
+    :param str key: key of the top-level object holding the array or object
+        to iterate over, or ``None`` if the document itself is the array or
+        object
+    :return: iterator of the array's values, or of ``(name, value)`` pairs
+        for an object
+    :raise KeyError: if ``key`` isn't found in the top-level object
+    :raise ValueError: if ``text`` isn't valid JSON of the expected shape
+    """
+    decode = simplejson.JSONDecoder().raw_decode
+
+    def skip(index):
+        return JSON_WHITESPACE.match(text, index).end()
+
+    def expect(char, index):
+        if text[index:index + 1] != char:
+            raise ValueError("Expecting %r at offset %d" % (char, index))
+        return skip(index + 1)
+
+    index = skip(0)
+    if key is not None:
+        index = expect("{", index)
+        while True:
+            if text[index:index + 1] == "}":
+                raise KeyError(key)
+            name, index = decode(text, index)
+            index = expect(":", skip(index))
+            if name == key:
+                break
+            index = skip(decode(text, index)[1])
+            if text[index:index + 1] == ",":
+                index = skip(index + 1)
+    opening = text[index:index + 1]
+    if opening not in ("[", "{"):
+        raise ValueError("Expecting an array or object at offset %d" % index)
+    closing = {"[": "]", "{": "}"}[opening]
+    index = skip(index + 1)
+    if text[index:index + 1] == closing:
+        return
+    while True:
+        if opening == "{":
+            name, index = decode(text, index)
+            index = expect(":", skip(index))
+            value, index = decode(text, index)
+            yield name, value
+        else:
+            value, index = decode(text, index)
+            yield value
+        index = skip(index)
+        if text[index:index + 1] == closing:
+            return
+        index = expect(",", index)
+
+
+#: Bytes of response bodies read from the network by the current thread, and
+#: the time spent in each phase of its requests while profiling
+_received = threading.local()
+
+
+def _add_phase(phases, phase, started):
+    phases[phase] = phases.get(phase, 0.0) + timer() - started
+
+
+def counting_connection(connection_class):
+    """Create a connection class counting the response bytes received
+
+    The count is taken before ``httplib2`` decompresses the response, so it
+    reflects the size on the wire.  While a request is profiled, the time
+    spent connecting, waiting for the response and reading it is recorded
+    too.
+
+    .. versionadded:: 0.7.0
+
+    :param type connection_class: ``httplib2`` connection class to extend
+    """
+    class CountingConnection(connection_class):
+        def connect(self):
+            phases = getattr(_received, "phases", None)
+            if phases is None:
+                return connection_class.connect(self)
+            started = timer()
+            try:
+                return connection_class.connect(self)
+            finally:
+                _add_phase(phases, "connect", started)
+
+        def getresponse(self, *args, **kwargs):
+            started = timer()
+            response = connection_class.getresponse(self, *args, **kwargs)
+            phases = getattr(_received, "phases", None)
+            if phases is not None:
+                _add_phase(phases, "server", started)
+            read = response.read
+
+            def counting_read(*args):
+                if phases is None:
+                    data = read(*args)
+                else:
+                    started = timer()
+                    data = read(*args)
+                    _add_phase(phases, "read", started)
+                _received.bytes = (getattr(_received, "bytes", None) or 0) \
+                    + len(data)
+                return data
+            response.read = counting_read
+            return response
+    CountingConnection.__name__ = "Counting" + connection_class.__name__
+    return CountingConnection
+
+
+#: Connection classes counting response bytes, keyed by URL scheme
+COUNTING_CONNECTIONS = {
+    "http": counting_connection(httplib2.HTTPConnectionWithTimeout),
+    "https": counting_connection(httplib2.HTTPSConnectionWithTimeout),
+}
+
+_counting_http_classes = {}
+
+
+def counting_http(http_class):
+    """Extend a :class:`httplib2.Http` class to count response bytes received
+
+    .. versionadded:: 0.7.0
+
+    :param type http_class: class to extend
+    :see: :func:`counting_connection`
+    """
+    if http_class not in _counting_http_classes:
+        class CountingHttp(http_class):
+            def request(self, uri, method="GET", body=None, headers=None,
+                        redirections=httplib2.DEFAULT_MAX_REDIRECTS,
+                        connection_type=None):
+                if connection_type is None:
+                    scheme = urlsplit(uri)[0]
+                    connection_type = COUNTING_CONNECTIONS.get(scheme)
+                return http_class.request(self, uri, method, body, headers,
+                                          redirections, connection_type)
+        _counting_http_classes[http_class] = CountingHttp
+    return _counting_http_classes[http_class]
+
+
+def run_batch(calls, workers):
+    """Run calls on a bounded pool of worker threads
+
+    Exceptions are captured for each call, so a failure doesn't affect the
+    other calls.
+
+    .. versionadded:: 0.7.0
+
+    :param list calls: tuples of a callable and its positional arguments
+    :param int workers: maximum number of calls to run at once
+    :rtype: list
+    :return: ``(result, error)`` tuples in the order of ``calls``, where
+        ``error`` is ``None`` for successful calls and ``result`` is ``None``
+        for failed calls
+    """
+    if workers < 1:
+        raise ValueError("workers must be at least 1, not %r" % workers)
+    results = [None] * len(calls)
+    pending = iter(enumerate(calls))
+    lock = threading.Lock()
+
+    def worker():
+        while True:
+            lock.acquire()
+            try:
+                index, call = next(pending, (None, None))
+            finally:
+                lock.release()
+            if index is None:
+                return
+            try:
+                results[index] = (call[0](*call[1:]), None)
+            except Exception:
+                results[index] = (None, sys.exc_info()[1])
+
+    threads = [threading.Thread(target=worker)
+               for _ in range(min(workers, len(calls)))]
+    if len(threads) == 1:
+        worker()
+    else:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    return results
+
+
 class GithubError(Exception):
     """An error occured when making a request to the Github API."""
 
@@ -100,6 +362,606 @@ class HttpError(RuntimeError):
             LOGGER.warning('Unknown HTTP status %r, please file an issue', code)
 
 
+class ConnectionPool(object):
+    """Pool of :class:`httplib2.Http` objects for sharing between threads
+
+    :class:`httplib2.Http` objects are not thread safe, so each request
+    checks out an object for its exclusive use and returns it afterwards.
+    Returned objects retain their keep-alive connections, and are reused by
+    subsequent requests.
+
+    .. versionadded:: 0.7.0
+    """
+
+    def __init__(self, factory, size):
+        """Create a new connection pool
+
+        :param func factory: callable returning a new :class:`httplib2.Http`
+        :param int size: maximum number of :class:`httplib2.Http` objects
+        """
+        if size < 1:
+            raise ValueError("Pool size must be at least 1, not %r" % size)
+        self.factory = factory
+        self.size = size
+        self._idle = []
+        self._created = 0
+        self._in_use = 0
+        self._max_in_use = 0
+        self._checkouts = 0
+        self._waits = 0
+        self._cond = threading.Condition()
+
+    def acquire(self):
+        """Check out a :class:`httplib2.Http` object
+
+        Blocks until an object is available, if ``size`` objects are already
+        in use.
+        """
+        self._cond.acquire()
+        try:
+            if not self._idle and self._created >= self.size:
+                self._waits += 1
+                while not self._idle:
+                    self._cond.wait()
+            if self._idle:
+                http = self._idle.pop()
+            else:
+                http = self.factory()
+                self._created += 1
+            self._checkouts += 1
+            self._in_use += 1
+            self._max_in_use = max(self._max_in_use, self._in_use)
+            return http
+        finally:
+            self._cond.release()
+
+    def release(self, http):
+        """Return a :class:`httplib2.Http` object to the pool
+
+        :param httplib2.Http http: object returned from :meth:`acquire`
+        """
+        self._cond.acquire()
+        try:
+            self._in_use -= 1
+            self._idle.append(http)
+            self._cond.notify()
+        finally:
+            self._cond.release()
+
+    def stats(self):
+        """Pool utilisation counters
+
+        :rtype: dict
+        :return: ``size``, ``created``, ``idle``, ``in_use``, ``max_in_use``,
+            ``checkouts`` and ``waits`` counters
+        """
+        self._cond.acquire()
+        try:
+            return {
+                "size": self.size,
+                "created": self._created,
+                "idle": len(self._idle),
+                "in_use": self._in_use,
+                "max_in_use": self._max_in_use,
+                "checkouts": self._checkouts,
+                "waits": self._waits,
+            }
+        finally:
+            self._cond.release()
+
+
+class TokenBucket(object):
+    """Thread safe token bucket rate limiter
+
+    Tokens are added at ``rate`` per second, up to a maximum of ``burst``
+    tokens, and each request consumes a single token.  Callers that find the
+    bucket empty reserve the next available token, so concurrent callers are
+    spaced out at ``rate`` instead of all waking at once.
+
+    .. versionadded:: 0.7.0
+    """
+
+    def __init__(self, rate, burst=1, clock=None, sleep=time.sleep):
+        """Create a new token bucket
+
+        :param float rate: tokens added per second
+        :param int burst: maximum number of tokens that can accumulate
+        :param func clock: function returning the current time in seconds,
+            defaults to a monotonic clock where available
+        :param func sleep: function used to wait for tokens
+        """
+        if rate <= 0:
+            raise ValueError("Rate must be positive, not %r" % rate)
+        if burst < 1:
+            raise ValueError("Burst must be at least 1, not %r" % burst)
+        self.rate = float(rate)
+        self.burst = burst
+        if clock is None:
+            clock = getattr(time, "monotonic", time.time)
+        self.clock = clock
+        self.sleep = sleep
+        self._tokens = float(burst)
+        self._updated = clock()
+        self._acquired = 0
+        self._waits = 0
+        self._wait_time = 0.0
+        self._max_wait = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = self.clock()
+        self._tokens = min(self.burst,
+                           self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_acquire(self):
+        """Take a token, if one is available without waiting
+
+        This never blocks, making it suitable for use from event loops.
+
+        :rtype: bool
+        :return: ``True`` if a token was taken
+        """
+        self._lock.acquire()
+        try:
+            self._refill()
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            self._acquired += 1
+            return True
+        finally:
+            self._lock.release()
+
+    def wait_time(self):
+        """Time until a token will be available
+
+        :rtype: float
+        :return: seconds to wait, ``0.0`` if a token is available now
+        """
+        self._lock.acquire()
+        try:
+            self._refill()
+            return max(0.0, (1 - self._tokens) / self.rate)
+        finally:
+            self._lock.release()
+
+    def acquire(self):
+        """Take a token, waiting for one to become available if necessary
+
+        :rtype: float
+        :return: seconds spent waiting for a token
+        """
+        self._lock.acquire()
+        try:
+            self._refill()
+            self._tokens -= 1
+            duration = max(0.0, -self._tokens / self.rate)
+            self._acquired += 1
+            if duration:
+                self._waits += 1
+                self._wait_time += duration
+                self._max_wait = max(self._max_wait, duration)
+        finally:
+            self._lock.release()
+        if duration:
+            LOGGER.warning("delaying API call %g second(s)", duration)
+            self.sleep(duration)
+        return duration
+
+    def stats(self):
+        """Rate limiter counters
+
+        :rtype: dict
+        :return: ``acquired``, ``waits``, ``wait_time`` and ``max_wait``
+            counters, with times in seconds
+        """
+        self._lock.acquire()
+        try:
+            return {
+                "acquired": self._acquired,
+                "waits": self._waits,
+                "wait_time": self._wait_time,
+                "max_wait": self._max_wait,
+            }
+        finally:
+            self._lock.release()
+
+
+class RetryPolicy(object):
+    """Retry policy for transient failures of idempotent requests
+
+    Requests failing with a connection error, a ``429`` or ``5xx`` status,
+    or a ``403`` abuse limit response are retried after a capped exponential
+    backoff with full jitter.  A ``Retry-After`` header sets the minimum
+    wait, and responses asking for a longer wait than ``max_backoff`` are
+    not retried.
+
+    Each endpoint has a retry budget.  Endpoints are the ``domain/method``
+    names of command methods, such as ``issues/list``, or the ``domain`` of
+    requests made outside of command methods, so that every user or
+    repository requested shares a budget.  The budget starts with ``budget_reserve`` retries, each
+    request adds ``budget_ratio`` of a retry up to that reserve, and each
+    retry spends one.  This stops retries from multiplying the load on an
+    endpoint that is failing persistently.
+
+    .. versionadded:: 0.7.0
+    """
+
+    #: HTTP methods that are safe to repeat
+    idempotent_methods = ("GET", "HEAD", "PUT", "DELETE", "OPTIONS")
+    #: HTTP statuses that are retried
+    retry_statuses = (429, 500, 502, 503, 504)
+    #: Exceptions raised for connection failures that are retried
+    retry_exceptions = (socket.error, HTTPException)
+
+    def __init__(self, max_retries=3, backoff=0.5, max_backoff=60,
+                 budget_ratio=0.2, budget_reserve=10, random=random.random,
+                 clock=time.time, sleep=time.sleep):
+        """Create a new retry policy
+
+        :param int max_retries: maximum number of retries for a request
+        :param float backoff: base delay in seconds, doubled for each retry
+        :param float max_backoff: maximum delay in seconds
+        :param float budget_ratio: retries added to an endpoint's budget by
+            each request
+        :param int budget_reserve: maximum retries in an endpoint's budget
+        :param func random: function returning a float in ``[0, 1)``, used
+            for jitter
+        :param func clock: function returning the current UNIX time
+        :param func sleep: function used to wait between attempts
+        """
+        if max_retries < 0:
+            raise ValueError("max_retries must not be negative, not %r"
+                             % max_retries)
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.budget_ratio = budget_ratio
+        self.budget_reserve = budget_reserve
+        self.random = random
+        self.clock = clock
+        self.sleep = sleep
+        self._budgets = {}
+        self._counters = {"requests": 0, "retries": 0, "recovered": 0,
+                          "exhausted": 0, "budget_exhausted": 0,
+                          "wait_time": 0.0}
+        self._endpoint_retries = {}
+        self._lock = threading.Lock()
+
+    def retryable_response(self, response, content):
+        """Check whether a response is a transient failure
+
+        :param httplib2.Response response: response headers
+        :param bytes content: response body
+        :rtype: bool
+        """
+        if response.status in self.retry_statuses:
+            return True
+        if response.status == 403:
+            return "retry-after" in response \
+                or b"abuse" in content.lower()
+        return False
+
+    def retry_after(self, response):
+        """Wait requested by a response's ``Retry-After`` header
+
+        :param httplib2.Response response: response headers
+        :return: seconds to wait, or ``None`` if no valid header was sent
+        """
+        value = response.get("retry-after")
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            parsed = parsedate_tz(value)
+            if parsed is None:
+                return None
+            return max(0.0, mktime_tz(parsed) - self.clock())
+
+    def delay(self, retry, retry_after=None):
+        """Delay before a retry
+
+        :param int retry: retry number, starting at ``1``
+        :param float retry_after: wait requested by the server
+        :return: seconds to wait, or ``None`` if the requested wait is
+            longer than ``max_backoff``
+        """
+        if retry_after is not None and retry_after > self.max_backoff:
+            return None
+        ceiling = min(self.max_backoff, self.backoff * 2 ** (retry - 1))
+        return max(retry_after or 0.0, ceiling * self.random())
+
+    def start(self, endpoint):
+        """Record a new request, adding to the endpoint's retry budget
+
+        :param str endpoint: endpoint identifier
+        """
+        self._lock.acquire()
+        try:
+            self._counters["requests"] += 1
+            budget = self._budgets.get(endpoint, self.budget_reserve)
+            self._budgets[endpoint] = min(self.budget_reserve,
+                                          budget + self.budget_ratio)
+        finally:
+            self._lock.release()
+
+    def allow(self, endpoint, retry, delay):
+        """Spend a retry from the endpoint's budget, if permitted
+
+        :param str endpoint: endpoint identifier
+        :param int retry: retry number, starting at ``1``
+        :param float delay: delay before the retry, ``None`` if the retry
+            should not be attempted
+        :rtype: bool
+        """
+        self._lock.acquire()
+        try:
+            if retry > self.max_retries or delay is None:
+                self._counters["exhausted"] += 1
+                return False
+            if self._budgets.get(endpoint, self.budget_reserve) < 1:
+                self._counters["budget_exhausted"] += 1
+                return False
+            self._budgets[endpoint] = \
+                self._budgets.get(endpoint, self.budget_reserve) - 1
+            self._counters["retries"] += 1
+            self._counters["wait_time"] += delay
+            self._endpoint_retries[endpoint] = \
+                self._endpoint_retries.get(endpoint, 0) + 1
+            return True
+        finally:
+            self._lock.release()
+
+    def recovered(self):
+        """Record a request that succeeded after retrying"""
+        self._lock.acquire()
+        try:
+            self._counters["recovered"] += 1
+        finally:
+            self._lock.release()
+
+    def stats(self):
+        """Retry counters
+
+        :rtype: dict
+        :return: ``requests``, ``retries``, ``recovered``, ``exhausted`` and
+            ``budget_exhausted`` counters, the total ``wait_time`` in seconds
+            and an ``endpoints`` dict of retries for each endpoint
+        """
+        self._lock.acquire()
+        try:
+            stats = dict(self._counters)
+            stats["endpoints"] = dict(self._endpoint_retries)
+            return stats
+        finally:
+            self._lock.release()
+
+
+class SingleFlight(object):
+    """Share the result of a call between concurrent callers with the same key
+
+    While a call for a key is in flight, other callers with that key wait for
+    it to finish and receive its result, or its exception, instead of making
+    their own call.  Nothing is retained once a call finishes, so this
+    complements caching rather than replacing it.
+
+    Results are returned as is to callers that weren't sharing them.  A
+    shared result is passed through ``copy`` for each of its callers, so that
+    none of them sees another's modifications.
+
+    .. versionadded:: 0.7.0
+    """
+
+    def __init__(self, copy=None):
+        """Create a new single flight group
+
+        :param func copy: function copying shared results, or ``None`` to
+            return them as is to every caller
+        """
+        self.copy = copy
+        self._calls = {}
+        self._calls_made = 0
+        self._coalesced = 0
+        self._lock = threading.Lock()
+
+    def do(self, key, func):
+        """Call ``func``, unless a call with the same key is in flight
+
+        :param str key: key identifying equivalent calls
+        :param func func: function to call, without arguments
+        :return: result of ``func``, from this caller's call or the call in
+            flight
+        """
+        self._lock.acquire()
+        try:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = {"done": threading.Event(),
+                                           "waiters": 0}
+                self._calls_made += 1
+            else:
+                call["waiters"] += 1
+                self._coalesced += 1
+        finally:
+            self._lock.release()
+        if not leader:
+            call["done"].wait()
+            if "error" in call:
+                raise call["error"]
+            return self._shared(call["result"])
+        try:
+            call["result"] = func()
+        except Exception:
+            call["error"] = sys.exc_info()[1]
+            raise
+        finally:
+            self._lock.acquire()
+            try:
+                del self._calls[key]
+                # No more callers can join once the call is removed
+                shared = call["waiters"]
+            finally:
+                self._lock.release()
+            call["done"].set()
+        if shared:
+            return self._shared(call["result"])
+        return call["result"]
+
+    def _shared(self, result):
+        if self.copy is None:
+            return result
+        return self.copy(result)
+
+    def stats(self):
+        """Single flight counters
+
+        :rtype: dict
+        :return: ``in_flight`` calls, along with ``calls`` made and
+            ``coalesced`` callers that shared another caller's result
+        """
+        self._lock.acquire()
+        try:
+            return {
+                "in_flight": len(self._calls),
+                "calls": self._calls_made,
+                "coalesced": self._coalesced,
+            }
+        finally:
+            self._lock.release()
+
+
+class TransferCounter(object):
+    """Counters for the size of responses, on the wire and decoded
+
+    .. versionadded:: 0.7.0
+    """
+
+    def __init__(self):
+        self._counters = {"responses": 0, "compressed": 0, "wire_bytes": 0,
+                          "decoded_bytes": 0}
+        self._lock = threading.Lock()
+
+    def record(self, wire_bytes, decoded_bytes, encoding):
+        """Record a response
+
+        :param int wire_bytes: size of the body as received
+        :param int decoded_bytes: size of the body after decompression
+        :param str encoding: content coding of the response
+        """
+        self._lock.acquire()
+        try:
+            self._counters["responses"] += 1
+            if encoding != "identity":
+                self._counters["compressed"] += 1
+            self._counters["wire_bytes"] += wire_bytes
+            self._counters["decoded_bytes"] += decoded_bytes
+        finally:
+            self._lock.release()
+
+    def stats(self):
+        """Transfer counters
+
+        :rtype: dict
+        :return: ``responses`` and ``compressed`` response counts, along with
+            the total ``wire_bytes`` and ``decoded_bytes`` of their bodies
+        """
+        self._lock.acquire()
+        try:
+            return dict(self._counters)
+        finally:
+            self._lock.release()
+
+
+class Hooks(object):
+    """Registry of callbacks for request lifecycle events
+
+    Callbacks are called with a dict describing the event, which always
+    includes its ``event`` name.  Events raised while making a request also
+    include the request's ``method``, ``url`` without credentials,
+    ``endpoint``, and the ``domain`` and ``command`` of the
+    :class:`~github2.core.GithubCommand` making it, if any.
+
+    ``request_start``
+        a request is about to be sent
+    ``request_end``
+        a request finished, with its ``status``, ``latency`` in seconds,
+        ``encoding``, ``wire_bytes`` and ``decoded_bytes`` of its body,
+        ``quota_remaining`` and ``error`` raised, if any
+    ``retry``
+        a request will be retried, with the ``attempt`` number, ``delay`` in
+        seconds and the ``reason``
+    ``cache_hit`` and ``cache_miss``
+        a ``cache``, either ``response`` or ``object``, was consulted
+    ``throttle_wait``
+        a request waited ``seconds`` for the ``limiter``, either ``rate`` or
+        ``quota``
+    ``error``
+        a request failed, with the ``error`` raised and ``status``, if any
+    ``call_start`` and ``call_end``
+        a :class:`~github2.core.GithubCommand` call, with the ``name`` of the
+        command method, started or finished, with the ``error`` raised, if
+        any.  Requests made by the call are reported between these events.
+
+    Exceptions raised by callbacks are logged and otherwise ignored.
+
+    .. versionadded:: 0.7.0
+    """
+
+    #: Names of the supported events
+    events = ("request_start", "request_end", "retry", "cache_hit",
+              "cache_miss", "throttle_wait", "error", "call_start",
+              "call_end")
+
+    def __init__(self):
+        self._callbacks = dict([(event, []) for event in self.events])
+
+    def register(self, event, callback):
+        """Call ``callback`` for every ``event``
+
+        :param str event: event name
+        :param func callback: function accepting an event dict
+        :return: ``callback``, so this can be used as a decorator factory
+        :raise ValueError: for unknown events
+        """
+        if event not in self._callbacks:
+            raise ValueError("Unknown event %r" % event)
+        self._callbacks[event] = self._callbacks[event] + [callback]
+        return callback
+
+    def unregister(self, event, callback):
+        """Stop calling ``callback`` for ``event``
+
+        :param str event: event name
+        :param func callback: previously registered function
+        """
+        self._callbacks[event] = [registered
+                                  for registered in self._callbacks[event]
+                                  if registered != callback]
+
+    def active(self, event):
+        """Check whether any callbacks are registered for ``event``
+
+        :rtype: bool
+        """
+        return bool(self._callbacks.get(event))
+
+    def emit(self, event, data):
+        """Call the callbacks registered for ``event``
+
+        :param str event: event name
+        :param dict data: event description, updated with the event name
+        """
+        data["event"] = event
+        for callback in self._callbacks[event]:
+            try:
+                callback(data)
+            except Exception:
+                LOGGER.exception("Error in %s hook %r", event, callback)
+
+
 class GithubRequest(object):
     url_format = "%(github_url)s/api/%(api_version)s/%(api_format)s"
     api_version = "v2"
@@ -109,7 +971,11 @@ class GithubRequest(object):
     def __init__(self, username=None, api_token=None, url_prefix=None,
                  requests_per_second=None, access_token=None,
                  cache=None, proxy_host=None, proxy_port=None,
-                 github_url=None):
+                 github_url=None, pool_size=None, burst=1,
+                 response_cache=None, cache_ttls=None, object_cache=None,
+                 retry_policy=None, coalesce_requests=True,
+                 json_codec=None, compression=True, profiler=None,
+                 tracer=None, compact_objects=False, raw_results=False):
         """Make an API request.
 
         :see: :class:`github2.client.Github`
@@ -123,28 +989,290 @@ class GithubRequest(object):
         else:
             self.github_url = github_url
         if requests_per_second is None:
-            self.delay = 0
+            self.rate_limiter = None
         else:
-            self.delay = 1.0 / requests_per_second
-        self.last_request = datetime.datetime(1900, 1, 1)
+            self.rate_limiter = TokenBucket(requests_per_second, burst)
         if not self.url_prefix:
             self.url_prefix = self.url_format % {
                 "github_url": self.github_url,
                 "api_version": self.api_version,
                 "api_format": self.api_format,
             }
-        if proxy_host is None:
-            self._http = httplib2.Http(cache=cache)
+        self.cache = cache
+        self.response_cache = response_cache
+        self.cache_ttls = cache_ttls or {}
+        if object_cache is not None and object_cache.serializes:
+            raise ValueError("object_cache must keep values in memory, %r "
+                             "serialises them" % object_cache)
+        self.object_cache = object_cache
+        self.retry_policy = retry_policy
+        self.compression = compression
+        self.transfer = TransferCounter()
+        self.hooks = Hooks()
+        self.profiler = profiler
+        self.tracer = tracer
+        self.compact_objects = compact_objects
+        self.raw_results = raw_results
+        if tracer is not None:
+            tracer.instrument(self.hooks)
+        if json_codec is None or isinstance(json_codec, str):
+            self.codec = get_codec(json_codec)
         else:
-            proxy_info = httplib2.ProxyInfo(httplib2.socks.PROXY_TYPE_HTTP,
-                                            proxy_host, proxy_port)
-            self._http = httplib2.Http(proxy_info=proxy_info, cache=cache)
-        self._http.ca_certs = CA_CERTS
+            self.codec = json_codec
+        if coalesce_requests:
+            self.in_flight = SingleFlight(copy_json)
+        else:
+            self.in_flight = None
+        self._local = threading.local()
+        self.proxy_host = proxy_host
+        self.proxy_port = proxy_port
+        if pool_size is None:
+            self.pool = None
+            self._http = self._new_http()
+        else:
+            self.pool = ConnectionPool(self._new_http, pool_size)
+            self._http = None
         if SYSTEM_CERTS:
             LOGGER.info('Using system certificates in %r', CA_CERTS)
         else:
             LOGGER.warning('Using bundled certificate for HTTPS connections')
 
+    def _new_http(self):
+        """Create a :class:`httplib2.Http` object for making requests"""
+        http_class = counting_http(httplib2.Http)
+        if self.proxy_host is None:
+            http = http_class(cache=self.cache)
+        else:
+            proxy_info = httplib2.ProxyInfo(httplib2.socks.PROXY_TYPE_HTTP,
+                                            self.proxy_host, self.proxy_port)
+            http = http_class(proxy_info=proxy_info, cache=self.cache)
+        http.ca_certs = CA_CERTS
+        return http
+
+    def _http_request(self, url, method, body, headers):
+        """Perform a HTTP request, using the connection pool if enabled
+
+        :return: ``httplib2.Response`` and content tuple
+        """
+        if self.pool is None:
+            http = self._http
+        else:
+            http = self.pool.acquire()
+        _received.bytes = None
+        if self._profiling():
+            _received.phases = {}
+        else:
+            _received.phases = None
+        try:
+            response, content = http.request(url, method, body, headers)
+        finally:
+            if self.pool is not None:
+                self.pool.release(http)
+            if _received.phases:
+                for phase, seconds in _received.phases.items():
+                    self.profiler.record(phase, seconds)
+            _received.phases = None
+        self._record_transfer(response, content)
+        return response, content
+
+    def _record_transfer(self, response, content):
+        """Record the wire and decoded sizes of a response"""
+        # httplib2 removes the Content-Encoding header when decompressing
+        encoding = response.get("-content-encoding",
+                                response.get("content-encoding", "identity"))
+        wire_bytes = getattr(_received, "bytes", None)
+        if wire_bytes is None:
+            # Served without reading from the network
+            if getattr(response, "fromcache", False):
+                wire_bytes = 0
+            else:
+                wire_bytes = len(content)
+        self._local.transfer = {"encoding": encoding,
+                                "wire_bytes": wire_bytes,
+                                "decoded_bytes": len(content)}
+        self.transfer.record(wire_bytes, len(content), encoding)
+        if self.profiler is not None:
+            self.profiler.count("requests")
+            self.profiler.count("wire_bytes", wire_bytes)
+            self.profiler.count("decoded_bytes", len(content))
+
+    def last_transfer(self):
+        """Sizes of the current thread's most recent response
+
+        .. versionadded:: 0.7.0
+
+        :rtype: dict
+        :return: ``encoding`` of the response, and the ``wire_bytes`` and
+            ``decoded_bytes`` of its body, or ``None`` if no response has
+            been received
+        """
+        return getattr(self._local, "transfer", None)
+
+    def emit(self, event, **data):
+        """Report an event to the registered :attr:`hooks`
+
+        Details of the current thread's request are added to ``data``.
+
+        .. versionadded:: 0.7.0
+
+        :param str event: event name
+        """
+        if not self.hooks.active(event):
+            return
+        context = getattr(self._local, "context", None) or {}
+        for key, value in context.items():
+            data.setdefault(key, value)
+        self.hooks.emit(event, data)
+
+    def _set_context(self, method, url):
+        """Record the current thread's request, for events"""
+        domain, command = getattr(self._local, "command", None) or (None,
+                                                                    None)
+        self._local.context = {"method": method, "url": url,
+                               "endpoint": self.endpoint(url),
+                               "domain": domain, "command": command}
+
+    def _profiling(self):
+        """Check whether the current thread's call is being profiled"""
+        return self.profiler is not None and self.profiler.active()
+
+    def _record_phase(self, phase, seconds):
+        """Add time spent in a phase to the current thread's profiled call"""
+        if self.profiler is not None:
+            self.profiler.record(phase, seconds)
+
+    def _throttle(self):
+        """Wait for the rate limiter, if enabled"""
+        if self.rate_limiter:
+            waited = self.rate_limiter.acquire()
+            if waited:
+                self.emit("throttle_wait", seconds=waited, limiter="rate")
+                self._record_phase("throttle", waited)
+
+    def _send(self, url, method, body, headers):
+        """Perform a HTTP request, retrying transient failures
+
+        Only idempotent requests are retried, according to
+        :attr:`retry_policy`.
+
+        :return: ``httplib2.Response`` and content tuple of the final attempt
+        """
+        policy = self.retry_policy
+        if policy is None or method not in policy.idempotent_methods:
+            return self._http_request(url, method, body, headers)
+        endpoint = self.call_name() or self.endpoint(url).split("/")[0]
+        policy.start(endpoint)
+        retry = 0
+        while True:
+            retry_after = None
+            try:
+                response, content = self._http_request(url, method, body,
+                                                       headers)
+            except policy.retry_exceptions:
+                error = sys.exc_info()[1]
+                reason = repr(error)
+            else:
+                if not policy.retryable_response(response, content):
+                    if retry:
+                        policy.recovered()
+                    return response, content
+                error = None
+                reason = "HTTP %d" % response.status
+                retry_after = policy.retry_after(response)
+            retry += 1
+            delay = policy.delay(retry, retry_after)
+            if not policy.allow(endpoint, retry, delay):
+                if error is not None:
+                    raise error
+                return response, content
+            LOGGER.warning("retrying %s %s after %s in %g second(s)",
+                           method, self._local.context["url"], reason, delay)
+            self.emit("retry", attempt=retry, delay=delay, reason=reason)
+            self._record_phase("retry_wait", delay)
+            policy.sleep(delay)
+            self._throttle()
+
+    def endpoint(self, url):
+        """Endpoint identifier for a request URL
+
+        :param str url: request URL
+        :return: ``domain/command`` prefix of the path below ``url_prefix``
+        """
+        path = urlsplit(url)[2]
+        prefix = urlsplit(self.url_prefix)[2]
+        if path.startswith(prefix):
+            path = path[len(prefix):]
+        return "/".join(path.strip("/").split("/")[:2])
+
+    def _auth_scope(self):
+        """Identify the credentials used for requests"""
+        if self.access_token:
+            digest = md5(self.access_token.encode("utf-8")).hexdigest()
+            return "token:%s" % digest
+        elif self.username and self.api_token:
+            return "user:%s" % self.username
+        return "anonymous"
+
+    def cache_key(self, url, method="GET"):
+        """Key for caching the response to a request
+
+        Keys include the credentials in use, so that responses are never
+        shared between users.
+
+        :param str url: request URL
+        :param str method: HTTP method
+        """
+        return " ".join([method, self._auth_scope(), normalize_url(url)])
+
+    def call_name(self):
+        """Name of the command method making the current thread's call
+
+        .. versionadded:: 0.7.0
+
+        :return: ``domain/method`` of the command, such as ``issues/list``,
+            or ``None`` outside of command methods
+        """
+        call = getattr(self._local, "call", None)
+        if call is None:
+            return None
+        return "%s/%s" % (call[0].domain, call[1])
+
+    def cache_ttl(self, path):
+        """Time to live for a cached response
+
+        ``cache_ttls`` is searched for the ``domain/method`` name of the
+        command method making the call, see :meth:`call_name`, then its
+        ``domain``, and finally for a ``*`` default.  Requests made outside
+        of command methods use the path's ``domain/command`` prefix instead.
+
+        :param str path: request path relative to ``url_prefix``
+        :return: time to live in seconds, where ``0`` disables caching
+        """
+        name = self.call_name()
+        if name is None:
+            name = "/".join(path.split("/")[:2])
+        for key in [name, name.split("/")[0], "*"]:
+            if key in self.cache_ttls:
+                return self.cache_ttls[key]
+        return DEFAULT_CACHE_TTL
+
+    def links(self):
+        """``Link`` header of the current thread's most recent response
+
+        Responses served from caches have no links.
+
+        :rtype: dict
+        :see: :func:`parse_link_header`
+        """
+        return getattr(self._local, "links", {})
+
+    def reset_links(self):
+        """Forget the current thread's links, see :meth:`links`
+
+        .. versionadded:: 0.7.0
+        """
+        self._local.links = {}
+
     def encode_authentication_data(self, extra_post_data):
         post_data = []
         if self.access_token:
@@ -160,9 +1288,76 @@ class GithubRequest(object):
                 post_data.append((key, value))
         return urlencode(post_data)
 
-    def get(self, *path_components):
+    def get(self, *path_components, **params):
+        path_components = filter(None, path_components)
+        return self.make_request("/".join(path_components), params)
+
+    def get_many(self, requests, max_workers=None):
+        """Make several ``GET`` requests concurrently
+
+        Requests are made by up to ``max_workers`` threads, which defaults to
+        the connection pool's size.  Without a connection pool requests are
+        made one after another.
+
+        .. versionadded:: 0.7.0
+
+        :param list requests: tuples of path components, as passed to
+            :meth:`get`
+        :param int max_workers: maximum number of requests in flight
+        :see: :func:`run_batch`
+        """
+        calls = [(self.get, ) + tuple(path_components)
+                 for path_components in requests]
+        return run_batch(self.propagate(calls),
+                         self.batch_workers(max_workers))
+
+    def propagate(self, calls):
+        """Prepare calls to run in worker threads
+
+        Calls are wrapped so that their spans are nested within the current
+        thread's span, if tracing.
+
+        .. versionadded:: 0.7.0
+
+        :param list calls: tuples of a function and its positional arguments
+        """
+        if self.tracer is None:
+            return calls
+        return [(self.tracer.wrap(call[0]), ) + tuple(call[1:])
+                for call in calls]
+
+    def batch_workers(self, max_workers=None):
+        """Number of worker threads to use for a batch
+
+        :param int max_workers: requested number of workers
+        """
+        if self.pool is None:
+            return 1
+        return min(max_workers or self.pool.size, self.pool.size)
+
+    def stream(self, key, *path_components, **params):
+        """Make a ``GET`` request, decoding the result one item at a time
+
+        The request is made immediately, but the items of the array or object
+        under ``key`` are only decoded as they are consumed.  Responses are
+        not cached.
+
+        The body is still received in full, and decoded to text before
+        parsing, so memory use peaks at about twice the size of the body
+        while the request completes.  Only the decoded items are saved.
+
+        .. versionadded:: 0.7.0
+
+        :param str key: key of the top-level object holding the items, or
+            ``None`` if the response itself is an array or object
+        :see: :func:`iter_json_items`
+        """
         path_components = filter(None, path_components)
-        return self.make_request("/".join(path_components))
+        url = "/".join([self.url_prefix, quote("/".join(path_components))])
+        if params:
+            url = "?".join([url, urlencode(sorted(params.items()), True)])
+        self._local.links = {}
+        return self.stream_request(url, key)
 
     def post(self, *path_components, **extra_post_data):
         path_components = filter(None, path_components)
@@ -179,50 +1374,190 @@ class GithubRequest(object):
         return self.make_request("/".join(path_components), extra_post_data,
             method="DELETE")
 
-    def make_request(self, path, extra_post_data=None, method="GET"):
-        if self.delay:
-            since_last = (datetime.datetime.utcnow() - self.last_request)
-            if since_last.days == 0 and since_last.seconds < self.delay:
-                duration = self.delay - since_last.seconds
-                LOGGER.warning("delaying API call %g second(s)", duration)
-                time.sleep(duration)
+    def make_request(self, path, extra_post_data=None, method="GET",
+                     body=False):
+        """Make a request, returning its decoded result
 
+        :param str path: path of the request, below :attr:`url_prefix`
+        :param dict extra_post_data: query parameters for ``GET`` requests,
+            or data to send in the request body
+        :param str method: HTTP method
+        :param bool body: return the undecoded response body instead.  Body
+            requests are coalesced separately from decoded ones, and aren't
+            stored in :attr:`response_cache`, which holds decoded results.
+
+            .. versionadded:: 0.7.0
+        """
+        self._local.links = {}
         extra_post_data = extra_post_data or {}
         url = "/".join([self.url_prefix, quote(path)])
-        result = self.raw_request(url, extra_post_data, method=method)
+        if method == "GET" and extra_post_data:
+            url = "?".join([url, urlencode(sorted(extra_post_data.items()),
+                                           True)])
+            extra_post_data = {}
+        self._set_context(method, url)
+        send = None
+        shared_key = self.cache_key(url)
+        if body:
+            send = self.raw_body
+            shared_key += " body"
+        cache_key = ttl = None
+        if self.response_cache is not None and method == "GET" and not body:
+            ttl = self.cache_ttl(path)
+            if ttl:
+                cache_key = shared_key
+                result = self.response_cache.get(cache_key)
+                if result is not None:
+                    self.emit("cache_hit", cache="response")
+                    # Callers may modify results, but not the cached one
+                    return copy_json(result)
+                self.emit("cache_miss", cache="response")
 
-        if self.delay:
-            self.last_request = datetime.datetime.utcnow()
+        if self.in_flight is not None and method == "GET":
+            # Share the response between concurrent identical requests
+            result, links = self.in_flight.do(
+                shared_key,
+                lambda: (self._fetch(url, extra_post_data, method, send),
+                         self.links()))
+            self._local.links = links
+        else:
+            result = self._fetch(url, extra_post_data, method, send)
+        if cache_key:
+            self.response_cache.set(cache_key, result, ttl)
+            result = copy_json(result)
         return result
 
+    def _fetch(self, url, extra_post_data, method, send=None):
+        """Make a request, after waiting for the rate limiter
+
+        :param func send: function making the request, defaults to
+            :meth:`raw_request`
+        """
+        self._throttle()
+        return (send or self.raw_request)(url, extra_post_data, method)
+
     def raw_request(self, url, extra_post_data, method="GET"):
+        response, content = self.raw_response(url, extra_post_data, method)
+        started = timer()
+        charset = charset_from_headers(response)
+        decoding = timer()
+        json = self.codec.loads(content, charset)
+        self._record_phase("charset", decoding - started)
+        self._record_phase("parse", timer() - decoding)
+        if json.get("error"):
+            raise self.GithubError(json["error"][0]["error"])
+
+        return json
+
+    def raw_body(self, url, extra_post_data, method="GET"):
+        """Make a request, returning the undecoded response body
+
+        .. versionadded:: 0.7.0
+
+        :param str url: request URL
+        :param dict extra_post_data: data to send in the request body
+        :param str method: HTTP method
+        :rtype: bytes
+        """
+        return self.raw_response(url, extra_post_data, method)[1]
+
+    def stream_request(self, url, key, extra_post_data=None, method="GET"):
+        """Make a request, decoding the result one item at a time
+
+        Like other requests, this waits for the rate limiter and quota.
+
+        .. versionadded:: 0.7.0
+
+        :param str url: request URL
+        :param str key: key of the top-level object holding the items
+        :see: :meth:`stream`
+        """
+        return self._fetch(url, extra_post_data or {}, method,
+                           lambda url, extra_post_data, method:
+                               self._stream_response(url, key,
+                                                     extra_post_data, method))
+
+    def _stream_response(self, url, key, extra_post_data, method):
+        response, content = self.raw_response(url, extra_post_data, method)
+        text = content.decode(charset_from_headers(response))
+        return self._stream_items(text, key)
+
+    def _stream_items(self, text, key):
+        try:
+            for item in iter_json_items(text, key):
+                yield item
+        except KeyError:
+            # Errors are reported in place of the expected key
+            json = simplejson.loads(text)
+            if json.get("error"):
+                raise self.GithubError(json["error"][0]["error"])
+            raise
+
+    def raw_response(self, url, extra_post_data, method="GET"):
+        """Make a request, returning the undecoded response
+
+        .. versionadded:: 0.7.0
+
+        :param str url: request URL
+        :param dict extra_post_data: data to send in the request body
+        :param str method: HTTP method
+        :return: ``httplib2.Response`` and content tuple
+        :raise HttpError: for error responses
+        """
+        method = method.upper()
         scheme, netloc, path, query, fragment = urlsplit(url)
         post_data = None
         headers = self.http_headers
-        method = method.upper()
         if extra_post_data or method == "POST":
             post_data = self.encode_authentication_data(extra_post_data)
             headers["Content-Length"] = str(len(post_data))
         else:
             query = self.encode_authentication_data(parse_qs(query))
+        # Encode the request before the start event, so a failure can't
+        # leave a request without its end event.
+        self._set_context(method, url)
+        self._local.transfer = None
+        self.emit("request_start")
+        started = timer()
         url = urlunsplit((scheme, netloc, path, query, fragment))
-        response, content = self._http.request(url, method, post_data, headers)
+        try:
+            response, content = self._send(url, method, post_data, headers)
+        except Exception:
+            self._request_end(started, None, sys.exc_info()[1])
+            raise
+        self._local.links = parse_link_header(response.get("link", ""))
         if LOGGER.isEnabledFor(logging.DEBUG):
             logging.debug("URL: %r POST_DATA: %r RESPONSE_TEXT: %r", url,
                           post_data, content)
         if response.status >= 400:
-            raise HttpError("Unexpected response from github.com %d: %r"
-                            % (response.status, content), content,
-                            response.status)
-        json = simplejson.loads(content.decode(charset_from_headers(response)))
-        if json.get("error"):
-            raise self.GithubError(json["error"][0]["error"])
+            error = HttpError("Unexpected response from github.com %d: %r"
+                              % (response.status, content), content,
+                              response.status)
+            self._request_end(started, response.status, error)
+            raise error
+        self._request_end(started, response.status)
+        return response, content
 
-        return json
+    def _request_end(self, started, status, error=None):
+        """Report the end of a request to the registered :attr:`hooks`"""
+        if error is not None:
+            self.emit("error", error=error, status=status)
+        if self.hooks.active("request_end"):
+            transfer = self.last_transfer() or {"encoding": None,
+                                                "wire_bytes": None,
+                                                "decoded_bytes": None}
+            self.emit("request_end", status=status, error=error,
+                      latency=timer() - started,
+                      quota_remaining=None, **transfer)
 
     @property
     def http_headers(self):
+        if self.compression:
+            encoding = "gzip, deflate"
+        else:
+            encoding = "identity"
         return {
+            "Accept-Encoding": encoding,
             "User-Agent": "pygithub2 v1",
             "Accept": "application/json",
         }
@@ -0,0 +1,388 @@
+"""Tracing of API calls with nested spans
+
+A :class:`Tracer` records a span for every
+:class:`~github2.core.GithubCommand` call, with a child span for each HTTP
+request it makes.  Spans for higher level operations can be opened around
+calls with :meth:`Tracer.span`, so that a script's requests are grouped by the
+work they were made for::
+
+    >>> from github2.client import Github
+    >>> from github2.tracing import (InMemoryExporter, Tracer)
+    >>> exporter = InMemoryExporter()
+    >>> github = Github(tracer=Tracer(exporter))
+    >>> with github.request.tracer.span("collaborators"):
+    ...     for repo in github.repos.list("ask"):
+    ...         github.repos.list_collaborators(repo.project)
+
+Finished spans are passed to a :class:`SpanExporter`, no external collector is
+needed.  Spans are built from the events reported by
+:class:`~github2.request.Hooks`.
+
+.. versionadded:: 0.7.0
+"""
+
+import logging
+import random
+import sys
+import threading
+import time
+
+from contextlib import contextmanager
+
+
+#: Logger for tracing module
+LOGGER = logging.getLogger('github2.tracing')
+
+
+class Span(object):
+    """Timed operation within a trace
+
+    Identifiers are random hexadecimal strings, 32 digits long for traces and
+    16 digits long for spans, as used by OpenTelemetry.
+    """
+
+    def __init__(self, name, trace_id, span_id, parent_id=None,
+                 kind="internal", attributes=None, start_time=None):
+        """Create a started span
+
+        :param str name: name of the operation
+        :param str trace_id: identifier of the trace the span belongs to
+        :param str span_id: identifier of the span
+        :param str parent_id: identifier of the parent span, or ``None`` for
+            the root span of a trace
+        :param str kind: ``internal`` for operations, or ``client`` for HTTP
+            requests
+        :param dict attributes: initial attributes
+        :param float start_time: UNIX time the operation started at
+        """
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = span_id
+        self.parent_id = parent_id
+        self.kind = kind
+        self.attributes = dict(attributes or {})
+        self.events = []
+        self.start_time = start_time
+        self.end_time = None
+        self.status = "unset"
+        self.error = None
+
+    def __repr__(self):
+        return "<Span: %s %s>" % (self.name, self.span_id)
+
+    def set_attribute(self, key, value):
+        """Set an attribute, replacing any previous value
+
+        :param str key: attribute name, such as ``http.status_code``
+        :param value: attribute value
+        """
+        self.attributes[key] = value
+
+    def add_event(self, name, attributes=None, timestamp=None):
+        """Record an event that happened during the span
+
+        :param str name: event name
+        :param dict attributes: event attributes
+        :param float timestamp: UNIX time of the event
+        """
+        self.events.append({"name": name, "attributes": attributes or {},
+                            "timestamp": timestamp})
+
+    def end(self, end_time, error=None):
+        """Mark the span finished
+
+        :param float end_time: UNIX time the operation finished at
+        :param Exception error: exception the operation failed with, if any
+        """
+        self.end_time = end_time
+        if error is None:
+            self.status = "ok"
+        else:
+            self.status = "error"
+            self.error = error
+
+    @property
+    def duration(self):
+        """Duration in seconds, or ``None`` while the span is in progress"""
+        if self.end_time is None:
+            return None
+        return self.end_time - self.start_time
+
+    def to_dict(self):
+        """Describe the span, for serialisation
+
+        :rtype: dict
+        """
+        error = None
+        if self.error is not None:
+            error = repr(self.error)
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "kind": self.kind,
+            "attributes": dict(self.attributes),
+            "events": list(self.events),
+            "start_time": self.start_time,
+            "end_time": self.end_time,
+            "status": self.status,
+            "error": error,
+        }
+
+
+class SpanExporter(object):
+    """Interface for receiving finished spans
+
+    Subclasses implement :meth:`export`, which is called as each span ends,
+    from the thread that ended it.
+    """
+
+    def export(self, spans):
+        """Receive finished spans
+
+        :param list spans: :class:`Span` objects
+        """
+        raise NotImplementedError
+
+    def shutdown(self):
+        """Release any resources held by the exporter"""
+
+
+class InMemoryExporter(SpanExporter):
+    """Exporter keeping finished spans in a list, for tests and scripts"""
+
+    def __init__(self):
+        self._spans = []
+        self._lock = threading.Lock()
+
+    def export(self, spans):
+        self._lock.acquire()
+        try:
+            self._spans.extend(spans)
+        finally:
+            self._lock.release()
+
+    def get_finished_spans(self):
+        """Spans exported so far, in the order they finished
+
+        :rtype: list
+        """
+        self._lock.acquire()
+        try:
+            return list(self._spans)
+        finally:
+            self._lock.release()
+
+    def clear(self):
+        """Discard exported spans"""
+        self._lock.acquire()
+        try:
+            self._spans = []
+        finally:
+            self._lock.release()
+
+
+class Tracer(object):
+    """Create spans for API calls and the HTTP requests they make
+
+    Each thread has its own stack of open spans, and new spans are children of
+    the current thread's innermost open span.  :meth:`wrap` carries the
+    current span over to calls made in other threads.
+
+    Cache lookups are recorded as ``cache.response`` and ``cache.object``
+    attributes, of ``hit`` or ``miss``, on the span that made them.  Retries
+    are recorded as ``retry`` events on HTTP request spans, along with a
+    ``http.retries`` count, and waits for rate limits as ``throttle_wait``
+    events.
+    """
+
+    def __init__(self, exporter=None, clock=time.time, random=random):
+        """Create a new tracer
+
+        :param SpanExporter exporter: exporter for finished spans, defaults
+            to a new :class:`InMemoryExporter`
+        :param func clock: function returning the current UNIX time
+        :param random.Random random: source of span identifiers
+        """
+        if exporter is None:
+            exporter = InMemoryExporter()
+        self.exporter = exporter
+        self.clock = clock
+        self.random = random
+        self._local = threading.local()
+
+    def _stack(self):
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def current_span(self):
+        """Innermost open span of the current thread, or ``None``"""
+        stack = self._stack()
+        if stack:
+            return stack[-1]
+        return None
+
+    def start_span(self, name, kind="internal", attributes=None):
+        """Open a span as a child of the current span
+
+        :param str name: name of the operation
+        :param str kind: ``internal`` or ``client``
+        :param dict attributes: initial attributes
+        :rtype: Span
+        """
+        parent = self.current_span()
+        if parent is None:
+            trace_id = "%032x" % self.random.getrandbits(128)
+            parent_id = None
+        else:
+            trace_id = parent.trace_id
+            parent_id = parent.span_id
+        span = Span(name, trace_id, "%016x" % self.random.getrandbits(64),
+                    parent_id, kind, attributes, self.clock())
+        self._stack().append(span)
+        return span
+
+    def end_span(self, span, error=None):
+        """Close a span, and any spans left open within it, and export it
+
+        :param Span span: span to close
+        :param Exception error: exception the operation failed with, if any
+        """
+        stack = self._stack()
+        now = self.clock()
+        ended = []
+        while span in stack:
+            inner = stack.pop()
+            if inner is not span:
+                LOGGER.warning("Closing unfinished span %r", inner)
+            inner.end(now, error)
+            ended.append(inner)
+        if not ended:
+            span.end(now, error)
+            ended.append(span)
+        try:
+            self.exporter.export(ended)
+        except Exception:
+            LOGGER.exception("Error exporting spans with %r", self.exporter)
+
+    @contextmanager
+    def span(self, name, **attributes):
+        """Context manager opening a span for a block of code
+
+        Exceptions raised in the block are recorded on the span.
+
+        :param str name: name of the operation
+        :param attributes: initial attributes
+        """
+        span = self.start_span(name, attributes=attributes)
+        try:
+            yield span
+        except Exception:
+            self.end_span(span, sys.exc_info()[1])
+            raise
+        self.end_span(span)
+
+    def wrap(self, func):
+        """Make ``func`` open its spans under the current span
+
+        Spans are otherwise only nested within a single thread, so this is
+        needed for calls made by worker threads, as in
+        :meth:`~github2.client.Github.batch`.
+
+        :param func func: function to wrap
+        """
+        parent = self.current_span()
+        if parent is None:
+            return func
+
+        def wrapper(*args, **kwargs):
+            stack = self._stack()
+            stack.append(parent)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                stack.remove(parent)
+        wrapper.__name__ = getattr(func, "__name__", "wrapper")
+        return wrapper
+
+    def instrument(self, hooks):
+        """Create spans from the events reported to ``hooks``
+
+        :param github2.request.Hooks hooks: hooks of the request to trace
+        """
+        hooks.register("call_start", self._call_start)
+        hooks.register("call_end", self._call_end)
+        hooks.register("request_start", self._request_start)
+        hooks.register("request_end", self._request_end)
+        hooks.register("retry", self._retry)
+        hooks.register("cache_hit", self._cache)
+        hooks.register("cache_miss", self._cache)
+        hooks.register("throttle_wait", self._throttle_wait)
+
+    def _open(self, kind, span):
+        """Remember a span opened for an event, until its end event"""
+        spans = getattr(self._local, kind, None)
+        if spans is None:
+            spans = []
+            setattr(self._local, kind, spans)
+        spans.append(span)
+
+    def _close(self, kind, error):
+        spans = getattr(self._local, kind, None)
+        if spans:
+            self.end_span(spans.pop(), error)
+
+    def _call_start(self, event):
+        self._open("calls", self.start_span(event["name"], attributes={
+            "github.domain": event["domain"],
+            "github.command": event["command"],
+        }))
+
+    def _call_end(self, event):
+        self._close("calls", event["error"])
+
+    def _request_start(self, event):
+        self._open("requests", self.start_span(
+            "HTTP %s" % event["method"], "client", {
+                "http.method": event["method"],
+                "http.url": event["url"],
+                "github.endpoint": event["endpoint"],
+            }))
+
+    def _request_end(self, event):
+        span = self.current_span()
+        if span is not None and span.kind == "client":
+            span.set_attribute("http.status_code", event["status"])
+            span.set_attribute("http.response_content_length",
+                               event["wire_bytes"])
+            span.set_attribute("http.decoded_content_length",
+                               event["decoded_bytes"])
+            if event.get("quota_remaining") is not None:
+                span.set_attribute("github.quota_remaining",
+                                   event["quota_remaining"])
+        self._close("requests", event["error"])
+
+    def _retry(self, event):
+        span = self.current_span()
+        if span is not None:
+            span.set_attribute("http.retries", event["attempt"])
+            span.add_event("retry", {"attempt": event["attempt"],
+                                     "delay": event["delay"],
+                                     "reason": event["reason"]},
+                           self.clock())
+
+    def _cache(self, event):
+        span = self.current_span()
+        if span is not None:
+            span.set_attribute("cache.%s" % event["cache"],
+                               event["event"][len("cache_"):])
+
+    def _throttle_wait(self, event):
+        span = self.current_span()
+        if span is not None:
+            span.add_event("throttle_wait", {"seconds": event["seconds"],
+                                             "limiter": event["limiter"]},
+                           self.clock())
@@ -0,0 +1,208 @@
+"""asyncio interface to the GitHub API
+
+This isn't an asyncio HTTP transport, but a thread pool around the blocking
+request layer.  Each API call still blocks a worker thread for the whole of
+its request, and only the event loop is kept free.  At most
+``max_concurrency`` requests are in flight, with the client's connection pool
+sized to match, and further calls wait for a free thread.  Results are built
+by the same :class:`~github3.core.GithubCommand` methods as the synchronous
+client, so they are identical.
+
+.. note::
+   This module requires Python 3.7, or newer, and isn't imported by default.
+
+.. versionadded:: 0.7.0
+"""
+
+import asyncio
+import functools
+
+from concurrent.futures import ThreadPoolExecutor
+
+from github3.client import Github
+from github3.columns import ColumnSet
+
+
+#: Marker for an exhausted iterator, as ``StopIteration`` can't cross futures
+_DONE = object()
+
+
+class AsyncIterator(object):
+    """Asynchronous iterator over an ``iter_*`` or ``stream_*`` call
+
+    The call, and each step of its iterator, runs in a worker thread, so
+    pages and streamed responses are fetched without blocking the event
+    loop::
+
+        >>> async for commit in github.commits.iter_list(project):
+        ...     print(commit.id)
+
+    Awaiting the call instead returns every value in a list, or the result
+    as is when ``raw`` asks for bytes or columns.
+    """
+
+    def __init__(self, client, func, args, kwargs):
+        """Create an asynchronous iterator for a call
+
+        :param AsyncGithub client: client to run the call with
+        :param func func: blocking call returning an iterable
+        :param tuple args: positional arguments for ``func``
+        :param dict kwargs: keyword arguments for ``func``
+        """
+        self.client = client
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self._iterator = None
+
+    def _call(self):
+        return self.func(*self.args, **self.kwargs)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self._iterator is None:
+            result = await self.client.run(self._call)
+            if isinstance(result, (bytes, ColumnSet)):
+                raise TypeError("%s results can't be iterated, await the "
+                                "call instead" % type(result).__name__)
+            self._iterator = await self.client.run(iter, result)
+        value = await self.client.run(next, self._iterator, _DONE)
+        if value is _DONE:
+            raise StopAsyncIteration
+        return value
+
+    def __await__(self):
+        return self.client.run(self._collect).__await__()
+
+    def _collect(self):
+        result = self._call()
+        if isinstance(result, (bytes, ColumnSet)):
+            return result
+        return list(result)
+
+
+class AsyncCommand(object):
+    """Awaitable proxy for a :class:`~github3.core.GithubCommand`
+
+    Every public method of the wrapped command is available as a coroutine
+    function with the same signature.  ``iter_*`` and ``stream_*`` methods
+    return an :class:`AsyncIterator` instead.
+    """
+
+    def __init__(self, command, client):
+        """Create an awaitable command proxy
+
+        :param github3.core.GithubCommand command: command to wrap
+        :param AsyncGithub client: client to run calls with
+        """
+        self.command = command
+        self.client = client
+
+    def __getattr__(self, name):
+        attr = getattr(self.command, name)
+        if name.startswith("_") or not callable(attr):
+            return attr
+        elif name.startswith(("iter_", "stream_")):
+            return self.client.wrap_iterator(attr)
+        return self.client.wrap(attr)
+
+    def __repr__(self):
+        return "<AsyncCommand: %r>" % self.command
+
+
+class AsyncGithub(object):
+    """asyncio counterpart to :class:`github3.client.Github`
+
+    ``issues``, ``users``, ``repos``, ``commits``, ``organizations``, ``teams``
+    and ``pull_requests`` provide awaitable versions of the synchronous
+    client's commands::
+
+        >>> async with AsyncGithub(max_concurrency=50) as github:
+        ...     repos = await asyncio.gather(*[github.repos.show(p)
+        ...                                    for p in projects])
+
+    Leaving the ``async with`` block waits for calls still in flight, see
+    :meth:`aclose`.
+    """
+    #: Command attributes proxied from :class:`~github3.client.Github`
+    commands = ("issues", "users", "repos", "commits", "organizations",
+                "teams", "pull_requests")
+    #: Client level calls proxied from :class:`~github3.client.Github`
+    client_calls = ("get_all_blobs", "get_blob_info", "get_tree",
+                    "get_network_meta", "get_network_data")
+
+    def __init__(self, max_concurrency=10, **kwargs):
+        """Create an asyncio client
+
+        :param int max_concurrency: maximum number of requests in flight
+        :param kwargs: arguments for :class:`~github3.client.Github`, where
+            ``pool_size`` defaults to ``max_concurrency``
+        """
+        kwargs.setdefault("pool_size", max_concurrency)
+        self.client = Github(**kwargs)
+        self.request = self.client.request
+        self._executor = ThreadPoolExecutor(max_concurrency)
+        for name in self.commands:
+            setattr(self, name, AsyncCommand(getattr(self.client, name), self))
+        for name in self.client_calls:
+            setattr(self, name, self.wrap(getattr(self.client, name)))
+
+    def wrap(self, func):
+        """Create a coroutine function running ``func`` in a worker thread
+
+        :param func func: blocking function to wrap
+        """
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            return await self.run(func, *args, **kwargs)
+        return wrapper
+
+    def wrap_iterator(self, func):
+        """Create a function returning an :class:`AsyncIterator` for ``func``
+
+        :param func func: blocking function returning an iterable
+        """
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            return AsyncIterator(self, func, args, kwargs)
+        return wrapper
+
+    async def run(self, func, *args, **kwargs):
+        """Run ``func`` in a worker thread
+
+        :param func func: blocking function to run
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(func, *args, **kwargs))
+
+    def project_for_user_repo(self, user, repo):
+        """Return Github identifier for a user's repository
+
+        :see: :meth:`github3.client.Github.project_for_user_repo`
+        """
+        return self.client.project_for_user_repo(user, repo)
+
+    def close(self, wait=True):
+        """Release worker threads
+
+        :param bool wait: block until in-flight calls finish, otherwise
+            they finish in the background
+        """
+        self._executor.shutdown(wait=wait)
+
+    async def aclose(self):
+        """Release worker threads, once in-flight calls finish
+
+        The event loop isn't blocked while waiting for the calls.
+        """
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.close)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
@@ -0,0 +1,323 @@
+"""Response caches for :class:`github3.request.GithubRequest`
+
+Caches store decoded API responses, so a hit avoids both the network request
+and the JSON parsing of the response body.  Entries expire after a time to
+live, see the ``cache_ttls`` parameter of :class:`github3.client.Github`.
+
+.. versionadded:: 0.7.0
+"""
+
+import json
+import logging
+import os
+import sys
+import tempfile
+import threading
+import time
+
+from collections import OrderedDict
+from hashlib import md5
+
+
+#: Logger for cache module
+LOGGER = logging.getLogger('github3.cache')
+
+
+class BaseCache(object):
+    """Interface for response caches
+
+    Subclasses implement :meth:`lookup`, :meth:`store`, :meth:`delete` and
+    :meth:`clear`, and update the counters in :meth:`stats` using
+    :meth:`_count`.
+    """
+    #: Whether values are serialised when stored, so that only decoded
+    #: responses can be cached, and not objects
+    serializes = False
+
+    def __init__(self, clock=time.time):
+        """Create a new cache
+
+        :param func clock: function returning the current UNIX time
+        """
+        self.clock = clock
+        self._counters = {"hits": 0, "misses": 0, "sets": 0, "evictions": 0}
+        self._counter_lock = threading.Lock()
+
+    def _count(self, name, value=1):
+        self._counter_lock.acquire()
+        try:
+            self._counters[name] += value
+        finally:
+            self._counter_lock.release()
+
+    def lookup(self, key):
+        """Fetch an unexpired entry
+
+        :param str key: cache key
+        :return: ``(value, expires)`` tuple, or ``None`` on a miss
+        """
+        raise NotImplementedError
+
+    def store(self, key, value, expires):
+        """Store an entry
+
+        :param str key: cache key
+        :param value: decoded response to store
+        :param float expires: UNIX time the entry expires at
+        """
+        raise NotImplementedError
+
+    def delete(self, key):
+        """Remove an entry, if it exists
+
+        :param str key: cache key
+        """
+        raise NotImplementedError
+
+    def clear(self):
+        """Remove all entries"""
+        raise NotImplementedError
+
+    def get(self, key):
+        """Fetch a value
+
+        :param str key: cache key
+        :return: cached value, or ``None`` on a miss
+        """
+        entry = self.lookup(key)
+        if entry is None:
+            return None
+        return entry[0]
+
+    def set(self, key, value, ttl):
+        """Store a value
+
+        :param str key: cache key
+        :param value: decoded response to store
+        :param float ttl: time to live in seconds
+        """
+        self.store(key, value, self.clock() + ttl)
+
+    def stats(self):
+        """Cache counters
+
+        :rtype: dict
+        :return: ``hits``, ``misses``, ``sets`` and ``evictions`` counters
+        """
+        self._counter_lock.acquire()
+        try:
+            return dict(self._counters)
+        finally:
+            self._counter_lock.release()
+
+
+class MemoryCache(BaseCache):
+    """Bounded in-memory cache with least recently used eviction
+
+    .. warning::
+       Cached values are returned as is, so they must not be modified by
+       callers.
+    """
+
+    def __init__(self, max_entries=1000, clock=time.time):
+        """Create a new in-memory cache
+
+        :param int max_entries: maximum number of entries to store
+        :param func clock: function returning the current UNIX time
+        """
+        super(MemoryCache, self).__init__(clock)
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1, not %r"
+                             % max_entries)
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def lookup(self, key):
+        self._lock.acquire()
+        try:
+            entry = self._entries.pop(key, None)
+            if entry is not None and entry[1] <= self.clock():
+                self._count("evictions")
+                entry = None
+            if entry is None:
+                self._count("misses")
+                return None
+            # Reinsert to mark as most recently used
+            self._entries[key] = entry
+        finally:
+            self._lock.release()
+        self._count("hits")
+        return entry
+
+    def store(self, key, value, expires):
+        self._lock.acquire()
+        try:
+            self._entries.pop(key, None)
+            self._entries[key] = (value, expires)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._count("evictions")
+        finally:
+            self._lock.release()
+        self._count("sets")
+
+    def delete(self, key):
+        self._lock.acquire()
+        try:
+            self._entries.pop(key, None)
+        finally:
+            self._lock.release()
+
+    def clear(self):
+        self._lock.acquire()
+        try:
+            self._entries.clear()
+        finally:
+            self._lock.release()
+
+
+class DiskCache(BaseCache):
+    """Cache storing entries as JSON files in a directory
+
+    Entries are written atomically, so a directory may be shared between
+    threads and processes.  Values are stored as JSON, so this can't be used
+    as an ``object_cache``.
+    """
+    serializes = True
+
+    def __init__(self, directory, clock=time.time):
+        """Create a new disk cache
+
+        :param str directory: directory to store entries in, created if
+            necessary
+        :param func clock: function returning the current UNIX time
+        """
+        super(DiskCache, self).__init__(clock)
+        self.directory = directory
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+
+    def _path(self, key):
+        digest = md5(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, digest + ".json")
+
+    def lookup(self, key):
+        path = self._path(key)
+        try:
+            cache_file = open(path, "rb")
+            try:
+                data = json.loads(cache_file.read().decode("utf-8"))
+            finally:
+                cache_file.close()
+        except (IOError, OSError, ValueError):
+            self._count("misses")
+            return None
+        if data.get("key") != key:
+            # Digest collision, or a file we didn't write
+            self._count("misses")
+            return None
+        if data["expires"] <= self.clock():
+            self.delete(key)
+            self._count("evictions")
+            self._count("misses")
+            return None
+        self._count("hits")
+        return data["value"], data["expires"]
+
+    def store(self, key, value, expires):
+        data = json.dumps({"key": key, "expires": expires,
+                                 "value": value})
+        try:
+            handle, temp_path = tempfile.mkstemp(".tmp", dir=self.directory)
+            try:
+                os.write(handle, data.encode("utf-8"))
+            finally:
+                os.close(handle)
+            os.rename(temp_path, self._path(key))
+        except (IOError, OSError):
+            LOGGER.warning("Unable to write cache entry in %r: %s",
+                           self.directory, sys.exc_info()[1])
+            return
+        self._count("sets")
+
+    def delete(self, key):
+        try:
+            os.remove(self._path(key))
+        except OSError:
+            pass
+
+    def clear(self):
+        for name in os.listdir(self.directory):
+            if name.endswith(".json"):
+                try:
+                    os.remove(os.path.join(self.directory, name))
+                except OSError:
+                    pass
+
+
+class TieredCache(BaseCache):
+    """Cache consulting several tiers in order, fastest first
+
+    Hits in a slower tier are promoted to the faster tiers before them, and
+    new entries are stored in every tier.  For example, an in-memory tier in
+    front of a disk tier::
+
+        >>> cache = TieredCache([MemoryCache(500), DiskCache("cache_dir")])
+    """
+
+    def __init__(self, tiers, clock=time.time):
+        """Create a new tiered cache
+
+        :param list tiers: :class:`BaseCache` instances, fastest first
+        :param func clock: function returning the current UNIX time
+        """
+        super(TieredCache, self).__init__(clock)
+        self.tiers = tiers
+        self._counters["promotions"] = 0
+
+    @property
+    def serializes(self):
+        return any([tier.serializes for tier in self.tiers])
+
+    def lookup(self, key):
+        for index, tier in enumerate(self.tiers):
+            entry = tier.lookup(key)
+            if entry is not None:
+                for faster in self.tiers[:index]:
+                    faster.store(key, entry[0], entry[1])
+                    self._count("promotions")
+                self._count("hits")
+                return entry
+        self._count("misses")
+        return None
+
+    def store(self, key, value, expires):
+        for tier in self.tiers:
+            tier.store(key, value, expires)
+        self._count("sets")
+
+    def delete(self, key):
+        for tier in self.tiers:
+            tier.delete(key)
+
+    def clear(self):
+        for tier in self.tiers:
+            tier.clear()
+
+    def stats(self):
+        """Cache counters
+
+        :rtype: dict
+        :return: ``hits``, ``misses``, ``sets``, ``evictions`` and
+            ``promotions`` counters, along with a ``tiers`` list of the
+            counters for each tier
+        """
+        stats = super(TieredCache, self).stats()
+        stats["evictions"] = sum([tier.stats()["evictions"]
+                                  for tier in self.tiers])
+        stats["tiers"] = [tier.stats() for tier in self.tiers]
+        return stats
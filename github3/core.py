@@ -1,9 +1,26 @@
+import copy
+import functools
 import logging
+import re
 import sys
+import threading
+import types
 
 from datetime import datetime
 from dateutil import (parser, tz)
-
+try:
+    # For Python 3
+    from urllib.parse import (parse_qs, urlsplit)
+except ImportError:
+    from urlparse import urlsplit
+    try:
+        from urlparse import parse_qs
+    except ImportError:
+        from cgi import parse_qs
+
+from github3.columns import ColumnSet
+from github3.profiler import timer
+from github3.request import (MAX_PER_PAGE, HttpError, copy_json)
 
 #: Logger for core module
 LOGGER = logging.getLogger('github3.core')
@@ -21,19 +38,89 @@ COMMIT_DATE_FORMAT = "%Y-%m-%dT%H:%M:%S"
 #: GitHub timezone used in API output
 GITHUB_TZ = tz.gettz("America/Los_Angeles")
 
+#: Number of pages fetched ahead of the consumer by paginating iterators
+DEFAULT_PREFETCH = 2
+
+#: Values accepted for the ``raw`` argument of API calls
+RAW_MODES = (False, True, "dict", "bytes", "columns")
+
 #: Operate on naive :class:`datetime.datetime` objects, this is the default
 #: for backwards compatibility
 NAIVE = True
 
+#: Patterns matching the date formats used in API output, by
+#: :class:`DateAttribute` format
+DATE_PATTERNS = {
+    "github": re.compile(r"(\d{4})/(\d\d)/(\d\d) (\d\d):(\d\d):(\d\d) "
+                         r"([+-])(\d\d)(\d\d)$"),
+    "commit": re.compile(r"(\d{4})-(\d\d)-(\d\d)T(\d\d):(\d\d):(\d\d)"
+                         r"([+-])(\d\d):(\d\d)$"),
+    "iso": re.compile(r"(\d{4})-(\d\d)-(\d\d)T(\d\d):(\d\d):(\d\d)Z$"),
+}
+DATE_PATTERNS["user"] = DATE_PATTERNS["github"]
+
+#: Number of parsed dates remembered by :func:`string_to_datetime`
+DATE_MEMO_SIZE = 4096
+
+_DATE_MEMO = {}
+_UTC = tz.tzutc()
+_OFFSETS = {}
+
+
+def _fixed_offset(sign, hours, minutes):
+    """Shared timezone for a UTC offset"""
+    seconds = int(hours) * 3600 + int(minutes) * 60
+    if sign == "-":
+        seconds = -seconds
+    if not seconds:
+        return _UTC
+    offset = _OFFSETS.get(seconds)
+    if offset is None:
+        offset = _OFFSETS[seconds] = tz.tzoffset(None, seconds)
+    return offset
+
+
+def _parse_date(string, format):
+    """Parse a date with the pattern for its format, or any other pattern"""
+    patterns = [DATE_PATTERNS.get(format)] + list(DATE_PATTERNS.values())
+    for pattern in patterns:
+        match = pattern and pattern.match(string)
+        if match:
+            break
+    else:
+        parsed = parser.parse(string)
+        if NAIVE:
+            parsed = parsed.replace(tzinfo=None)
+        return parsed
+    groups = match.groups()
+    if NAIVE:
+        tzinfo = None
+    elif len(groups) == 6:
+        tzinfo = _UTC
+    else:
+        tzinfo = _fixed_offset(*groups[6:])
+    return datetime(tzinfo=tzinfo, *[int(group) for group in groups[:6]])
 
-def string_to_datetime(string):
+
+def string_to_datetime(string, format=None):
     """Convert a string to Python datetime
 
-    :param str github_date: date string to parse
+    Dates in the formats listed in :data:`DATE_PATTERNS` are parsed directly,
+    trying ``format`` first, and anything else is left to
+    :func:`dateutil.parser.parse`.  The most recent results are remembered,
+    as listings repeat dates often.
+
+    :param str string: date string to parse
+    :param str format: expected format of the date, as in
+        :attr:`DateAttribute.format`
     """
-    parsed = parser.parse(string)
-    if NAIVE:
-        parsed = parsed.replace(tzinfo=None)
+    key = (string, NAIVE)
+    parsed = _DATE_MEMO.get(key)
+    if parsed is None:
+        parsed = _parse_date(string, format)
+        if len(_DATE_MEMO) >= DATE_MEMO_SIZE:
+            _DATE_MEMO.clear()
+        _DATE_MEMO[key] = parsed
     return parsed
 
 
@@ -134,61 +221,527 @@ def enhanced_by_auth(f):
     return f
 
 
-class GithubCommand(object):
+class PageIterator(object):
+    """Iterate over the values of every page of a paged listing
+
+    Pages are fetched with :meth:`GithubCommand.get_values`.  If the
+    request has a connection pool, up to ``prefetch`` pages are fetched in
+    background threads ahead of the page being consumed.  The limit bounds
+    the memory used while a consumer is slower than the network.
+
+    The final page is taken from the ``last`` and ``next`` links of
+    ``Link`` response headers, where available, and prefetching starts once
+    the first page has been received.  Without links iteration stops at an
+    empty page, a page that is shorter than the first page or than
+    ``per_page``, or a ``404`` or ``422`` response for a page after the first.
+
+    .. versionadded:: 0.7.0
+    """
+
+    def __init__(self, command, args, kwargs, prefetch=DEFAULT_PREFETCH):
+        """Create a paginating iterator
+
+        :param GithubCommand command: command to fetch pages with
+        :param tuple args: positional arguments for ``get_values``
+        :param dict kwargs: keyword arguments for ``get_values``
+        :param int prefetch: maximum number of pages to fetch ahead
+        """
+        self.command = command
+        self.args = args
+        self.kwargs = kwargs
+        if getattr(command.request, "pool", None) is None:
+            # A single httplib2.Http object can't be shared between threads
+            prefetch = 0
+        self.prefetch = prefetch
+        self.per_page = kwargs.get("per_page") \
+            or getattr(command.request, "per_page", None)
+        self.last_page = None
+        self._next_fetch = 1
+        self._first_size = None
+        self._first_received = False
+        self._results = {}
+        self._cond = threading.Condition()
+
+    def _fetch(self, page):
+        links = {}
+        # Cached pages don't reach make_request, which resets the links
+        self.command.request.reset_links()
+        try:
+            values = self.command.get_values(*self.args, **dict(self.kwargs,
+                                                                page=page))
+            links = self.command.request.links()
+            result = (values, None)
+        except Exception:
+            result = (None, sys.exc_info()[1])
+        self._cond.acquire()
+        try:
+            self._results[page] = result
+            self._first_received = True
+            if "last" in links:
+                last = parse_qs(urlsplit(links["last"])[3]).get("page")
+                if last:
+                    self.last_page = int(last[0])
+            elif links and "next" not in links:
+                self.last_page = page
+            self._cond.notify_all()
+        finally:
+            self._cond.release()
+
+    def _schedule(self, page):
+        """Start fetches for ``page`` and the pages to prefetch after it"""
+        prefetch = self.prefetch
+        if not self._first_received:
+            # Wait for the first page's links, before fetching speculatively
+            prefetch = 0
+        while self._next_fetch <= page + prefetch:
+            if self.last_page is not None \
+                    and self._next_fetch > self.last_page:
+                break
+            if self.prefetch:
+                thread = threading.Thread(target=self._fetch,
+                                          args=(self._next_fetch, ))
+                thread.daemon = True
+                thread.start()
+            else:
+                self._fetch(self._next_fetch)
+            self._next_fetch += 1
+
+    def _result(self, page):
+        self._cond.acquire()
+        try:
+            self._schedule(page)
+            while page not in self._results:
+                self._cond.wait()
+            self._schedule(page)
+            return self._results.pop(page)
+        finally:
+            self._cond.release()
+
+    def __iter__(self):
+        page = 1
+        while True:
+            values, error = self._result(page)
+            if error is not None:
+                # Listings without links may end with an error page
+                if page > 1 and isinstance(error, HttpError) \
+                        and error.code in (404, 422):
+                    return
+                raise error
+            for value in values:
+                yield value
+            if self.last_page is not None:
+                if page >= self.last_page:
+                    return
+            elif not values:
+                return
+            elif self.per_page and len(values) < self.per_page:
+                return
+            elif self._first_size is None:
+                self._first_size = len(values)
+            elif len(values) < self._first_size:
+                return
+            page += 1
+
+
+def _named_call(name, func):
+    """Wrap a command method, so that the calls it makes are named after it"""
+    def wrapper(self, *args, **kwargs):
+        local = self.request._local
+        outer = getattr(local, "call", None)
+        local.call = (self, name)
+        try:
+            return func(self, *args, **kwargs)
+        finally:
+            local.call = outer
+    return functools.wraps(func)(wrapper)
+
+
+class GithubCommandType(type):
+    """Metaclass naming the calls made by public command methods
+
+    While a public method of a command runs, its name is recorded in the
+    request's thread local state, for :meth:`GithubCommand._call_name`.
+
+    .. versionadded:: 0.7.0
+    """
+
+    def __new__(cls, name, bases, attrs):
+        # Only commands built on GithubCommand, not its own helper methods
+        if any([hasattr(base, "_instrumented") for base in bases]):
+            for attr_name, attr_value in list(attrs.items()):
+                if isinstance(attr_value, types.FunctionType) \
+                        and not attr_name.startswith("_"):
+                    attrs[attr_name] = _named_call(attr_name, attr_value)
+        return super(GithubCommandType, cls).__new__(cls, name, bases, attrs)
+
+
+class GithubCommand(GithubCommandType("GithubCommand", (object, ), {})):
 
     def __init__(self, request):
         self.request = request
 
     def make_request(self, command, *args, **kwargs):
+        # Identify the call in events reported by the request
+        local = self.request._local
+        local.command = (kwargs.get("domain") or self.domain, command)
+        try:
+            return self._make_request(command, *args, **kwargs)
+        finally:
+            local.command = None
+
+    def _make_request(self, command, *args, **kwargs):
         filter = kwargs.get("filter")
+        stream = kwargs.pop("stream", False)
+        body = kwargs.pop("body", False)
         post_data = kwargs.get("post_data") or {}
+        # Query parameters are sent in the URL for reads, so that they remain
+        # cacheable GET requests
+        params = {}
         page = kwargs.pop("page", 1)
         if page and not page == 1:
-            post_data["page"] = page
+            params["page"] = page
         method = kwargs.get("method", "GET").upper()
+        per_page = kwargs.pop("per_page", None)
+        if per_page and method == "GET" and not post_data:
+            params["per_page"] = per_page
+        if method != "GET" or post_data:
+            post_data = dict(post_data, **params)
+        # Commands spanning several API namespaces may override the domain
+        # per call, as mutating ``self.domain`` isn't safe across threads
+        domain = kwargs.get("domain") or self.domain
+        if body:
+            if method == "GET" and post_data:
+                method = "POST"
+            path = "/".join([component for component
+                             in (domain, command) + args if component])
+            return self.request.make_request(path, post_data or params,
+                                             method, body=True)
         if method == "POST" or method == "GET" and post_data:
-            response = self.request.post(self.domain, command, *args,
-                                         **post_data)
+            response = self.request.post(domain, command, *args, **post_data)
         elif method == "PUT":
-            response = self.request.put(self.domain, command, *args,
-                                        **post_data)
+            response = self.request.put(domain, command, *args, **post_data)
         elif method == "DELETE":
-            response = self.request.delete(self.domain, command, *args,
+            response = self.request.delete(domain, command, *args,
                                            **post_data)
+        elif stream:
+            return self.request.stream(filter, domain, command, *args,
+                                       **params)
         else:
-            response = self.request.get(self.domain, command, *args)
+            response = self.request.get(domain, command, *args, **params)
         if filter:
-            return response[filter]
+            response = response[filter]
+        if stream:
+            return iter(response)
         return response
 
+    def _datatype(self, datatype):
+        """Data type to build results with, compact if the request asks"""
+        if datatype is not None \
+                and getattr(self.request, "compact_objects", False):
+            return datatype.compact()
+        return datatype
+
+    def _raw_mode(self, kwargs):
+        """Pop the ``raw`` argument of a call, defaulting to the request's"""
+        raw = kwargs.pop("raw", None)
+        if raw is None:
+            raw = getattr(self.request, "raw_results", False)
+        if raw not in RAW_MODES:
+            raise ValueError("Unknown raw result mode %r" % (raw, ))
+        return raw
+
+    def _columns(self, datatype, values):
+        """Build a :class:`~github3.columns.ColumnSet` from decoded values"""
+        started = timer()
+        columns = ColumnSet(datatype, values)
+        self._record_phase("construct", started)
+        return columns
+
+    def _per_page(self, kwargs):
+        """Apply the client's ``per_page`` to calls of paged listings
+
+        Paged listings always pass ``per_page``, so other calls are left
+        alone.
+
+        :raise ValueError: if ``per_page`` is above :data:`MAX_PER_PAGE`
+        """
+        if "per_page" not in kwargs:
+            return
+        per_page = kwargs.pop("per_page") or self.request.per_page
+        if per_page:
+            if per_page > MAX_PER_PAGE:
+                raise ValueError("per_page must be at most %d, not %r"
+                                 % (MAX_PER_PAGE, per_page))
+            kwargs["per_page"] = per_page
+
+    def _object_cache_key(self, name, args, kwargs, datatype):
+        """Key and time to live for caching decoded objects
+
+        :return: ``(key, ttl)`` tuple, with ``None`` values if the call
+            can't be cached
+        """
+        cache = getattr(self.request, "object_cache", None)
+        if cache is None or kwargs.get("post_data") \
+                or kwargs.get("method", "GET").upper() != "GET":
+            return None, None
+        domain = kwargs.get("domain") or self.domain
+        path = "/".join(filter(None, [domain, args and args[0] or None]))
+        ttl = self.request.cache_ttl(path)
+        if not ttl:
+            return None, None
+        key = "%s %s %s %r %r %s" % (self.request._auth_scope(), name,
+                                     domain, args,
+                                     sorted(kwargs.items()),
+                                     datatype and datatype.__name__)
+        return key, ttl
+
+    def _endpoint(self, args, kwargs):
+        """Domain and command of a call"""
+        return kwargs.get("domain") or self.domain, args and args[0] or None
+
+    def _emit_cache(self, event, args, kwargs):
+        """Report an object cache lookup to the request's hooks"""
+        domain, command = self._endpoint(args, kwargs)
+        self.request.emit(event, cache="object", method="GET", url=None,
+                          endpoint="/".join(filter(None, [domain, command])),
+                          domain=domain, command=command)
+
+    def _instrumented(self, func, args, kwargs):
+        """Call ``func``, profiling it and reporting it to the request's hooks
+
+        Calls are only instrumented if the request has a profiler, or hooks
+        for ``call_start`` events.
+        """
+        request = self.request
+        profiler = getattr(request, "profiler", None)
+        hooks = getattr(request, "hooks", None)
+        report = hooks is not None and hooks.active("call_start")
+        if profiler is None and not report:
+            return func(*args, **kwargs)
+        name = self._call_name(args, kwargs)
+        domain, command = self._endpoint(args, kwargs)
+        if report:
+            # The request's details are added by the events of its requests
+            request.emit("call_start", name=name, domain=domain,
+                         command=command, endpoint=name, method=None,
+                         url=None)
+        if profiler is not None:
+            profiler.start(name)
+        error = None
+        try:
+            return func(*args, **kwargs)
+        except Exception:
+            error = sys.exc_info()[1]
+            raise
+        finally:
+            if profiler is not None:
+                profiler.finish()
+            if report:
+                request.emit("call_end", name=name, domain=domain,
+                             command=command, endpoint=name, method=None,
+                             url=None, error=error)
+
+    def _call_name(self, args, kwargs):
+        """Name of the command method making a call, such as ``issues/list``
+
+        Calls made from outside of a public command method, for example by
+        :class:`PageIterator`, are named by their ``domain/command`` instead.
+        """
+        call = getattr(self.request._local, "call", None)
+        if call is not None and call[0] is self:
+            return "%s/%s" % (self.domain, call[1])
+        return "/".join(filter(None, self._endpoint(args, kwargs)))
+
+    def _record_phase(self, phase, started):
+        """Record time since ``started`` in the profiled call, if any"""
+        profiler = getattr(self.request, "profiler", None)
+        if profiler is not None:
+            profiler.record(phase, timer() - started)
+
     def get_value(self, *args, **kwargs):
+        """Make a call returning a single value
+
+        Takes the same arguments as :meth:`get_values`.
+        """
+        return self._instrumented(self._get_value, args, kwargs)
+
+    def _get_value(self, *args, **kwargs):
         datatype = kwargs.pop("datatype", None)
+        raw = self._raw_mode(kwargs)
+        if raw == "bytes":
+            return self.make_request(*args, **dict(kwargs, body=True))
+        elif raw == "columns":
+            value = self._get_value(*args, **dict(kwargs, raw=True))
+            return self._columns(datatype, [value])
+        elif raw:
+            datatype = None
+        datatype = self._datatype(datatype)
+        cache_key, ttl = self._object_cache_key("get_value", args, kwargs,
+                                                datatype)
+        if cache_key:
+            value = self.request.object_cache.get(cache_key)
+            if value is not None:
+                self._emit_cache("cache_hit", args, kwargs)
+                return _copy_cached(value)
+            self._emit_cache("cache_miss", args, kwargs)
         value = self.make_request(*args, **kwargs)
         if datatype:
+            started = timer()
             if not PY27:
                 # unicode keys are not accepted as kwargs by python, until 2.7:
                 # http://bugs.python.org/issue2646
                 # So we make a local dict with the same keys but as strings:
-                return datatype(**dict((str(k), v)
-                                       for (k, v) in value.items()))
+                value = datatype(**dict((str(k), v)
+                                        for (k, v) in value.items()))
             else:
-                return datatype(**value)
+                value = datatype(**value)
+            self._record_phase("construct", started)
+        if cache_key:
+            self.request.object_cache.set(cache_key, value, ttl)
+            return _copy_cached(value)
         return value
 
     def get_values(self, *args, **kwargs):
+        """Make a call returning a list of values
+
+        Positional arguments are the command and its path components.  The
+        ``filter`` key is taken from the decoded response, and its values are
+        built as ``datatype`` objects.
+
+        Pass-through users can skip building objects with ``raw``, which
+        defaults to the request's ``raw_results``.  ``True`` or ``"dict"``
+        returns the decoded values as they are, and ``"bytes"`` the
+        undecoded response body, without applying ``filter``.  Every call of
+        the commands built on this method accepts ``raw``.
+
+        Analytics users can set ``raw`` to ``"columns"``, for a
+        :class:`~github3.columns.ColumnSet` with a column for each attribute of
+        ``datatype``, and no objects per value.  Listings of names or other
+        plain values can't be stored as columns, and raise :exc:`ValueError`.
+
+        .. versionadded:: 0.7.0
+           The ``raw`` argument
+        """
+        return self._instrumented(self._get_values, args, kwargs)
+
+    def _get_values(self, *args, **kwargs):
         datatype = kwargs.pop("datatype", None)
+        self._per_page(kwargs)
+        raw = self._raw_mode(kwargs)
+        if raw == "bytes":
+            return self.make_request(*args, **dict(kwargs, body=True))
+        elif raw == "columns":
+            values = self._get_values(*args, **dict(kwargs, raw=True))
+            return self._columns(datatype, values)
+        elif raw:
+            datatype = None
+        datatype = self._datatype(datatype)
+        cache_key, ttl = self._object_cache_key("get_values", args, kwargs,
+                                                datatype)
+        if cache_key:
+            values = self.request.object_cache.get(cache_key)
+            if values is not None:
+                self._emit_cache("cache_hit", args, kwargs)
+                return [_copy_cached(value) for value in values]
+            self._emit_cache("cache_miss", args, kwargs)
         values = self.make_request(*args, **kwargs)
         if datatype:
+            started = timer()
             if not PY27:
                 # Same as above, unicode keys will blow up in **args, so we
                 # need to create a new 'values' dict with string keys
-                return [datatype(**dict((str(k), v)
-                                        for (k, v) in value.items()))
-                        for value in values]
+                values = [datatype(**dict((str(k), v)
+                                          for (k, v) in value.items()))
+                          for value in values]
             else:
-                return [datatype(**value) for value in values]
-        else:
-            return values
+                values = [datatype(**value) for value in values]
+            self._record_phase("construct", started)
+        if cache_key:
+            self.request.object_cache.set(cache_key, values, ttl)
+            return [_copy_cached(value) for value in values]
+        return values
+
+    def stream_values(self, *args, **kwargs):
+        """Iterate over the values of a listing as they are decoded
+
+        Takes the same arguments as :meth:`get_values`.  The request is made
+        immediately, but values are decoded from the response as they are
+        consumed, so the whole listing is never held in memory as objects.
+        Results are not cached.  With ``raw`` set to ``"bytes"`` the
+        response body is returned, and with ``"columns"`` the values are
+        decoded straight into columns, as by :meth:`get_values`.
+
+        .. versionadded:: 0.7.0
+
+        :see: :func:`~github3.request.iter_json_items`
+        """
+        datatype = kwargs.pop("datatype", None)
+        self._per_page(kwargs)
+        raw = self._raw_mode(kwargs)
+        if raw == "bytes":
+            return self.make_request(*args, **dict(kwargs, body=True))
+        values = self.make_request(*args, **dict(kwargs, stream=True))
+        if raw == "columns":
+            # Columns are filled as values are decoded
+            return self._columns(datatype, values)
+        elif raw:
+            datatype = None
+        datatype = self._datatype(datatype)
+        return self._stream_values(values, datatype)
+
+    def _stream_values(self, values, datatype):
+        for value in values:
+            if datatype:
+                if not PY27:
+                    # Same as above, unicode keys will blow up in **args
+                    value = datatype(**dict((str(k), v)
+                                            for (k, v) in value.items()))
+                else:
+                    value = datatype(**value)
+            yield value
+
+    def iter_values(self, *args, **kwargs):
+        """Iterate over the values of every page of a paged listing
+
+        Takes the same arguments as :meth:`get_values`, along with an optional
+        ``prefetch`` page count.  Pages can't be returned as ``raw`` bytes,
+        and with ``raw`` set to ``"columns"`` every page is fetched into a
+        single :class:`~github3.columns.ColumnSet`.
+
+        :see: :class:`PageIterator`
+        """
+        prefetch = kwargs.pop("prefetch", DEFAULT_PREFETCH)
+        raw = self._raw_mode(dict(kwargs))
+        if raw == "bytes":
+            raise ValueError("Paged listings can't be returned as bytes")
+        elif raw == "columns":
+            pages = PageIterator(self, args, dict(kwargs, raw=True), prefetch)
+            return self._columns(kwargs.get("datatype"), pages)
+        return iter(PageIterator(self, args, kwargs, prefetch))
+
+
+def _copy_cached(value):
+    """Copy a cached value, so that callers can't modify the cached one
+
+    Nested lists and dicts are copied too, both in raw values and in the
+    attributes of objects, as they would otherwise be shared.
+    """
+    if not isinstance(value, BaseData):
+        return copy_json(value)
+    copied = copy.copy(value)
+    if getattr(copied, "_compact", False):
+        # Lazy attributes only hold dates
+        for attr_name, attr in copied._meta.items():
+            if not attr.lazy:
+                setattr(copied, attr_name,
+                        copy_json(getattr(copied, attr_name)))
+        if copied._extra:
+            copied._extra = tuple([copy_json(item)
+                                   for item in copied._extra])
+    else:
+        copied.__dict__.update([(name, copy_json(item))
+                                for name, item in vars(copied).items()])
+    return copied
 
 
 def doc_generator(docstring, attributes):
@@ -208,6 +761,8 @@ def doc_generator(docstring, attributes):
 
 
 class Attribute(object):
+    #: Convert values when they're first read, rather than on creation
+    lazy = False
 
     def __init__(self, help):
         self.help = help
@@ -220,6 +775,7 @@ class Attribute(object):
 
 class DateAttribute(Attribute):
     format = "github"
+    lazy = True
     converter_for_format = {
         "github": datetime_to_ghdate,
         "commit": datetime_to_commitdate,
@@ -233,7 +789,7 @@ class DateAttribute(Attribute):
 
     def to_python(self, value):
         if value and not isinstance(value, datetime):
-            return string_to_datetime(value)
+            return string_to_datetime(value, self.format)
         return value
 
     def from_python(self, value):
@@ -242,6 +798,50 @@ class DateAttribute(Attribute):
         return value
 
 
+class LazyAttribute(object):
+    """Descriptor converting an attribute's value when it is first read
+
+    Values are stored as given, and the converted value replaces the stored
+    one on first access, so objects don't pay for conversions of attributes
+    nobody reads.  This means invalid values only raise errors when read.
+
+    .. versionadded:: 0.7.0
+    """
+
+    def __init__(self, name, attribute, slot=None):
+        """Create a descriptor for a data type attribute
+
+        :param str name: name of the attribute
+        :param Attribute attribute: attribute definition, whose
+            ``to_python`` method converts values
+        :param slot: member descriptor storing values for compact data
+            types, instead of the instance ``__dict__``
+        """
+        self.name = name
+        self.attribute = attribute
+        self.slot = slot
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        if self.slot is None:
+            value = instance.__dict__.get(self.name)
+        else:
+            value = self.slot.__get__(instance, owner)
+        if value is not None:
+            converted = self.attribute.to_python(value)
+            if converted is not value:
+                self.__set__(instance, converted)
+                value = converted
+        return value
+
+    def __set__(self, instance, value):
+        if self.slot is None:
+            instance.__dict__[self.name] = value
+        else:
+            self.slot.__set__(instance, value)
+
+
 class BaseDataType(type):
 
     def __new__(cls, name, bases, attrs):
@@ -254,6 +854,9 @@ class BaseDataType(type):
         attributes = _meta.keys()
         attrs.update(dict([(attr_name, None)
                         for attr_name in attributes]))
+        attrs.update(dict([(attr_name, LazyAttribute(attr_name, attr))
+                           for attr_name, attr in _meta.items()
+                           if attr.lazy]))
 
         def _contribute_method(name, func):
             func.__name__ = name
@@ -262,25 +865,151 @@ class BaseDataType(type):
         def constructor(self, **kwargs):
             for attr_name, attr_value in kwargs.items():
                 attr = self._meta.get(attr_name)
-                if attr:
+                if attr and not attr.lazy:
                     setattr(self, attr_name, attr.to_python(attr_value))
                 else:
                     setattr(self, attr_name, attr_value)
         _contribute_method("__init__", constructor)
 
         def iterate(self):
-            not_empty = lambda e: e[1] is not None
-            return iter(filter(not_empty, vars(self).items()))
+            # Attributes are read individually to convert any lazy values
+            items = [(attr_name, getattr(self, attr_name))
+                     for attr_name in vars(self)]
+            return iter([item for item in items if item[1] is not None])
         _contribute_method("__iter__", iterate)
 
         result_cls = super_new(cls, name, bases, attrs)
         result_cls.__doc__ = doc_generator(result_cls.__doc__, _meta)
         return result_cls
 
+    def __instancecheck__(cls, instance):
+        return cls.__subclasscheck__(type(instance))
+
+    def __subclasscheck__(cls, subclass):
+        if type.__subclasscheck__(cls, subclass):
+            return True
+        # Compact variants stand in for their data type
+        original = getattr(subclass, "__dict__", {}).get("_compact_of")
+        return original is not None and type.__subclasscheck__(cls, original)
+
+    def compact(cls):
+        """Compact variant of a data type, storing attributes in ``__slots__``
+
+        Instances of the variant have a slot for each attribute, instead of
+        a per-instance ``__dict__``, and keep any keys that aren't attributes
+        in an overflow tuple, where they remain readable as attributes.  The
+        names of overflow keys are shared between instances with the same
+        keys.
+        The variant shares the data type's methods, and its instances are
+        instances of the data type, that can be iterated over, subscripted,
+        copied and pickled as usual.
+
+        How much memory is saved depends on the interpreter.  Before CPython
+        3.11 every regular instance is allocated a dictionary, which compact
+        instances do without.  Later versions store attributes inline until
+        ``__dict__`` is needed, as it is when iterating, so the difference is
+        small.  Attribute values are the same size either way, and
+        ``tests/bench_memory.py`` compares the two.
+
+        Variants are generated once, and cached.
+
+        .. versionadded:: 0.7.0
+
+        :rtype: BaseDataType
+        """
+        if cls.__dict__.get("_compact"):
+            return cls
+        if "_compact_type" in cls.__dict__:
+            return cls.__dict__["_compact_type"]
+        fields = tuple(cls._meta)
+        layouts = {}
+        meta_items = tuple([(attr_name, attr)
+                            for attr_name, attr in cls._meta.items()
+                            if not attr.lazy])
+        lazy = tuple([attr_name for attr_name, attr in cls._meta.items()
+                      if attr.lazy])
+        # The variant can't subclass the data type, as its instances would
+        # still be allocated a __dict__
+        attrs = dict([(name, value) for name, value in cls.__dict__.items()
+                      if name not in cls._meta and name not in
+                      ("__dict__", "__weakref__", "_compact_type")])
+        attrs.update({
+            "__slots__": fields + ("_extra_keys", "_extra"),
+            "_compact": True,
+            "_compact_of": cls,
+        })
+
+        def constructor(self, **kwargs):
+            for attr_name, attr in meta_items:
+                value = kwargs.pop(attr_name, None)
+                if value is not None:
+                    value = attr.to_python(value)
+                setattr(self, attr_name, value)
+            for attr_name in lazy:
+                setattr(self, attr_name, kwargs.pop(attr_name, None))
+            set_extra(self, kwargs)
+        attrs["__init__"] = constructor
+
+        def set_extra(self, extra):
+            keys = values = None
+            if extra:
+                keys = tuple(extra)
+                keys = layouts.setdefault(keys, keys)
+                values = tuple(extra.values())
+            self._extra_keys = keys
+            self._extra = values
+
+        def getattr_(self, name):
+            # Only called when normal attribute lookup fails
+            if name not in ("_extra_keys", "_extra"):
+                keys = self._extra_keys
+                if keys and name in keys:
+                    return self._extra[keys.index(name)]
+            raise AttributeError("%r object has no attribute %r"
+                                 % (self.__class__.__name__, name))
+        attrs["__getattr__"] = getattr_
+
+        def iterate(self):
+            items = [(attr_name, getattr(self, attr_name))
+                     for attr_name in fields]
+            if self._extra_keys:
+                items.extend(zip(self._extra_keys, self._extra))
+            return iter([item for item in items if item[1] is not None])
+        attrs["__iter__"] = iterate
+
+        def reduce_ex(self, protocol):
+            return (_new_compact, (cls, ), dict(iterate(self)))
+        attrs["__reduce_ex__"] = reduce_ex
+
+        def setstate(self, state):
+            state = dict(state)
+            for attr_name in fields:
+                setattr(self, attr_name, state.pop(attr_name, None))
+            set_extra(self, state)
+        attrs["__setstate__"] = setstate
+
+        compact_cls = type.__new__(type(cls), "Compact" + cls.__name__,
+                                   cls.__bases__, attrs)
+        for attr_name in lazy:
+            setattr(compact_cls, attr_name,
+                    LazyAttribute(attr_name, cls._meta[attr_name],
+                                  compact_cls.__dict__[attr_name]))
+        cls._compact_type = compact_cls
+        return compact_cls
+
+
+def _new_compact(datatype):
+    """Create an uninitialised instance of a compact data type, for pickle"""
+    compact_cls = datatype.compact()
+    return compact_cls.__new__(compact_cls)
+
 
 # Ugly base class definition for Python 2 and 3 compatibility, where metaclass
 # syntax is incompatible
-class BaseData(BaseDataType('BaseData', (object, ), {})):
+class BaseData(BaseDataType('BaseData', (object, ), {"__slots__": ()})):
+    # Data types have a __dict__ for their attributes, unless compact
+    __slots__ = ()
+
     def __getitem__(self, key):
         """Access objects's attribute using subscript notation
 
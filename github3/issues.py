@@ -41,7 +41,7 @@ class Comment(BaseData):
 class Issues(GithubCommand):
     domain = "issues"
 
-    def search(self, project, term, state="open"):
+    def search(self, project, term, state="open", raw=None):
         """Get all issues for project that match term with given state.
 
         .. versionadded:: 0.3.0
@@ -49,84 +49,99 @@ class Issues(GithubCommand):
         :param str project: GitHub project
         :param str term: term to search issues for
         :param str state: can be either ``open`` or ``closed``.
+        :param raw: return decoded dicts, body bytes or columns instead of
+            objects, see :meth:`~github3.core.GithubCommand.get_values`
         """
         return self.get_values("search", project, state, quote_plus(term),
-                               filter="issues", datatype=Issue)
+                               filter="issues", datatype=Issue, raw=raw)
 
-    def list(self, project, state="open"):
+    def list(self, project, state="open", raw=None):
         """Get all issues for project with given state.
 
         :param str project: GitHub project
         :param str state: can be either ``open`` or ``closed``.
+        :param raw: return decoded dicts, body bytes or columns instead of
+            objects, see :meth:`~github3.core.GithubCommand.get_values`
         """
         return self.get_values("list", project, state, filter="issues",
-                               datatype=Issue)
+                               datatype=Issue, raw=raw)
 
-    def list_by_label(self, project, label):
+    def list_by_label(self, project, label, raw=None):
         """Get all issues for project with label.
 
         .. versionadded:: 0.3.0
 
         :param str project: GitHub project
         :param str label:  a string representing a label (e.g., ``bug``).
+        :param raw: return decoded dicts, body bytes or columns instead of
+            objects, see :meth:`~github3.core.GithubCommand.get_values`
         """
         return self.get_values("list", project, "label", label,
-                               filter="issues", datatype=Issue)
+                               filter="issues", datatype=Issue, raw=raw)
 
-    def list_labels(self, project):
+    def list_labels(self, project, raw=None):
         """Get all labels for project.
 
         .. versionadded:: 0.3.0
 
         :param str project: GitHub project
+        :param raw: see :meth:`~github3.core.GithubCommand.get_values`
         """
-        return self.get_values("labels", project, filter="labels")
+        return self.get_values("labels", project, filter="labels", raw=raw)
 
-    def show(self, project, number):
+    def show(self, project, number, raw=None):
         """Get all the data for issue by issue-number.
 
         :param str project: GitHub project
         :param int number: issue number in the Github database
+        :param raw: return decoded dicts, body bytes or columns instead of
+            objects, see :meth:`~github3.core.GithubCommand.get_values`
         """
         return self.get_value("show", project, str(number),
-                              filter="issue", datatype=Issue)
+                              filter="issue", datatype=Issue, raw=raw)
 
     @requires_auth
-    def open(self, project, title, body):
+    def open(self, project, title, body, raw=None):
         """Open up a new issue.
 
         :param str project: GitHub project
         :param str title: title for issue
         :param str body: body for issue
+        :param raw: return decoded dicts, body bytes or columns instead of
+            objects, see :meth:`~github3.core.GithubCommand.get_values`
         """
         issue_data = {"title": title, "body": body}
         return self.get_value("open", project, post_data=issue_data,
-                              filter="issue", datatype=Issue)
+                              filter="issue", datatype=Issue, raw=raw)
 
     @requires_auth
-    def close(self, project, number):
+    def close(self, project, number, raw=None):
         """Close an issue
 
         :param str project: GitHub project
         :param int number: issue number in the Github database
+        :param raw: return decoded dicts, body bytes or columns instead of
+            objects, see :meth:`~github3.core.GithubCommand.get_values`
         """
         return self.get_value("close", project, str(number), filter="issue",
-                              datatype=Issue, method="POST")
+                              datatype=Issue, method="POST", raw=raw)
 
     @requires_auth
-    def reopen(self, project, number):
+    def reopen(self, project, number, raw=None):
         """Reopen a closed issue
 
         .. versionadded:: 0.3.0
 
         :param str project: GitHub project
         :param int number: issue number in the Github database
+        :param raw: return decoded dicts, body bytes or columns instead of
+            objects, see :meth:`~github3.core.GithubCommand.get_values`
         """
         return self.get_value("reopen", project, str(number), filter="issue",
-                              datatype=Issue, method="POST")
+                              datatype=Issue, method="POST", raw=raw)
 
     @requires_auth
-    def edit(self, project, number, title, body):
+    def edit(self, project, number, title, body, raw=None):
         """Edit an existing issue
 
         .. versionadded:: 0.3.0
@@ -135,52 +150,60 @@ class Issues(GithubCommand):
         :param int number: issue number in the Github database
         :param str title: title for issue
         :param str body: body for issue
+        :param raw: return decoded dicts, body bytes or columns instead of
+            objects, see :meth:`~github3.core.GithubCommand.get_values`
         """
         issue_data = {"title": title, "body": body}
         return self.get_value("edit", project, str(number),
                               post_data=issue_data, filter="issue",
-                              datatype=Issue)
+                              datatype=Issue, raw=raw)
 
     @requires_auth
-    def add_label(self, project, number, label):
+    def add_label(self, project, number, label, raw=None):
         """Add a label to an issue
 
         :param str project: GitHub project
         :param int number: issue number in the Github database
         :param str label: label to attach to issue
+        :param raw: see :meth:`~github3.core.GithubCommand.get_values`
         """
         return self.get_values("label/add", project, label, str(number),
-                               filter="labels", method="POST")
+                               filter="labels", method="POST", raw=raw)
 
     @requires_auth
-    def remove_label(self, project, number, label):
+    def remove_label(self, project, number, label, raw=None):
         """Remove an existing label from an issue
 
         :param str project: GitHub project
         :param int number: issue number in the Github database
         :param str label: label to remove from issue
+        :param raw: see :meth:`~github3.core.GithubCommand.get_values`
         """
         return self.get_values("label/remove", project, label, str(number),
-                               filter="labels", method="POST")
+                               filter="labels", method="POST", raw=raw)
 
     @requires_auth
-    def comment(self, project, number, comment):
+    def comment(self, project, number, comment, raw=None):
         """Comment on an issue.
 
         :param str project: GitHub project
         :param int number: issue number in the Github database
         :param str comment: comment to attach to issue
+        :param raw: return decoded dicts, body bytes or columns instead of
+            objects, see :meth:`~github3.core.GithubCommand.get_values`
         """
         comment_data = {'comment': comment}
         return self.get_value("comment", project, str(number),
                               post_data=comment_data, filter='comment',
-                              datatype=Comment)
+                              datatype=Comment, raw=raw)
 
-    def comments(self, project, number):
+    def comments(self, project, number, raw=None):
         """View comments on an issue.
 
         :param str project: GitHub project
         :param int number: issue number in the Github database
+        :param raw: return decoded dicts, body bytes or columns instead of
+            objects, see :meth:`~github3.core.GithubCommand.get_values`
         """
         return self.get_values("comments", project, str(number),
-                               filter="comments", datatype=Comment)
+                               filter="comments", datatype=Comment, raw=raw)
@@ -1,5 +1,5 @@
 from github3.core import (BaseData, GithubCommand, Attribute, DateAttribute,
-                          requires_auth)
+                          DEFAULT_PREFETCH, requires_auth)
 from github3.repositories import Repository
 from github3.teams import Team
 from github3.users import User
@@ -45,29 +45,66 @@ class Organizations(GithubCommand):
 
     def list(self, user=None):
         """Get list of all of your organizations"""
-        temp_domain = self.domain
         if (self.request.access_token or self.request.api_token) and (user is None or user == self.request.username):
             user = None
-            self.domain = 'user'
+            domain = 'user'
         else:
             user = user or self.request.username
-            self.domain = 'users'
-        
-        ret_val = self.get_values(user, 'orgs', filter=None,
-                               datatype=Organization)
-        self.domain = temp_domain
-        return ret_val
-
-    def repositories(self, organization=''):
+            domain = 'users'
+
+        return self.get_values(user, 'orgs', filter=None,
+                               datatype=Organization, domain=domain)
+
+    def repositories(self, organization='', page=1, per_page=None):
         """Get list of all repositories in an organization
 
         If organization is not given, or is empty, then this will list
         repositories for all organizations the authenticated user belongs to.
 
+        .. versionadded:: 0.7.0
+           The ``page`` and ``per_page`` parameters
+
+        :param: str organization: organization to list repositories for
+        :param int page: optional page number
+        :param int per_page: optional number of results per page, up to
+            :data:`~github3.request.MAX_PER_PAGE`
+        """
+        return self.get_values(organization, 'repos', filter=None,
+                               datatype=Repository, page=page,
+                               per_page=per_page)
+
+    def stream_repositories(self, organization='', page=1, per_page=None):
+        """Iterate over repositories in an organization, decoding them as
+        they're used
+
+        .. versionadded:: 0.7.0
+
+        :param: str organization: organization to list repositories for
+        :param int page: optional page number
+        :param int per_page: optional number of results per page, up to
+            :data:`~github3.request.MAX_PER_PAGE`
+        :see: :meth:`repositories`,
+            :meth:`~github3.core.GithubCommand.stream_values`
+        """
+        return self.stream_values(organization, 'repos', filter=None,
+                                  datatype=Repository, page=page,
+                                  per_page=per_page)
+
+    def iter_repositories(self, organization='', prefetch=DEFAULT_PREFETCH,
+                          per_page=None):
+        """Iterate over all repositories in an organization, following pages
+
+        .. versionadded:: 0.7.0
+
         :param: str organization: organization to list repositories for
+        :param int prefetch: number of pages to fetch ahead
+        :param int per_page: optional number of results per page, up to
+            :data:`~github3.request.MAX_PER_PAGE`
+        :see: :meth:`repositories`, :class:`~github3.core.PageIterator`
         """
-        return self.get_values(organization, 'repos',
-                               filter=None, datatype=Repository)
+        return self.iter_values(organization, 'repos', filter=None,
+                                datatype=Repository, per_page=per_page,
+                                prefetch=prefetch)
 
     def public_repositories(self, organization):
         """Get list of public repositories in an organization
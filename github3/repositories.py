@@ -1,5 +1,5 @@
 from github3.core import (BaseData, GithubCommand, Attribute, DateAttribute,
-                          requires_auth, enhanced_by_auth)
+                          DEFAULT_PREFETCH, requires_auth, enhanced_by_auth)
 
 from github3.users import User
 
@@ -36,36 +36,43 @@ class Repository(BaseData):
 class Repositories(GithubCommand):
     domain = "repos"
 
-    def search(self, query):
+    def search(self, query, raw=None):
         """Get all repositories that match term.
 
         .. warning:
            Returns at most 100 repositories
 
         :param str query: term to search issues for
+        :param raw: return decoded dicts, body bytes or columns instead of
+            objects, see :meth:`~github3.core.GithubCommand.get_values`
         """
         return self.get_values("search", query, filter="repositories",
-                               datatype=Repository)
+                               datatype=Repository, raw=raw)
 
-    def show(self, project):
+    def show(self, project, raw=None):
         """Get repository object for project.
 
         :param str project: GitHub project
+        :param raw: return decoded dicts, body bytes or columns instead of
+            objects, see :meth:`~github3.core.GithubCommand.get_values`
         """
         return self.get_value("show", project, filter="repository",
-                              datatype=Repository)
+                              datatype=Repository, raw=raw)
 
     @requires_auth
-    def pushable(self):
+    def pushable(self, raw=None):
         """Return a list of repos you can push to that are not your own.
 
         .. versionadded:: 0.3.0
+
+        :param raw: return decoded dicts, body bytes or columns instead of
+            objects, see :meth:`~github3.core.GithubCommand.get_values`
         """
         return self.get_values("pushable", filter="repositories",
-                               datatype=Repository)
+                               datatype=Repository, raw=raw)
 
     @enhanced_by_auth
-    def list(self, user=None, page=1):
+    def list(self, user=None, page=1, per_page=None, raw=None):
         """Return a list of all repositories for a user.
 
         .. deprecated: 0.4.0
@@ -73,62 +80,96 @@ class Repositories(GithubCommand):
            logged-in user when ``user`` wasn't supplied.  This functionality is
            brittle and will be removed in a future release!
 
+        .. versionadded:: 0.7.0
+           The ``per_page`` parameter
+
         :param str user: Github user name to list repositories for
         :param int page: optional page number
+        :param int per_page: optional number of results per page, up to
+            :data:`~github3.request.MAX_PER_PAGE`
+        :param raw: return decoded dicts, body bytes or columns instead of
+            objects, see :meth:`~github3.core.GithubCommand.get_values`
+        """
+        user, domain = self._list_domain(user)
+        return self.get_values(user, "repos", filter=None,
+                               datatype=Repository, page=page,
+                               per_page=per_page, domain=domain, raw=raw)
+
+    def iter_list(self, user=None, prefetch=DEFAULT_PREFETCH, per_page=None,
+                  raw=None):
+        """Iterate over all repositories for a user, following pages
+
+        .. versionadded:: 0.7.0
+
+        :param str user: Github user name to list repositories for
+        :param int prefetch: number of pages to fetch ahead
+        :param int per_page: optional number of results per page, up to
+            :data:`~github3.request.MAX_PER_PAGE`
+        :param raw: return decoded dicts, body bytes or columns instead of
+            objects, see :meth:`~github3.core.GithubCommand.get_values`
+        :see: :meth:`list`, :class:`~github3.core.PageIterator`
         """
-        temp_domain = self.domain
+        user, domain = self._list_domain(user)
+        return self.iter_values(user, "repos", filter=None,
+                                datatype=Repository, domain=domain,
+                                per_page=per_page, prefetch=prefetch, raw=raw)
+
+    def _list_domain(self, user):
+        """User and domain for listing a user's repositories"""
         if (self.request.access_token or self.request.api_token) and (user is None or user == self.request.username):
-            user = None
-            self.domain = 'user'
-        else:
-            user = user or self.request.username
-            self.domain = 'users'
-        
-        ret_val = self.get_values(user, "repos", filter=None,
-                               datatype=Repository, page=page)
-        self.domain = temp_domain
-        return ret_val
+            return None, 'user'
+        return user or self.request.username, 'users'
 
     @requires_auth
-    def watch(self, project):
+    def watch(self, project, raw=None):
         """Watch a project
 
         :param str project: GitHub project
+        :param raw: return decoded dicts, body bytes or columns instead of
+            objects, see :meth:`~github3.core.GithubCommand.get_values`
         """
         return self.get_value("watch", project, filter='repository',
-                              datatype=Repository)
+                              datatype=Repository, raw=raw)
 
     @requires_auth
-    def unwatch(self, project):
+    def unwatch(self, project, raw=None):
         """Unwatch a project
 
         :param str project: GitHub project
+        :param raw: return decoded dicts, body bytes or columns instead of
+            objects, see :meth:`~github3.core.GithubCommand.get_values`
         """
         return self.get_value("unwatch", project, filter='repository',
-                              datatype=Repository)
+                              datatype=Repository, raw=raw)
 
     @requires_auth
-    def fork(self, project):
+    def fork(self, project, raw=None):
         """Fork a project
 
         :param str project: GitHub project
+        :param raw: return decoded dicts, body bytes or columns instead of
+            objects, see :meth:`~github3.core.GithubCommand.get_values`
         """
         return self.get_value("fork", project, filter="repository",
-                              datatype=Repository)
+                              datatype=Repository, raw=raw)
 
     @requires_auth
-    def create(self, project, description=None, homepage=None, public=True):
+    def create(self, project, description=None, homepage=None, public=True,
+               raw=None):
         """Create a repository
 
         :param str project: new project name
         :param str description: optional project description
         :param str homepage: optional project homepage
         :param bool public: whether to make a public project
+        :param raw: return decoded dicts, body bytes or columns instead of
+            objects, see :meth:`~github3.core.GithubCommand.get_values`
         """
         repo_data = {"name": project, "description": description,
                      "homepage": homepage, "public": str(int(public))}
         return self.get_value("create", post_data=repo_data,
-                              filter="repository", datatype=Repository)
+                              filter="repository", datatype=Repository,
+                              raw=raw)
 
     @requires_auth
     def delete(self, project):
@@ -157,13 +198,14 @@ class Repositories(GithubCommand):
         """
         return self.make_request("set/public", project)
 
-    def list_collaborators(self, project):
+    def list_collaborators(self, project, raw=None):
         """Lists all the collaborators in a project
 
         :param str project: GitHub project
+        :param raw: see :meth:`~github3.core.GithubCommand.get_values`
         """
         return self.get_values("show", project, "collaborators",
-                               filter="collaborators")
+                               filter="collaborators", raw=raw)
 
     @requires_auth
     def add_collaborator(self, project, username):
@@ -185,89 +227,133 @@ class Repositories(GithubCommand):
         return self.make_request("collaborators", project, "remove",
                                  username, method="POST")
 
-    def network(self, project):
+    def network(self, project, raw=None):
         """Get network data for project
 
         :param str project: Github project
+        :param raw: return decoded dicts, body bytes or columns instead of
+            objects, see :meth:`~github3.core.GithubCommand.get_values`
         """
         return self.get_values("show", project, "network", filter="network",
-                               datatype=Repository)
+                               datatype=Repository, raw=raw)
 
-    def languages(self, project):
+    def languages(self, project, raw=None):
         """Get programming language data for project
 
         :param str project: Github project
+        :param raw: see :meth:`~github3.core.GithubCommand.get_values`
         """
         return self.get_values("show", project, "languages",
-                               filter="languages")
+                               filter="languages", raw=raw)
 
-    def tags(self, project):
+    def tags(self, project, raw=None):
         """Get tags for project
 
         :param str project: Github project
+        :param raw: see :meth:`~github3.core.GithubCommand.get_values`
         """
-        return self.get_values("show", project, "tags", filter="tags")
+        return self.get_values("show", project, "tags", filter="tags", raw=raw)
 
-    def branches(self, project):
+    def branches(self, project, raw=None):
         """Get branch names for project
 
         :param str project: Github project
+        :param raw: see :meth:`~github3.core.GithubCommand.get_values`
         """
-        return self.get_values("show", project, "branches", filter="branches")
+        return self.get_values("show", project, "branches", filter="branches",
+                               raw=raw)
 
-    def watchers(self, project):
+    def watchers(self, project, raw=None):
         """Get list of watchers for project
 
         :param str project: Github project
+        :param raw: see :meth:`~github3.core.GithubCommand.get_values`
         """
-        return self.get_values("show", project, "watchers", filter="watchers")
+        return self.get_values("show", project, "watchers", filter="watchers",
+                               raw=raw)
 
-    def watching(self, for_user=None, page=None):
+    def watching(self, for_user=None, page=None, raw=None):
         """Lists all the repos a user is watching
 
         :param str for_user: optional Github user name to list repositories for
         :param int page: optional page number
+        :param raw: return decoded dicts, body bytes or columns instead of
+            objects, see :meth:`~github3.core.GithubCommand.get_values`
         """
         for_user = for_user or self.request.username
         return self.get_values("watched", for_user, filter="repositories",
-                               datatype=Repository, page=page)
+                               datatype=Repository, page=page, raw=raw)
 
-    def list_contributors(self, project):
+    def iter_watching(self, for_user=None, prefetch=DEFAULT_PREFETCH,
+                      raw=None):
+        """Iterate over all the repos a user is watching, following pages
+
+        .. versionadded:: 0.7.0
+
+        :param str for_user: optional Github user name to list repositories for
+        :param int prefetch: number of pages to fetch ahead
+        :param raw: return decoded dicts, body bytes or columns instead of
+            objects, see :meth:`~github3.core.GithubCommand.get_values`
+        :see: :meth:`watching`, :class:`~github3.core.PageIterator`
+        """
+        for_user = for_user or self.request.username
+        return self.iter_values("watched", for_user, filter="repositories",
+                                datatype=Repository, prefetch=prefetch,
+                                raw=raw)
+
+    def list_contributors(self, project, raw=None):
         """Lists all the contributors in a project
 
         :param str project: Github project
+        :param raw: return decoded dicts, body bytes or columns instead of
+            objects, see :meth:`~github3.core.GithubCommand.get_values`
         """
         return self.get_values("show", project, "contributors",
-                               filter="contributors", datatype=User)
+                               filter="contributors", datatype=User, raw=raw)
 
     @requires_auth
-    def list_keys(self, project, user):
-        """List the keys for a repo"""
-        return self.get_values(user, project, "keys")
+    def list_keys(self, project, user, page=1, per_page=None, raw=None):
+        """List the keys for a repo
+
+        .. versionadded:: 0.7.0
+           The ``page`` and ``per_page`` parameters
+
+        :param str project: The github project name
+        :param str user: The github user
+        :param int page: optional page number
+        :param int per_page: optional number of results per page, up to
+            :data:`~github3.request.MAX_PER_PAGE`
+        :param raw: see :meth:`~github3.core.GithubCommand.get_values`
+        """
+        return self.get_values(user, project, "keys", page=page,
+                               per_page=per_page, raw=raw)
 
     @requires_auth
-    def get_key(self, project, user, id):
+    def get_key(self, project, user, id, raw=None):
         """Get a specific key using the key id
 
         :param str project: The github project name
         :param str user: The github user
         :param str key: Key id
+        :param raw: see :meth:`~github3.core.GithubCommand.get_values`
         """
-        return self.get_value(user, project, "keys", str(id))
+        return self.get_value(user, project, "keys", str(id), raw=raw)
     
     @requires_auth
-    def create_key(self, project, user, key_title, key_data):
+    def create_key(self, project, user, key_title, key_data, raw=None):
         """Create a key for a repo
 
         :param str title: The name of the key
         :param str key_data: The public key
+        :param raw: see :meth:`~github3.core.GithubCommand.get_values`
         """ 
         key = {'title': key_title,
                'key': key_data}
-        return self.get_value(user, project, 'keys', post_data=key, method='POST')
+        return self.get_value(user, project, 'keys', post_data=key,
+                              method='POST', raw=raw)
 
     @requires_auth
-    def update_key(self, project, user, id, key_title, key_data):
+    def update_key(self, project, user, id, key_title, key_data, raw=None):
         """Update a specific key
 
         :param str project: The github project to be updated
@@ -275,49 +361,65 @@ class Repositories(GithubCommand):
         :param str id: The id of the key
         :param str key_title: The key title
         :param str key_data: The public key
+        :param raw: see :meth:`~github3.core.GithubCommand.get_values`
         """
         key = {'title': key_title, 
                'key': key_data}
-        return self.get_value(user, project, 'keys', id, post_data=key, method='POST')
+        return self.get_value(user, project, 'keys', id, post_data=key,
+                              method='POST', raw=raw)
 
     @requires_auth
-    def delete_key(self, project, user, id):
+    def delete_key(self, project, user, id, raw=None):
         """Delete a github key
 
         :param str project: The github project
         :param str user: The github user
         :param str id: The id of the key to be deleted
+        :param raw: see :meth:`~github3.core.GithubCommand.get_values`
         """
-        return self.get_value(user, project, 'keys', id, method='DELETE')
+        return self.get_value(user, project, 'keys', id, method='DELETE',
+                              raw=raw)
     
     @requires_auth
-    def create_hook(self, project, user, url):
+    def create_hook(self, project, user, url, raw=None):
         """Create a github post receive hook
         
         :param str project: The github project
         :param str user: The github user
         :param str url: The url that will be called
+        :param raw: see :meth:`~github3.core.GithubCommand.get_values`
         """
         data = {'name': 'web',
                 'active': True,
                 'config':{'content-type': 'form',
                           'insecure_ssl': '1',
                           'url': url}}
-        return self.get_value(user, project, 'hooks', post_data=data, method='POST')
+        return self.get_value(user, project, 'hooks', post_data=data,
+                              method='POST', raw=raw)
     
-    def list_hooks(self, project, user):
+    def list_hooks(self, project, user, page=1, per_page=None, raw=None):
         """List all github post receive hooks
         
+        .. versionadded:: 0.7.0
+           The ``page`` and ``per_page`` parameters
+
         :param str project: The github project
         :param str user: The github user
+        :param int page: optional page number
+        :param int per_page: optional number of results per page, up to
+            :data:`~github3.request.MAX_PER_PAGE`
+        :param raw: see :meth:`~github3.core.GithubCommand.get_values`
         """
-        return self.get_values(user, project, "hooks", method='GET')
+        return self.get_values(user, project, "hooks", method='GET',
+                               page=page, per_page=per_page, raw=raw)
     
-    def delete_hook(self, project, user, id):
+    def delete_hook(self, project, user, id, raw=None):
         """Delete a github post receive hooks
         
         :param str project: The github project
         :param str user: The github user
         :param str id: The github hook id
+        :param raw: see :meth:`~github3.core.GithubCommand.get_values`
         """
-        return self.get_value(user, project, "hooks", id, method='DELETE')
\ No newline at end of file
+        return self.get_value(user, project, "hooks", id, method='DELETE',
+                              raw=raw)
\ No newline at end of file
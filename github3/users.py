@@ -4,7 +4,8 @@ except ImportError:
     from urllib import quote_plus
 
 from github3.core import (BaseData, GithubCommand, DateAttribute, Attribute,
-                          DeprecationException, enhanced_by_auth, requires_auth)
+                          DeprecationException, DEFAULT_PREFETCH,
+                          enhanced_by_auth, requires_auth)
 
 
 class User(BaseData):
@@ -71,10 +72,8 @@ class Users(GithubCommand):
         :param str username: Github user name
         """
         if username is None and self.request.username is None:
-            temp_domain = self.domain
-            self.domain = "user"
-            ret_val = self.get_value(None, None, filter=None, datatype=User)
-            self.domain = temp_domain
+            ret_val = self.get_value(None, None, filter=None, datatype=User,
+                                     domain="user")
         else:
             if username is None:
                 username = self.request.username
@@ -82,19 +81,63 @@ class Users(GithubCommand):
             
         return ret_val
 
-    def followers(self, username):
+    def followers(self, username, page=1, per_page=None):
         """Get list of Github user's followers
 
+        .. versionadded:: 0.7.0
+           The ``page`` and ``per_page`` parameters
+
+        :param str username: Github user name
+        :param int page: optional page number
+        :param int per_page: optional number of results per page, up to
+            :data:`~github3.request.MAX_PER_PAGE`
+        """
+        return self.get_values(None, username, "followers", filter=None,
+                               page=page, per_page=per_page)
+
+    def iter_followers(self, username, prefetch=DEFAULT_PREFETCH,
+                       per_page=None):
+        """Iterate over all of a Github user's followers, following pages
+
+        .. versionadded:: 0.7.0
+
         :param str username: Github user name
+        :param int prefetch: number of pages to fetch ahead
+        :param int per_page: optional number of results per page, up to
+            :data:`~github3.request.MAX_PER_PAGE`
+        :see: :meth:`followers`, :class:`~github3.core.PageIterator`
         """
-        return self.get_values(None, username, "followers", filter=None)
+        return self.iter_values(None, username, "followers", filter=None,
+                                per_page=per_page, prefetch=prefetch)
 
-    def following(self, username):
+    def following(self, username, page=1, per_page=None):
         """Get list of users a Github user is following
 
+        .. versionadded:: 0.7.0
+           The ``page`` and ``per_page`` parameters
+
+        :param str username: Github user name
+        :param int page: optional page number
+        :param int per_page: optional number of results per page, up to
+            :data:`~github3.request.MAX_PER_PAGE`
+        """
+        return self.get_values(None, username, "following", filter=None,
+                               page=page, per_page=per_page)
+
+    def iter_following(self, username, prefetch=DEFAULT_PREFETCH,
+                       per_page=None):
+        """Iterate over all users a Github user is following, following pages
+
+        .. versionadded:: 0.7.0
+
         :param str username: Github user name
+        :param int prefetch: number of pages to fetch ahead
+        :param int per_page: optional number of results per page, up to
+            :data:`~github3.request.MAX_PER_PAGE`
+        :see: :meth:`following`, :class:`~github3.core.PageIterator`
         """
-        return self.get_values(None, username, "following", filter=None)
+        return self.iter_values(None, username, "following", filter=None,
+                                per_page=per_page, prefetch=prefetch)
 
     @requires_auth
     def is_following(self, other_user):
@@ -102,11 +145,8 @@ class Users(GithubCommand):
 
         :param str other_user: Github username
         """
-        temp_domain = self.domain
-        self.domain = 'user'
-        val = self.get_value('following', other_user, filter=None)
-        self.domain = temp_domain
-        return val
+        return self.get_value('following', other_user, filter=None,
+                              domain='user')
 
     @requires_auth
     def follow(self, other_user):
@@ -9,9 +9,6 @@ import github3
 
 
 install_requires = ['httplib2 >= 0.7.0', ]
-# simplejson is included in the standard library since Python 2.6 as json.
-if sys.version_info[:2] < (2, 6):
-    install_requires.append('simplejson >= 2.0.9')
 
 if sys.version_info >= (3,):
     install_requires.append('python-dateutil >= 2.0')
@@ -52,9 +49,6 @@ setup(
         "Operating System :: OS Independent",
         "Programming Language :: Python",
         "Programming Language :: Python :: 2",
-        "Programming Language :: Python :: 2.4",
-        "Programming Language :: Python :: 2.5",
-        "Programming Language :: Python :: 2.6",
         "Programming Language :: Python :: 2.7",
         "Programming Language :: Python :: 3",
         "Programming Language :: Python :: 3.1",
@@ -0,0 +1,90 @@
+#! /usr/bin/env python
+"""Benchmark date parsing against the dates in the date handling tests
+
+Run from the top of the source tree with::
+
+    $ python tests/bench_dates.py [repeat]
+
+The dates used in ``tests/test_date_handling.py`` and
+``tests/test_tz_aware_date_handling.py`` are parsed with
+:func:`dateutil.parser.parse`, as :func:`~github2.core.string_to_datetime`
+used to, and with ``string_to_datetime`` itself, with its memo cleared before
+each pass (``cold``) and kept between passes (``memo``).  Both naive and
+timezone-aware results are timed.
+"""
+
+import os
+import re
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dateutil import parser
+
+from github2 import core
+
+
+TEST_DIR = os.path.dirname(os.path.abspath(__file__))
+
+#: Test modules the dates are taken from
+MODULES = ["test_date_handling.py", "test_tz_aware_date_handling.py"]
+
+
+def load_dates():
+    """Dates and their formats, from the date handling tests"""
+    dates = []
+    for name in MODULES:
+        source = open(os.path.join(TEST_DIR, name)).read()
+        for string in re.findall(r"string_to_datetime\('([^']+)'", source):
+            if "%" in string:
+                # Template for generated dates
+                continue
+            elif "/" in string:
+                format = "github"
+            elif string.endswith("Z"):
+                format = "iso"
+            else:
+                format = "commit"
+            dates.append((string, format))
+    return dates
+
+
+def main(repeat=2000):
+    dates = load_dates()
+    print("%d dates, %d passes" % (len(dates), repeat))
+
+    def dateutil():
+        for string, format in dates:
+            parsed = parser.parse(string)
+            if core.NAIVE:
+                parsed.replace(tzinfo=None)
+
+    def cold():
+        core._DATE_MEMO.clear()
+        for string, format in dates:
+            core.string_to_datetime(string, format)
+
+    def memo():
+        for string, format in dates:
+            core.string_to_datetime(string, format)
+
+    try:
+        for naive in (True, False):
+            core.NAIVE = naive
+            baseline = None
+            for name, run in (("dateutil", dateutil), ("cold", cold),
+                              ("memo", memo)):
+                elapsed = min(timeit.repeat(run, number=repeat, repeat=3))
+                if baseline is None:
+                    baseline = elapsed
+                print("%-6s %-9s %8.2f us/date %8.1fx"
+                      % (naive and "naive" or "aware", name,
+                         elapsed / repeat / len(dates) * 1e6,
+                         baseline / elapsed))
+    finally:
+        core.NAIVE = True
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,75 @@
+#! /usr/bin/env python
+"""Benchmark JSON codecs against the recorded responses in tests/data
+
+Run from the top of the source tree with::
+
+    $ python tests/bench_json.py [repeat]
+
+The previous decoding path, ``json.loads(content.decode(charset))``, is
+included as ``json+decode`` for comparison.
+"""
+
+import os
+import sys
+import timeit
+
+from email import message_from_file
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from github2 import codec
+from github2.request import charset_from_headers
+
+
+HTTP_DATA_DIR = os.path.join(os.path.dirname(__file__), "data")
+
+
+def load_fixtures():
+    """Bodies and character sets of the recorded JSON responses"""
+    fixtures = []
+    for name in sorted(os.listdir(HTTP_DATA_DIR)):
+        data_file = open(os.path.join(HTTP_DATA_DIR, name))
+        try:
+            message = message_from_file(data_file)
+        finally:
+            data_file.close()
+        charset = charset_from_headers(message)
+        content = message.get_payload().encode(charset)
+        try:
+            codec.JsonCodec().loads(content, charset)
+        except ValueError:
+            continue
+        fixtures.append((content, charset))
+    return fixtures
+
+
+def main(repeat=200):
+    fixtures = load_fixtures()
+    size = sum([len(content) for content, charset in fixtures])
+    print("%d fixtures, %d bytes, %d passes"
+          % (len(fixtures), size, repeat))
+
+    def legacy(content, charset):
+        return codec.simplejson.loads(content.decode(charset))
+    decoders = [("json+decode", legacy)]
+    for codec_class in codec.CODECS:
+        try:
+            decoders.append((codec_class.name, codec_class().loads))
+        except ImportError:
+            print("%s: not available" % codec_class.name)
+
+    baseline = None
+    for name, loads in decoders:
+        def run():
+            for content, charset in fixtures:
+                loads(content, charset)
+        elapsed = min(timeit.repeat(run, number=repeat, repeat=3))
+        if baseline is None:
+            baseline = elapsed
+        print("%-12s %8.2f ms/pass %8.1f MB/s %6.2fx"
+              % (name, elapsed / repeat * 1000,
+                 size * repeat / elapsed / 1e6, baseline / elapsed))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
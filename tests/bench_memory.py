@@ -0,0 +1,104 @@
+#! /usr/bin/env python
+"""Benchmark the memory used by regular and compact result objects
+
+Run from the top of the source tree with::
+
+    $ python tests/bench_memory.py [count]
+
+Listings recorded in tests/data are decoded repeatedly, until there are
+``count`` responses' worth of objects of each type, and built as regular and
+compact objects.  The memory still allocated once the decoded responses are
+released is reported, so it includes the objects' attribute values.
+
+Regular objects are measured again after being iterated over, as iteration
+gives each of them a ``__dict__``, which CPython 3.11 and later otherwise avoid
+creating until it is needed.
+"""
+
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+from email import message_from_file
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from github2 import codec
+from github2.commits import Commit
+from github2.issues import Issue
+from github2.repositories import Repository
+from github2.request import charset_from_headers
+
+
+HTTP_DATA_DIR = os.path.join(os.path.dirname(__file__), "data")
+
+#: Data types, with the fixture and key holding listings of them
+LISTINGS = [
+    (Issue, "github.com,api,v2,json,issues,list,ask,python-github2,closed,"
+            "3662da90eba27809e7bff7600392ec94", "issues"),
+    (Commit, "github.com,api,v2,json,commits,list,JNRowe,misc-overlay,master,"
+             "bfb4f990e48c87dab73d988a81318d69", "commits"),
+    (Repository, "github.com,api,v2,json,repos,search,surfraw,"
+                 "ef28b342b173c62c8b892fffb6509c84", "repositories"),
+]
+
+
+def load_fixture(name):
+    """Body and character set of a recorded response"""
+    data_file = open(os.path.join(HTTP_DATA_DIR, name))
+    try:
+        message = message_from_file(data_file)
+    finally:
+        data_file.close()
+    charset = charset_from_headers(message)
+    return message.get_payload().encode(charset), charset
+
+
+def measure(datatype, content, charset, key, count, iterate=False):
+    """Memory and time used to build ``count`` responses' worth of objects"""
+    json = codec.JsonCodec()
+    gc.collect()
+    tracemalloc.start()
+    try:
+        responses = [json.loads(content, charset)[key] for _ in range(count)]
+        started = time.time()
+        objects = [datatype(**value) for values in responses
+                   for value in values]
+        elapsed = time.time() - started
+        if iterate:
+            for obj in objects:
+                list(obj)
+        del responses
+        gc.collect()
+        allocated = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return len(objects), allocated, elapsed
+
+
+def main(count=200):
+    print("%-12s %8s %9s %9s %9s %8s %8s %7s"
+          % ("type", "objects", "regular", "iterated", "compact", "saved",
+             "saved*", "build"))
+    for datatype, fixture, key in LISTINGS:
+        content, charset = load_fixture(fixture)
+        objects, regular, regular_time = measure(datatype, content, charset,
+                                                 key, count)
+        iterated = measure(datatype, content, charset, key, count, True)[1]
+        compact, compact_time = measure(datatype.compact(), content, charset,
+                                        key, count)[1:]
+        print("%-12s %8d %9.0f %9.0f %9.0f %7.1f%% %7.1f%% %6.2fx"
+              % (datatype.__name__, objects, regular / float(objects),
+                 iterated / float(objects), compact / float(objects),
+                 (regular - compact) * 100.0 / regular,
+                 (iterated - compact) * 100.0 / iterated,
+                 regular_time / compact_time))
+    print("\nSizes are bytes per object, including attribute values; saved* "
+          "is against\niterated regular objects, and build is the speed up "
+          "of building compact\nobjects.")
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
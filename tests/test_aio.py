@@ -0,0 +1,91 @@
+import asyncio
+import time
+
+from nose.tools import (assert_equals, assert_raises, assert_true)
+
+from github2.aio import (AsyncCommand, AsyncGithub, AsyncIterator)
+from github2.core import AuthError
+
+import utils
+from test_pagination import FakeCommand
+
+
+class AsyncQueries(utils.HttpMockTestCase):
+    """Test asyncio client results match the synchronous client"""
+    def run_async(self, coroutine_func):
+        async def runner():
+            async with AsyncGithub(max_concurrency=4) as github:
+                return await coroutine_func(github)
+        return asyncio.run(runner())
+
+    def test_show(self):
+        user = self.run_async(lambda github: github.users.show('defunkt'))
+        assert_equals(user.login, self.client.users.show('defunkt').login)
+
+    def test_gather(self):
+        async def fetch(github):
+            return await asyncio.gather(
+                github.repos.show('JNRowe/misc-overlay'),
+                github.issues.list('ask/python-github2'),
+                github.commits.list('JNRowe/misc-overlay'))
+        repo, issues, commits = self.run_async(fetch)
+        assert_equals(repo.project, 'JNRowe/misc-overlay')
+        assert_equals(len(issues), len(self.client.issues.list(
+            'ask/python-github2')))
+        assert_equals(commits[0].id,
+                      '4de0834d58b37ef3020c49df43c95649217a2def')
+
+    def test_iterate(self):
+        command = FakeCommand({1: [1, 2], 2: [3]})
+
+        async def fetch(github):
+            return [value async for value
+                    in AsyncCommand(command, github).iter_values()]
+        assert_equals(self.run_async(fetch), [1, 2, 3])
+        assert_equals(command.fetched, [1, 2])
+
+    def test_stream(self):
+        async def fetch(github):
+            commits = github.commits.stream_list('JNRowe/misc-overlay')
+            assert_true(isinstance(commits, AsyncIterator))
+            return [commit async for commit in commits]
+        assert_equals(len(self.run_async(fetch)), 35)
+
+    def test_await_iterator(self):
+        commits = self.run_async(lambda github: github.commits.stream_list(
+            'JNRowe/misc-overlay'))
+        assert_equals(type(commits), list)
+        assert_equals(len(commits), 35)
+        table = self.run_async(lambda github: github.commits.stream_list(
+            'JNRowe/misc-overlay', raw='columns'))
+        assert_equals(len(table), 35)
+
+    def test_iterate_columns(self):
+        async def fetch(github):
+            return [name async for name in github.commits.stream_list(
+                'JNRowe/misc-overlay', raw='columns')]
+        assert_raises(TypeError, self.run_async, fetch)
+
+    def test_requires_auth(self):
+        assert_raises(AuthError, self.run_async,
+                      lambda github: github.repos.pushable())
+
+    def test_pool_size(self):
+        github = AsyncGithub(max_concurrency=3)
+        assert_equals(github.request.pool.size, 3)
+        github.close()
+
+    def test_close_waits(self):
+        finished = []
+
+        def slow():
+            time.sleep(0.05)
+            finished.append(True)
+
+        async def runner():
+            async with AsyncGithub() as github:
+                call = asyncio.ensure_future(github.run(slow))
+                await asyncio.sleep(0)
+            assert_equals(finished, [True])
+            await call
+        asyncio.run(runner())
@@ -0,0 +1,208 @@
+import shutil
+import tempfile
+import unittest
+
+from nose.tools import (assert_equals, assert_raises, assert_true)
+
+from github2.cache import (DiskCache, MemoryCache, TieredCache)
+from github2.client import Github
+from github2.request import DEFAULT_CACHE_TTL
+from github3.client import Github as Github3
+
+import utils
+
+
+class MemoryCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.clock = utils.FakeClock()
+        self.cache = MemoryCache(2, clock=self.clock)
+
+    def test_get_set(self):
+        assert_equals(self.cache.get('key'), None)
+        self.cache.set('key', {'login': 'JNRowe'}, 60)
+        assert_equals(self.cache.get('key'), {'login': 'JNRowe'})
+        assert_equals(self.cache.stats(), {'hits': 1, 'misses': 1, 'sets': 1,
+                                           'evictions': 0})
+
+    def test_expiry(self):
+        self.cache.set('key', 'value', 60)
+        self.clock.now += 60
+        assert_equals(self.cache.get('key'), None)
+        assert_equals(self.cache.stats()['evictions'], 1)
+
+    def test_lru_eviction(self):
+        self.cache.set('a', 1, 60)
+        self.cache.set('b', 2, 60)
+        self.cache.get('a')
+        self.cache.set('c', 3, 60)
+        assert_equals(self.cache.get('b'), None)
+        assert_equals(self.cache.get('a'), 1)
+        assert_equals(len(self.cache), 2)
+
+
+class DiskCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.clock = utils.FakeClock()
+        self.cache = DiskCache(self.directory, clock=self.clock)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_get_set(self):
+        self.cache.set('key', [{'number': 1}], 60)
+        assert_equals(self.cache.get('key'), [{'number': 1}])
+        assert_equals(DiskCache(self.directory, clock=self.clock).get('key'),
+                      [{'number': 1}])
+
+    def test_expiry(self):
+        self.cache.set('key', 'value', 60)
+        self.clock.now += 61
+        assert_equals(self.cache.get('key'), None)
+        assert_equals(self.cache.stats()['evictions'], 1)
+
+    def test_clear(self):
+        self.cache.set('key', 'value', 60)
+        self.cache.clear()
+        assert_equals(self.cache.get('key'), None)
+
+
+class TieredCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.clock = utils.FakeClock()
+        self.memory = MemoryCache(10, clock=self.clock)
+        self.disk = DiskCache(self.directory, clock=self.clock)
+        self.cache = TieredCache([self.memory, self.disk], clock=self.clock)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_promotion(self):
+        self.disk.set('key', 'value', 60)
+        self.clock.now += 30
+        assert_equals(self.cache.get('key'), 'value')
+        assert_equals(self.memory.lookup('key'), ('value', 1060))
+        stats = self.cache.stats()
+        assert_equals(stats['promotions'], 1)
+        assert_equals(stats['hits'], 1)
+
+    def test_set_all_tiers(self):
+        self.cache.set('key', 'value', 60)
+        assert_equals(self.memory.get('key'), 'value')
+        assert_equals(self.disk.get('key'), 'value')
+
+
+class CachedRequests(utils.HttpMockTestCase):
+    def setUp(self):
+        super(CachedRequests, self).setUp()
+        self.cache = MemoryCache()
+        self.client = Github(response_cache=self.cache,
+                             cache_ttls={'user/show': 3600, 'issues': 0})
+
+    def test_hit(self):
+        user = self.client.users.show('defunkt')
+        self.client.request._http = None
+        assert_equals(self.client.users.show('defunkt').login, user.login)
+        assert_equals(self.cache.stats()['hits'], 1)
+
+    def test_modified_result(self):
+        self.client.repos.tags('ask/python-github2').clear()
+        self.client.request._http = None
+        assert_true(len(self.client.repos.tags('ask/python-github2')) > 0)
+
+    def test_ttl_policy(self):
+        request = self.client.request
+        assert_equals(request.cache_ttl('user/show/defunkt'), 3600)
+        assert_equals(request.cache_ttl('issues/list/ask/python-github2'), 0)
+        assert_equals(request.cache_ttl('repos/show/ask/python-github2'),
+                      DEFAULT_CACHE_TTL)
+
+    def test_disabled_ttl(self):
+        self.client.issues.list('ask/python-github2')
+        assert_equals(self.cache.stats()['sets'], 0)
+
+    def test_method_ttl(self):
+        # Requested as repos/show/ask/python-github2/collaborators
+        self.client.request.cache_ttls = {'repos/list_collaborators': 0}
+        self.client.repos.list_collaborators('ask/python-github2')
+        assert_equals(self.cache.stats()['sets'], 0)
+
+    def test_v3_method_ttl(self):
+        client = Github3(response_cache=self.cache,
+                         cache_ttls={'*': 0, 'users/show': 3600})
+        client.request._http = utils.ScriptedHttp([
+            utils.response(200, b'{"login": "JNRowe"}')])
+        client.users.show('JNRowe')
+        assert_equals(self.cache.stats()['sets'], 1)
+
+    def test_auth_scope(self):
+        anonymous = self.client.request.cache_key('https://github.com/x')
+        client = Github(access_token='xxx')
+        assert_true(anonymous != client.request.cache_key(
+            'https://github.com/x'))
+
+
+class ObjectCache(utils.HttpMockTestCase):
+    def setUp(self):
+        super(ObjectCache, self).setUp()
+        self.cache = MemoryCache()
+        self.client = Github(object_cache=self.cache,
+                             cache_ttls={'commits': 0})
+
+    def test_value_hit(self):
+        user = self.client.users.show('defunkt')
+        self.client.request._http = None
+        cached = self.client.users.show('defunkt')
+        assert_equals(cached.created_at, user.created_at)
+        assert_true(cached is not user)
+        assert_equals(self.cache.stats()['hits'], 1)
+
+    def test_values_hit(self):
+        issues = self.client.issues.list('ask/python-github2')
+        self.client.request._http = None
+        cached = self.client.issues.list('ask/python-github2')
+        assert_equals([i.number for i in cached], [i.number for i in issues])
+        cached[0].title = 'changed'
+        assert_true(issues[0].title != 'changed')
+
+    def test_nested_values_hit(self):
+        issues = self.client.issues.list('ask/python-github2')
+        issues[0].labels.append('junk')
+        self.client.request._http = None
+        cached = self.client.issues.list('ask/python-github2')
+        assert_true('junk' not in cached[0].labels)
+
+    def test_compact_nested_values_hit(self):
+        self.client.request.compact_objects = True
+        self.client.issues.list('ask/python-github2')[0].labels.append('junk')
+        self.client.request._http = None
+        cached = self.client.issues.list('ask/python-github2')
+        assert_true('junk' not in cached[0].labels)
+
+    def test_raw_values_hit(self):
+        issues = self.client.issues.list('ask/python-github2', raw=True)
+        issues.append('junk')
+        issues[0]['labels'].append('junk')
+        self.client.request._http = None
+        cached = self.client.issues.list('ask/python-github2', raw=True)
+        assert_true('junk' not in cached)
+        assert_true('junk' not in cached[0]['labels'])
+
+    def test_serialising_cache(self):
+        directory = tempfile.mkdtemp()
+        try:
+            for cache in (DiskCache(directory),
+                          TieredCache([MemoryCache(), DiskCache(directory)])):
+                assert_raises(ValueError, Github, object_cache=cache)
+        finally:
+            shutil.rmtree(directory)
+
+    def test_keyed_by_arguments(self):
+        self.client.issues.list('ask/python-github2')
+        self.client.issues.list('ask/python-github2', 'closed')
+        assert_equals(self.cache.stats()['sets'], 2)
+
+    def test_disabled_ttl(self):
+        self.client.commits.list('JNRowe/misc-overlay')
+        assert_equals(self.cache.stats()['sets'], 0)
@@ -0,0 +1,68 @@
+import unittest
+
+from nose.tools import (assert_equals, assert_raises, assert_true)
+
+from github2 import codec
+from github2.client import Github
+
+import utils
+
+
+class CodecTests(object):
+    """Tests run for every available codec"""
+    codec_class = None
+
+    def setUp(self):
+        try:
+            self.codec = self.codec_class()
+        except ImportError:
+            self.skipTest('%s is not available' % self.codec_class.name)
+
+    def test_loads_bytes(self):
+        assert_equals(self.codec.loads('{"login": "JNRowe"}'.encode('ascii'),
+                                       'ascii'),
+                      {'login': 'JNRowe'})
+
+    def test_loads_other_charset(self):
+        content = '{"name": "Ren\xe9"}'.encode('latin-1')
+        assert_equals(self.codec.loads(content, 'ISO-8859-1'),
+                      {'name': 'Ren\xe9'})
+
+    def test_loads_invalid(self):
+        assert_raises(ValueError, self.codec.loads, '{"a": '.encode('ascii'))
+
+    def test_dumps(self):
+        encoded = self.codec.dumps({'name': 'Ren\xe9'})
+        assert_true(isinstance(encoded, bytes))
+        assert_equals(codec.JsonCodec().loads(encoded), {'name': 'Ren\xe9'})
+
+
+class JsonCodecTests(CodecTests, unittest.TestCase):
+    codec_class = codec.JsonCodec
+
+
+class OrjsonCodecTests(CodecTests, unittest.TestCase):
+    codec_class = codec.OrjsonCodec
+
+
+class GetCodecTests(unittest.TestCase):
+    def test_default(self):
+        expected = codec.orjson and 'orjson' or 'json'
+        assert_equals(codec.get_codec().name, expected)
+
+    def test_named(self):
+        assert_equals(codec.get_codec('json').name, 'json')
+
+    def test_unknown(self):
+        assert_raises(ValueError, codec.get_codec, 'yaml')
+
+
+class ClientCodecTests(utils.HttpMockTestCase):
+    def test_selected_codec(self):
+        client = Github(json_codec='json')
+        assert_equals(client.request.codec.name, 'json')
+        assert_equals(client.users.show('defunkt').login, 'defunkt')
+
+    def test_codecs_agree(self):
+        fast = Github().users.followers('defunkt')
+        assert_equals(fast, Github(json_codec='json').users.followers('defunkt'))
@@ -0,0 +1,118 @@
+import unittest
+
+from datetime import datetime
+
+from nose.tools import (assert_equals, assert_raises, assert_true)
+
+from github2 import columns
+from github2.columns import ColumnSet
+from github2.commits import Commit
+from github2.issues import Issue
+
+import utils
+from test_pagination import FakeCommand
+
+
+VALUES = [
+    {'number': 1, 'title': 'First', 'votes': 2,
+     'created_at': '2009/04/18 13:04:09 -0700', 'html_url': 'x'},
+    {'number': 2, 'title': 'Second', 'created_at': None},
+]
+
+
+class ListColumnTests(unittest.TestCase):
+    def setUp(self):
+        self.import_numpy = columns._import_numpy
+        columns._import_numpy = lambda: None
+
+    def tearDown(self):
+        columns._import_numpy = self.import_numpy
+
+    def test_datatype(self):
+        table = ColumnSet(Issue, VALUES)
+        assert_equals(len(table), 2)
+        assert_equals(table.names, list(Issue._meta))
+        assert_true('html_url' not in table.columns)
+        assert_equals(table['number'], [1, 2])
+        assert_equals(table['votes'], [2, None])
+        assert_equals(table['created_at'],
+                      [datetime(2009, 4, 18, 13, 4, 9), None])
+
+    def test_without_datatype(self):
+        table = ColumnSet(None, [{'a': 1}, {'b': 2}, {'a': 3, 'b': 4}])
+        assert_equals(list(table), ['a', 'b'])
+        assert_equals(table['a'], [1, None, 3])
+        assert_equals(table['b'], [None, 2, 4])
+
+    def test_rows(self):
+        table = ColumnSet(None, VALUES)
+        assert_equals(list(table.rows()), [
+            dict(VALUES[0]),
+            {'number': 2, 'title': 'Second', 'created_at': None,
+             'votes': None, 'html_url': None},
+        ])
+
+    def test_plain_values(self):
+        assert_raises(ValueError, ColumnSet, None, ['JNRowe', 'ask'])
+        assert_raises(ValueError, ColumnSet, None, {'Python': 2270})
+
+    def test_empty(self):
+        table = ColumnSet(Commit, [])
+        assert_equals(len(table), 0)
+        assert_equals(table['id'], [])
+
+    def test_pages(self):
+        command = FakeCommand({1: [{'id': 1}, {'id': 2}], 2: [{'id': 3}]})
+        table = command.iter_values(raw='columns')
+        assert_equals(table['id'], [1, 2, 3])
+
+
+class NumpyColumnTests(unittest.TestCase):
+    def setUp(self):
+        self.numpy = columns._import_numpy()
+        if self.numpy is None:
+            self.skipTest('NumPy is unavailable')
+
+    def test_types(self):
+        table = ColumnSet(Issue, VALUES)
+        assert_equals(table['number'].dtype.name, 'int64')
+        assert_equals(table['votes'].dtype.name, 'float64')
+        assert_equals(table['title'].dtype.name, 'object')
+        assert_equals(table['created_at'].dtype.name, 'datetime64[s]')
+        assert_equals(str(table['created_at'][0]), '2009-04-18T13:04:09')
+        assert_true(self.numpy.isnat(table['created_at'][1]))
+
+
+class ColumnResultTests(utils.HttpMockTestCase):
+    def test_list(self):
+        table = self.client.commits.list('JNRowe/misc-overlay',
+                                         raw='columns')
+        commits = self.client.commits.list('JNRowe/misc-overlay')
+        assert_equals(len(table), len(commits))
+        assert_equals(list(table['id']), [commit.id for commit in commits])
+        assert_equals(list(table['message']),
+                      [commit.message for commit in commits])
+
+    def test_show(self):
+        table = self.client.issues.show('ask/python-github2', 24,
+                                        raw='columns')
+        assert_equals(list(table['number']), [24])
+
+    def test_stream(self):
+        table = self.client.commits.stream_list('JNRowe/misc-overlay',
+                                                raw='columns')
+        assert_equals(table.datatype, Commit)
+        assert_equals(len(table), 35)
+
+    def test_plain_listing(self):
+        assert_raises(ValueError, self.client.repos.watchers,
+                      'ask/python-github2', raw='columns')
+
+    def test_export_unavailable(self):
+        table = self.client.issues.list('ask/python-github2', raw='columns')
+        for name, export in (('pandas', table.to_pandas),
+                             ('pyarrow', table.to_arrow)):
+            try:
+                __import__(name)
+            except ImportError:
+                assert_raises(ImportError, export)
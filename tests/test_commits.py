@@ -44,6 +44,18 @@ class CommitsQueries(utils.HttpMockTestCase):
         assert_equals(commits[0].id,
                 '4de0834d58b37ef3020c49df43c95649217a2def')
 
+    def test_stream_list(self):
+        commits = self.client.commits.stream_list('JNRowe/misc-overlay')
+        assert_equals([commit.id for commit in commits],
+                      [commit.id for commit in
+                       self.client.commits.list('JNRowe/misc-overlay')])
+
+    def test_stream_list_with_page(self):
+        commits = self.client.commits.stream_list('JNRowe/jnrowe-misc',
+                                                  page=2)
+        assert_equals(next(commits).id,
+                '1f5ad2c3206bafc4aca9e6ce50f5c605befdb3d6')
+
     def test_list_with_page(self):
         commits = self.client.commits.list('JNRowe/jnrowe-misc', page=2)
         assert_equals(len(commits), 35)
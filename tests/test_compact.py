@@ -0,0 +1,90 @@
+import copy
+import datetime
+import pickle
+import unittest
+
+from nose.tools import (assert_equals, assert_false, assert_raises,
+                        assert_true)
+
+from github2.cache import MemoryCache
+from github2.client import Github
+from github2.core import BaseData
+from github2.issues import Issue
+from github2.repositories import Repository
+
+import utils
+
+
+class CompactTypeTests(unittest.TestCase):
+    def setUp(self):
+        self.compact = Issue.compact()
+        self.issue = self.compact(number=1, title='Broken',
+                                  created_at='2009/04/18 13:04:09 -0700',
+                                  html_url='https://github.com/ask/1')
+
+    def test_cached(self):
+        assert_true(Issue.compact() is self.compact)
+        assert_true(self.compact.compact() is self.compact)
+        assert_true(Repository.compact() is not self.compact)
+
+    def test_isinstance(self):
+        assert_true(isinstance(self.issue, Issue))
+        assert_true(isinstance(self.issue, BaseData))
+        assert_true(issubclass(self.compact, Issue))
+        assert_false(isinstance(self.issue, Repository))
+        assert_false(isinstance(Issue(), self.compact))
+
+    def test_slots(self):
+        assert_false(hasattr(self.issue, '__dict__'))
+        assert_equals(self.issue.title, 'Broken')
+        assert_equals(self.issue.body, None)
+        assert_true(isinstance(self.issue.created_at, datetime.datetime))
+
+    def test_extra_attributes(self):
+        assert_equals(self.issue.html_url, 'https://github.com/ask/1')
+        assert_raises(AttributeError, getattr, self.issue, 'missing')
+        other = self.compact(html_url='https://github.com/ask/2')
+        assert_true(other._extra_keys is self.issue._extra_keys)
+
+    def test_iterate(self):
+        assert_equals(sorted(dict(self.issue).keys()),
+                      ['created_at', 'html_url', 'number', 'title'])
+
+    def test_repr(self):
+        assert_equals(repr(self.issue), repr(Issue(number=1, title='Broken')))
+
+    def test_pickle(self):
+        restored = pickle.loads(pickle.dumps(self.issue, 2))
+        assert_true(type(restored) is self.compact)
+        assert_equals(dict(restored), dict(self.issue))
+
+    def test_copy(self):
+        copied = copy.copy(self.issue)
+        assert_equals(dict(copied), dict(self.issue))
+        assert_equals(copied.html_url, self.issue.html_url)
+
+
+class CompactResultTests(utils.HttpMockTestCase):
+    def setUp(self):
+        super(CompactResultTests, self).setUp()
+        self.client = Github(compact_objects=True)
+
+    def test_list(self):
+        issues = self.client.issues.list('ask/python-github2')
+        assert_true(all([type(issue) is Issue.compact()
+                         for issue in issues]))
+        regular = Github().issues.list('ask/python-github2')
+        assert_equals([dict(issue) for issue in issues],
+                      [dict(issue) for issue in regular])
+
+    def test_show(self):
+        issue = self.client.issues.show('ask/python-github2', 24)
+        assert_true(type(issue) is Issue.compact())
+        assert_equals(issue.title, 'Pagination support for commits.')
+
+    def test_object_cache(self):
+        self.client.request.object_cache = MemoryCache()
+        first = self.client.issues.show('ask/python-github2', 24)
+        second = self.client.issues.show('ask/python-github2', 24)
+        assert_true(type(second) is Issue.compact())
+        assert_equals(dict(first), dict(second))
@@ -0,0 +1,92 @@
+import unittest
+
+from nose.tools import (assert_equals, assert_raises, assert_true)
+
+from github3 import request
+from github3.client import Github
+
+from utils import (ScriptedHttp, response)
+
+
+class TestNormalizeUrl(unittest.TestCase):
+    def test_query_order(self):
+        assert_equals(request.normalize_url('https://api.github.com/x?b=2&a=1'),
+                      request.normalize_url('https://API.github.com/x?a=1&b=2'))
+
+    def test_fragment(self):
+        assert_equals(request.normalize_url('https://api.github.com/x#top'),
+                      'https://api.github.com/x')
+
+
+class TestValidatorStore(unittest.TestCase):
+    def setUp(self):
+        self.store = request.ValidatorStore(max_entries=2)
+
+    def test_lru_eviction(self):
+        for key in ('a', 'b'):
+            self.store.store(key, response(200, etag=key)[0], [key])
+        # Looking up "a" leaves "b" as the least recently used
+        self.store.conditional_headers('a')
+        self.store.store('c', response(200, etag='c')[0], ['c'])
+        assert_equals(self.store.conditional_headers('b'), {})
+        assert_equals(self.store.conditional_headers('a'),
+                      {'If-None-Match': 'a'})
+        assert_equals(self.store.conditional('c'),
+                      ({'If-None-Match': 'c'}, ['c']))
+        assert_equals(self.store.stats()['evicted'], 1)
+
+    def test_invalid_size(self):
+        assert_raises(ValueError, request.ValidatorStore, max_entries=0)
+
+
+class TestConditionalRequests(unittest.TestCase):
+    def setUp(self):
+        self.client = Github()
+        self.http = ScriptedHttp([
+            response(200, b'[{"number": 1}]', etag='"abc"',
+                     last_modified='Mon, 15 Aug 2011 19:53:45 GMT'),
+            response(304, b''),
+        ])
+        self.client.request._http = self.http
+
+    def test_revalidated(self):
+        first = self.client.request.get('repos', 'JNRowe', 'misc', 'issues')
+        second = self.client.request.get('repos', 'JNRowe', 'misc', 'issues')
+        assert_equals(first, [{'number': 1}])
+        assert_equals(second, first)
+        assert_true(second is not first)
+        assert_true('If-None-Match' not in self.http.headers[0])
+        assert_equals(self.http.headers[1]['If-None-Match'], '"abc"')
+        assert_equals(self.http.headers[1]['If-Modified-Since'],
+                      'Mon, 15 Aug 2011 19:53:45 GMT')
+        assert_equals(self.client.request.validators.stats(),
+                      {'entries': 1, 'stored': 1, 'revalidated': 1,
+                       'evicted': 0})
+
+    def test_modified_payload(self):
+        first = self.client.request.get('repos', 'JNRowe', 'misc', 'issues')
+        first[0]['number'] = 2
+        second = self.client.request.get('repos', 'JNRowe', 'misc', 'issues')
+        assert_equals(second, [{'number': 1}])
+
+    def test_evicted_in_flight(self):
+        self.client.request.get('repos', 'JNRowe', 'misc', 'issues')
+        http_request = self.http.request
+
+        def clearing_request(*args, **kwargs):
+            self.client.request.validators.clear()
+            return http_request(*args, **kwargs)
+        self.http.request = clearing_request
+        second = self.client.request.get('repos', 'JNRowe', 'misc', 'issues')
+        assert_equals(second, [{'number': 1}])
+
+    def test_disabled(self):
+        client = Github(conditional_requests=False)
+        client.request._http = self.http
+        client.request.get('repos', 'JNRowe', 'misc', 'issues')
+        assert_equals(client.request.validators, None)
+
+    def test_no_validators(self):
+        self.http.results = [response(200)]
+        self.client.request.get('user')
+        assert_equals(self.client.request.validators.stats()['entries'], 0)
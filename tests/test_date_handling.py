@@ -2,8 +2,9 @@
 
 from datetime import datetime as dt
 
-from nose.tools import assert_equals
+from nose.tools import (assert_equals, assert_true)
 
+from github2 import core
 from github2.core import (datetime_to_ghdate, datetime_to_commitdate,
                           datetime_to_isodate, string_to_datetime)
 
@@ -163,3 +164,35 @@ def test_datetime_to_isodate():
                   '2011-04-09T09:53:00Z')
     assert_equals(datetime_to_isodate(dt(2011, 4, 9, 9, 53, 0)),
                   '2011-04-09T09:53:00Z')
+
+
+def test_declared_format():
+    assert_equals(string_to_datetime('2011/05/22 00:24:15 -0700', 'github'),
+                  dt(2011, 5, 22, 0, 24, 15))
+    assert_equals(string_to_datetime('2011-05-22T00:24:15-07:00', 'commit'),
+                  dt(2011, 5, 22, 0, 24, 15))
+    assert_equals(string_to_datetime('2011-05-22T00:24:15Z', 'iso'),
+                  dt(2011, 5, 22, 0, 24, 15))
+
+
+def test_mismatched_format():
+    assert_equals(string_to_datetime('2011-05-22T00:24:15Z', 'github'),
+                  dt(2011, 5, 22, 0, 24, 15))
+
+
+def test_fallback_parsing():
+    assert_equals(string_to_datetime('2011-05-22T00:24:15.250Z', 'iso'),
+                  dt(2011, 5, 22, 0, 24, 15, 250000))
+    assert_equals(string_to_datetime('May 22 2011 00:24'),
+                  dt(2011, 5, 22, 0, 24))
+
+
+def test_memo_bounded():
+    original = core.DATE_MEMO_SIZE
+    core.DATE_MEMO_SIZE = 2
+    try:
+        for second in range(10):
+            string_to_datetime('2011/05/22 00:24:%02d -0700' % second)
+        assert_true(len(core._DATE_MEMO) <= 2)
+    finally:
+        core.DATE_MEMO_SIZE = original
@@ -0,0 +1,104 @@
+import unittest
+
+from nose.tools import (assert_equals, assert_raises, assert_true)
+
+from github2.cache import MemoryCache
+from github2.client import Github
+from github2.request import (Hooks, HttpError)
+
+import utils
+
+
+class HooksTests(unittest.TestCase):
+    def setUp(self):
+        self.hooks = Hooks()
+        self.events = []
+
+    def test_register(self):
+        self.hooks.register('retry', self.events.append)
+        assert_true(self.hooks.active('retry'))
+        assert_true(not self.hooks.active('error'))
+        self.hooks.emit('retry', {'attempt': 1})
+        assert_equals(self.events, [{'event': 'retry', 'attempt': 1}])
+
+    def test_unregister(self):
+        self.hooks.register('retry', self.events.append)
+        self.hooks.unregister('retry', self.events.append)
+        assert_true(not self.hooks.active('retry'))
+
+    def test_unknown_event(self):
+        assert_raises(ValueError, self.hooks.register, 'teardown',
+                      self.events.append)
+
+    def test_failing_callback(self):
+        def broken(event):
+            raise RuntimeError('broken hook')
+        self.hooks.register('error', broken)
+        self.hooks.register('error', self.events.append)
+        self.hooks.emit('error', {})
+        assert_equals(len(self.events), 1)
+
+
+class RequestEventTests(utils.HttpMockTestCase):
+    def record(self, *events):
+        recorded = []
+        for event in events:
+            self.client.request.hooks.register(event, recorded.append)
+        return recorded
+
+    def test_request(self):
+        events = self.record('request_start', 'request_end')
+        self.client.users.show('defunkt')
+        assert_equals([event['event'] for event in events],
+                      ['request_start', 'request_end'])
+        end = events[1]
+        assert_equals(end['method'], 'GET')
+        assert_equals(end['url'],
+                      'https://github.com/api/v2/json/user/show/defunkt')
+        assert_equals(end['endpoint'], 'user/show')
+        assert_equals((end['domain'], end['command']), ('user', 'show'))
+        assert_equals(end['status'], 200)
+        assert_equals(end['error'], None)
+        assert_true(end['latency'] >= 0)
+        assert_true(end['decoded_bytes'] > 0)
+
+    def test_error(self):
+        events = self.record('error', 'request_end')
+        assert_raises(HttpError, self.client.users.show, 'no_such_user')
+        assert_equals([event['event'] for event in events],
+                      ['error', 'request_end'])
+        assert_equals(events[0]['status'], 404)
+        assert_true(isinstance(events[1]['error'], HttpError))
+
+    def test_response_cache(self):
+        self.client = Github(response_cache=MemoryCache())
+        events = self.record('cache_hit', 'cache_miss')
+        self.client.users.show('defunkt')
+        self.client.users.show('defunkt')
+        assert_equals([(event['event'], event['cache']) for event in events],
+                      [('cache_miss', 'response'), ('cache_hit', 'response')])
+        assert_equals(events[1]['command'], 'show')
+
+    def test_object_cache(self):
+        self.client = Github(object_cache=MemoryCache())
+        events = self.record('cache_hit')
+        self.client.users.show('defunkt')
+        self.client.users.show('defunkt')
+        assert_equals(len(events), 1)
+        assert_equals((events[0]['cache'], events[0]['endpoint']),
+                      ('object', 'user/show'))
+
+    def test_throttle_wait(self):
+        self.client = Github(requests_per_second=100)
+        events = self.record('throttle_wait')
+        self.client.users.show('defunkt')
+        self.client.users.show('defunkt')
+        assert_equals(len(events), 1)
+        assert_equals(events[0]['limiter'], 'rate')
+        assert_true(0 < events[0]['seconds'] <= 0.01)
+
+    def test_direct_request(self):
+        events = self.record('request_end')
+        self.client.users.show('defunkt')
+        self.client.request.get('user', 'show', 'defunkt')
+        assert_equals(events[1]['command'], None)
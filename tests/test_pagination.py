@@ -0,0 +1,130 @@
+import threading
+import unittest
+
+from nose.tools import (assert_equals, assert_raises, assert_true)
+
+from github2.core import (GithubCommand, PageIterator)
+from github2.request import (HttpError, parse_link_header)
+
+import utils
+
+
+class FakeRequest(object):
+    def __init__(self, pool=None):
+        self.pool = pool
+        self._local = threading.local()
+
+    def links(self):
+        return getattr(self._local, 'links', {})
+
+    def reset_links(self):
+        self._local.links = {}
+
+
+class FakeCommand(GithubCommand):
+    """Serve pages from a dict, optionally with ``Link`` headers"""
+    domain = 'fake'
+
+    def __init__(self, pages, last=None, pool=None):
+        super(FakeCommand, self).__init__(FakeRequest(pool))
+        self.pages = pages
+        self.last = last
+        self.fetched = []
+        self.lock = threading.Lock()
+
+    def get_values(self, *args, **kwargs):
+        page = kwargs['page']
+        self.lock.acquire()
+        try:
+            self.fetched.append(page)
+        finally:
+            self.lock.release()
+        if page not in self.pages:
+            raise HttpError('Not found', '', 404)
+        if self.last:
+            links = {'last': 'https://api.github.com/x?page=%d' % self.last}
+            if page < self.last:
+                links['next'] = 'https://api.github.com/x?page=%d' % (page + 1)
+            self.request._local.links = links
+        return self.pages[page]
+
+
+class TestLinkHeader(unittest.TestCase):
+    def test_parse(self):
+        header = ('<https://api.github.com/x?page=2>; rel="next", '
+                  '<https://api.github.com/x?page=5>; rel="last"')
+        assert_equals(parse_link_header(header),
+                      {'next': 'https://api.github.com/x?page=2',
+                       'last': 'https://api.github.com/x?page=5'})
+
+    def test_empty(self):
+        assert_equals(parse_link_header(''), {})
+
+
+class TestPageIterator(unittest.TestCase):
+    pages = {1: [1, 2, 3], 2: [4, 5, 6], 3: [7]}
+
+    def test_short_page(self):
+        command = FakeCommand(self.pages)
+        assert_equals(list(command.iter_values()), [1, 2, 3, 4, 5, 6, 7])
+        assert_equals(command.fetched, [1, 2, 3])
+
+    def test_empty_page(self):
+        command = FakeCommand({1: [1, 2], 2: [3, 4], 3: []})
+        assert_equals(list(command.iter_values()), [1, 2, 3, 4])
+
+    def test_lazy(self):
+        command = FakeCommand(self.pages)
+        iterator = command.iter_values()
+        assert_equals(next(iterator), 1)
+        assert_equals(command.fetched, [1])
+
+    def test_no_prefetch_without_pool(self):
+        command = FakeCommand(self.pages)
+        assert_equals(PageIterator(command, (), {}, 5).prefetch, 0)
+
+    def test_prefetch(self):
+        command = FakeCommand(self.pages, pool=object())
+        iterator = command.iter_values(prefetch=2)
+        assert_equals(next(iterator), 1)
+        # Pages beyond the end are fetched speculatively, but never consumed
+        assert_equals(list(iterator), [2, 3, 4, 5, 6, 7])
+        assert_equals(sorted(command.fetched)[:3], [1, 2, 3])
+
+    def test_last_link(self):
+        pages = {1: [1, 2], 2: [3, 4], 3: [5, 6]}
+        command = FakeCommand(pages, last=3, pool=object())
+        assert_equals(list(command.iter_values(prefetch=5)),
+                      [1, 2, 3, 4, 5, 6])
+        assert_equals(sorted(command.fetched), [1, 2, 3])
+
+    def test_error(self):
+        command = FakeCommand({})
+        assert_raises(HttpError, list, command.iter_values())
+
+    def test_missing_page(self):
+        command = FakeCommand({1: [1, 2], 2: [3, 4]})
+        assert_equals(list(command.iter_values()), [1, 2, 3, 4])
+
+    def test_per_page(self):
+        command = FakeCommand({1: [1, 2], 2: [3, 4]})
+        assert_equals(list(command.iter_values(per_page=3)), [1, 2])
+        assert_equals(command.fetched, [1])
+
+    def test_prefetch_window(self):
+        pages = dict((n, [n]) for n in range(1, 11))
+        command = FakeCommand(pages, last=10, pool=object())
+        iterator = command.iter_values(prefetch=3)
+        assert_equals([next(iterator) for _ in range(4)], [1, 2, 3, 4])
+        # Only pages up to three ahead of the page being consumed
+        assert_true(max(command.fetched) <= 7)
+        assert_equals(list(iterator), [5, 6, 7, 8, 9, 10])
+
+
+class TestIterList(utils.HttpMockTestCase):
+    def test_without_links(self):
+        # The fixtures have no second page of commits
+        commits = list(self.client.commits.iter_list('JNRowe/misc-overlay'))
+        assert_equals([commit.id for commit in commits],
+                      [commit.id for commit in self.client.commits.list(
+                          'JNRowe/misc-overlay')])
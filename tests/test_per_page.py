@@ -0,0 +1,66 @@
+import unittest
+
+from nose.tools import (assert_equals, assert_raises)
+
+from github3.client import Github
+
+import utils
+
+
+class TestPerPage(unittest.TestCase):
+    def make_client(self, bodies, **kwargs):
+        client = Github(**kwargs)
+        self.http = utils.ScriptedHttp([utils.response(200, body)
+                                        for body in bodies])
+        client.request._http = self.http
+        return client
+
+    def test_default(self):
+        client = self.make_client([b'[]'])
+        client.users.followers('JNRowe')
+        assert_equals(self.http.uris,
+                      ['https://api.github.com/users/JNRowe/followers'])
+
+    def test_client_wide(self):
+        client = self.make_client([b'[]'], per_page=100)
+        client.users.following('JNRowe')
+        assert_equals(self.http.uris,
+                      ['https://api.github.com/users/JNRowe/following'
+                       '?per_page=100'])
+
+    def test_per_call_override(self):
+        client = self.make_client([b'[]'], per_page=100)
+        client.organizations.repositories('github', page=2, per_page=50)
+        assert_equals(self.http.uris,
+                      ['https://api.github.com/orgs/github/repos'
+                       '?page=2&per_page=50'])
+
+    def test_iteration(self):
+        client = self.make_client([b'[{"login": "a"}, {"login": "b"}]',
+                                   b'[{"login": "c"}]'], per_page=2)
+        logins = [user['login'] for user in client.users.iter_followers('x')]
+        assert_equals(logins, ['a', 'b', 'c'])
+        assert_equals(self.http.uris,
+                      ['https://api.github.com/users/x/followers?per_page=2',
+                       'https://api.github.com/users/x/followers'
+                       '?page=2&per_page=2'])
+
+    def test_explicit_get_method(self):
+        client = self.make_client([b'{}'], per_page=100)
+        client.repos.list_hooks('misc', 'JNRowe')
+        assert_equals(self.http.uris,
+                      ['https://api.github.com/repos/JNRowe/misc/hooks'
+                       '?per_page=100'])
+
+    def test_unpaged_listing(self):
+        client = self.make_client([b'{"tags": {}}'], per_page=100)
+        client.repos.tags('JNRowe/misc')
+        assert_equals(self.http.uris,
+                      ['https://api.github.com/repos/show/JNRowe/misc/tags'])
+
+    def test_maximum(self):
+        assert_raises(ValueError, Github, per_page=500)
+        client = self.make_client([])
+        assert_raises(ValueError, client.users.followers, 'JNRowe',
+                      per_page=500)
+        assert_equals(self.http.uris, [])
@@ -0,0 +1,291 @@
+import logging
+import threading
+import unittest
+
+try:
+    import tracemalloc  # For Python 3.4+
+except ImportError:
+    tracemalloc = None
+
+try:
+    # For Python 3
+    from http.server import HTTPServer
+except ImportError:
+    from BaseHTTPServer import HTTPServer
+
+from nose.tools import (assert_almost_equals, assert_equals, assert_true)
+
+from github2.cache import MemoryCache
+from github2.client import Github
+from github2.profiler import (Histogram, Profiler, format_call)
+
+import utils
+from test_request import GzipHandler
+
+
+class HistogramTests(unittest.TestCase):
+    def test_empty(self):
+        histogram = Histogram()
+        assert_equals(histogram.percentile(50), None)
+        assert_equals(histogram.summary()['count'], 0)
+
+    def test_single_value(self):
+        histogram = Histogram()
+        histogram.add(0.25)
+        assert_equals(histogram.percentile(50), 0.25)
+        assert_equals(histogram.percentile(99), 0.25)
+
+    def test_percentiles(self):
+        histogram = Histogram()
+        for millis in range(1, 1001):
+            histogram.add(millis / 1000.0)
+        # Estimates are within the width of a bucket, under 10%
+        for percent in (50, 95, 99):
+            estimate = histogram.percentile(percent)
+            assert_true(abs(estimate - percent / 100.0) < percent / 1000.0,
+                        (percent, estimate))
+        summary = histogram.summary()
+        assert_equals(summary['count'], 1000)
+        assert_almost_equals(summary['mean'], 0.5005)
+        assert_equals((summary['min'], summary['max']), (0.001, 1.0))
+
+    def test_tiny_values(self):
+        histogram = Histogram()
+        histogram.add(0)
+        histogram.add(1e-9)
+        assert_equals(histogram.percentile(99), 1e-9)
+
+
+class ProfilerTests(unittest.TestCase):
+    def setUp(self):
+        self.clock = utils.FakeClock(0.0)
+        self.profiler = Profiler(clock=self.clock)
+
+    def test_phases(self):
+        self.profiler.start('issues/list')
+        assert_true(self.profiler.active())
+        self.profiler.record('server', 0.5)
+        self.profiler.record('server', 0.25)
+        self.profiler.record('parse', 0.125)
+        self.clock.now = 1.0
+        phases = self.profiler.finish()
+        assert_true(not self.profiler.active())
+        assert_equals(phases, {'server': 0.75, 'parse': 0.125,
+                               'other': 0.125, 'total': 1.0})
+        stats = self.profiler.stats()
+        assert_equals(list(stats.keys()), ['issues/list'])
+        assert_equals(stats['issues/list']['server']['p50'], 0.75)
+
+    def test_record_without_call(self):
+        self.profiler.record('server', 0.5)
+        assert_equals(self.profiler.stats(), {})
+
+    def test_nested_calls(self):
+        self.profiler.start('repos/list')
+        self.profiler.start('repos/show')
+        self.profiler.record('parse', 0.5)
+        self.profiler.finish()
+        self.profiler.record('parse', 0.25)
+        self.profiler.finish()
+        stats = self.profiler.stats()
+        assert_equals(stats['repos/show']['parse']['total'], 0.5)
+        assert_equals(stats['repos/list']['parse']['total'], 0.25)
+
+    def test_report(self):
+        for endpoint, duration in (('user/show', 0.1), ('issues/list', 0.2)):
+            self.profiler.start(endpoint)
+            self.profiler.record('read', duration / 2)
+            self.clock.now += duration
+            self.profiler.finish()
+        lines = self.profiler.report().splitlines()
+        assert_equals(lines[0].split(),
+                      ['endpoint', 'phase', 'count', 'p50', 'p95', 'p99',
+                       'total'])
+        assert_equals([line[:45].split() for line in lines[1:]],
+                      [['issues/list', 'read'], ['other'], ['total'],
+                       ['user/show', 'read'], ['other'], ['total']])
+        assert_equals(lines[3].split()[1:], ['1', '200.000', '200.000',
+                                             '200.000', '200.000'])
+
+    def test_reset(self):
+        self.profiler.start('user/show')
+        self.profiler.finish()
+        self.profiler.reset()
+        assert_equals(self.profiler.stats(), {})
+
+
+class ProfiledCallTests(utils.HttpMockTestCase):
+    def setUp(self):
+        super(ProfiledCallTests, self).setUp()
+        self.profiler = self.client.request.profiler = Profiler()
+
+    def test_get_values(self):
+        self.client.issues.list('ask/python-github2')
+        stats = self.profiler.stats()['issues/list']
+        for phase in ('charset', 'parse', 'construct', 'total'):
+            assert_equals(stats[phase]['count'], 1)
+        phases = sum([stats[phase]['total'] for phase in stats
+                      if phase != 'total'])
+        assert_almost_equals(phases, stats['total']['total'])
+
+    def test_get_value(self):
+        self.client.users.show('defunkt')
+        assert_true('construct' in self.profiler.stats()['user/show'])
+
+    def test_call_names(self):
+        self.client.repos.list_collaborators('ask/python-github2')
+        # Direct calls are named by their endpoint
+        self.client.repos.get_values('show', 'ask/python-github2',
+                                     'collaborators', filter='collaborators')
+        assert_equals(sorted(self.profiler.stats()),
+                      ['repos/list_collaborators', 'repos/show'])
+
+    def test_object_cache_hit(self):
+        self.client.request.object_cache = MemoryCache()
+        self.client.users.show('defunkt')
+        self.client.users.show('defunkt')
+        stats = self.profiler.stats()['user/show']
+        assert_equals(stats['total']['count'], 2)
+        assert_equals(stats['parse']['count'], 1)
+
+    def test_counters(self):
+        self.profiler.slow_threshold = 0
+        self.client.users.show('defunkt')
+        call = self.profiler.slow_calls[0]
+        assert_equals(call['requests'], 1)
+        assert_true(call['decoded_bytes'] > 0)
+        assert_true(format_call(call).startswith('user/show took '))
+
+    def test_direct_requests_ignored(self):
+        self.client.request.get('user', 'show', 'defunkt')
+        assert_equals(self.profiler.stats(), {})
+
+
+class RecordingHandler(logging.Handler):
+    def __init__(self):
+        logging.Handler.__init__(self)
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+class SlowCallTests(unittest.TestCase):
+    def setUp(self):
+        self.clock = utils.FakeClock(0.0)
+        self.profiler = Profiler(clock=self.clock, slow_threshold=1.0)
+        self.handler = RecordingHandler()
+        logging.getLogger('github2.profiler').addHandler(self.handler)
+
+    def tearDown(self):
+        logging.getLogger('github2.profiler').removeHandler(self.handler)
+
+    def call(self, duration):
+        self.profiler.start('commits/list')
+        self.profiler.count('requests')
+        self.profiler.count('decoded_bytes', 2048)
+        self.profiler.count('wire_bytes', 512)
+        self.profiler.record('server', duration / 2)
+        self.clock.now += duration
+        self.profiler.finish()
+
+    def test_fast_call(self):
+        self.call(0.5)
+        assert_equals(len(self.profiler.slow_calls), 0)
+        assert_equals(self.handler.messages, [])
+
+    def test_slow_call(self):
+        self.call(2.0)
+        assert_equals(list(self.profiler.slow_calls),
+                      [{'endpoint': 'commits/list',
+                        'phases': {'server': 1.0, 'other': 1.0,
+                                   'total': 2.0},
+                        'requests': 1, 'decoded_bytes': 2048,
+                        'wire_bytes': 512, 'memory': None}])
+        assert_equals(self.handler.messages,
+                      ['slow call commits/list took 2.000s (server 1.000s, '
+                       'other 1.000s), 1 request(s) of 2048 bytes (512 on '
+                       'the wire)'])
+
+    def test_history(self):
+        self.profiler = Profiler(clock=self.clock, slow_threshold=1.0,
+                                 history=2)
+        for duration in (1, 2, 3):
+            self.call(duration)
+        assert_equals([call['phases']['total']
+                       for call in self.profiler.slow_calls], [2, 3])
+
+
+class MemorySamplingTests(utils.HttpMockTestCase):
+    def setUp(self):
+        if tracemalloc is None:
+            self.skipTest('tracemalloc is unavailable')
+        super(MemorySamplingTests, self).setUp()
+
+    def test_sampled(self):
+        profiler = self.client.request.profiler = Profiler(
+            memory_sample_rate=0.5, random=lambda: 0.25)
+        issues = self.client.issues.list('ask/python-github2')
+        assert_true(not tracemalloc.is_tracing())
+        sample = profiler.memory_samples[0]
+        assert_equals(sample['endpoint'], 'issues/list')
+        assert_equals(sample['requests'], 1)
+        # Holds at least the result objects' attribute dicts
+        assert_true(sample['memory']['allocated'] > 100 * len(issues))
+        assert_true(sample['memory']['peak']
+                    >= sample['memory']['allocated'])
+        assert_equals(sample['memory']['top'], None)
+        assert_equals(profiler.memory_stats()['issues/list']['count'], 1)
+
+    def test_not_sampled(self):
+        profiler = self.client.request.profiler = Profiler(
+            memory_sample_rate=0.5, random=lambda: 0.75)
+        self.client.issues.list('ask/python-github2')
+        assert_equals(len(profiler.memory_samples), 0)
+        assert_equals(profiler.memory_stats(), {})
+
+    def test_snapshots(self):
+        profiler = self.client.request.profiler = Profiler(
+            memory_sample_rate=1, memory_snapshots=True)
+        self.client.issues.list('ask/python-github2')
+        top = profiler.memory_samples[0]['memory']['top']
+        assert_true(0 < len(top) <= 10)
+        assert_true(':' in top[0][0])
+
+    def test_tracing_left_enabled(self):
+        tracemalloc.start()
+        try:
+            profiler = self.client.request.profiler = Profiler(
+                memory_sample_rate=1)
+            self.client.issues.list('ask/python-github2')
+            assert_true(tracemalloc.is_tracing())
+            assert_equals(len(profiler.memory_samples), 1)
+        finally:
+            tracemalloc.stop()
+
+
+class KeepAliveHandler(GzipHandler):
+    protocol_version = 'HTTP/1.1'
+
+
+class NetworkPhaseTests(unittest.TestCase):
+    def setUp(self):
+        self.server = HTTPServer(('127.0.0.1', 0), KeepAliveHandler)
+        thread = threading.Thread(target=self.server.serve_forever)
+        thread.daemon = True
+        thread.start()
+        self.url = 'http://127.0.0.1:%d' % self.server.server_address[1]
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_network_phases(self):
+        client = Github(github_url=self.url, profiler=Profiler())
+        assert_equals(len(client.users.search('user')), 100)
+        client.users.search('user2')
+        stats = client.request.profiler.stats()['user/search']
+        # The connection is reused for the second call
+        assert_equals(stats['connect']['count'], 1)
+        assert_equals(stats['server']['count'], 2)
+        assert_equals(stats['read']['count'], 2)
@@ -0,0 +1,96 @@
+import unittest
+
+import httplib2
+
+from nose.tools import (assert_equals, assert_raises, assert_true)
+
+from github3 import request
+from github3.client import Github
+
+import utils
+
+
+def rate_limit_headers(remaining, reset, status=200):
+    return httplib2.Response({'status': str(status),
+                              'x-ratelimit-limit': '5000',
+                              'x-ratelimit-remaining': str(remaining),
+                              'x-ratelimit-reset': str(reset)})
+
+
+class TestRateLimitTracker(unittest.TestCase):
+    def setUp(self):
+        self.clock = utils.FakeClock()
+        self.tracker = request.RateLimitTracker(clock=self.clock,
+                                                sleep=self.clock.sleep)
+
+    def test_unknown_quota(self):
+        assert_equals(self.tracker.acquire(), 0.0)
+        assert_equals(self.tracker.state(), {'limit': None,
+                                             'remaining': None,
+                                             'reset': None,
+                                             'reset_in': None})
+
+    def test_update(self):
+        self.tracker.update(rate_limit_headers(4999, 1060))
+        assert_equals(self.tracker.state(), {'limit': 5000,
+                                             'remaining': 4999,
+                                             'reset': 1060,
+                                             'reset_in': 60})
+
+    def test_missing_headers(self):
+        self.tracker.update(httplib2.Response({'status': '200'}))
+        assert_equals(self.tracker.remaining, None)
+
+    def test_decrement(self):
+        self.tracker.update(rate_limit_headers(2, 1060))
+        self.tracker.acquire()
+        self.tracker.acquire()
+        assert_true(self.tracker.exhausted())
+
+    def test_sleep_until_reset(self):
+        self.tracker.update(rate_limit_headers(0, 1060))
+        assert_true(self.tracker.exhausted())
+        assert_equals(self.tracker.acquire(), 60)
+        assert_equals(self.clock.now, 1060)
+        assert_equals(self.tracker.exhausted(), False)
+
+    def test_no_pacing_by_default(self):
+        self.tracker.update(rate_limit_headers(10, 1060))
+        assert_equals([self.tracker.acquire() for _ in range(3)],
+                      [0.0, 0.0, 0.0])
+
+    def test_pacing(self):
+        self.tracker.pace = True
+        self.tracker.update(rate_limit_headers(10, 1060))
+        self.tracker.acquire()
+        assert_equals(self.tracker.acquire(), 6)
+
+
+class TestQuotaExhaustion(unittest.TestCase):
+    def setUp(self):
+        self.clock = utils.FakeClock()
+        self.client = Github()
+        self.client.request.quota = request.RateLimitTracker(
+            clock=self.clock, sleep=self.clock.sleep)
+
+    def test_client_state(self):
+        self.client.request._http = utils.ScriptedHttp([
+            (rate_limit_headers(4999, 1060), b'{"login": "JNRowe"}'),
+        ])
+        self.client.request.get('users', 'JNRowe')
+        assert_equals(self.client.rate_limit['remaining'], 4999)
+
+    def test_waits_for_reset(self):
+        self.client.request._http = utils.ScriptedHttp([
+            (rate_limit_headers(0, 1060, status=403), b'{}'),
+            (rate_limit_headers(4999, 4660), b'{"login": "JNRowe"}'),
+        ])
+        result = self.client.request.get('users', 'JNRowe')
+        assert_equals(result, {'login': 'JNRowe'})
+        assert_equals(self.clock.now, 1060)
+
+    def test_forbidden(self):
+        self.client.request._http = utils.ScriptedHttp([
+            (rate_limit_headers(4999, 1060, status=403), b'{}'),
+        ])
+        assert_raises(request.HttpError, self.client.request.get, 'user')
@@ -0,0 +1,95 @@
+import json
+import shutil
+import tempfile
+
+from nose.tools import (assert_equals, assert_raises, assert_true)
+
+from github2.cache import (DiskCache, MemoryCache, TieredCache)
+from github2.client import Github
+from github2.commits import Commit
+from github2.issues import Issue
+
+import utils
+
+
+class RawResultTests(utils.HttpMockTestCase):
+    def test_dicts(self):
+        issues = self.client.issues.list('ask/python-github2', raw=True)
+        assert_true(all([type(issue) is dict for issue in issues]))
+        assert_equals(issues[0]['created_at'], '2010/05/18 06:10:36 -0700')
+        objects = self.client.issues.list('ask/python-github2')
+        assert_equals([issue['number'] for issue in issues],
+                      [issue.number for issue in objects])
+
+    def test_single_value(self):
+        commit = self.client.commits.show(
+            'ask/python-github2', '1c83cde9b5a7c396a01af1007fb7b88765b9ae45',
+            raw='dict')
+        assert_equals(type(commit), dict)
+        assert_equals(commit['id'], '1c83cde9b5a7c396a01af1007fb7b88765b9ae45')
+
+    def test_bytes(self):
+        body = self.client.repos.show('JNRowe/misc-overlay', raw='bytes')
+        assert_equals(type(body), bytes)
+        assert_equals(json.loads(body.decode('utf-8'))['repository']['name'],
+                      'misc-overlay')
+
+    def test_client_default(self):
+        client = Github(raw_results=True)
+        assert_equals(type(client.issues.show('ask/python-github2', 24)),
+                      dict)
+        assert_true(isinstance(client.issues.show('ask/python-github2', 24,
+                                                  raw=False), Issue))
+
+    def test_stream(self):
+        commits = list(self.client.commits.stream_list('JNRowe/misc-overlay',
+                                                       raw=True))
+        assert_true(all([type(commit) is dict for commit in commits]))
+        body = self.client.commits.stream_list('JNRowe/misc-overlay',
+                                               raw='bytes')
+        assert_equals(len(json.loads(body.decode('utf-8'))['commits']),
+                      len(commits))
+
+    def test_paged_bytes(self):
+        assert_raises(ValueError, self.client.commits.iter_list,
+                      'JNRowe/misc-overlay', raw='bytes')
+
+    def test_unknown_mode(self):
+        assert_raises(ValueError, self.client.issues.list,
+                      'ask/python-github2', raw='xml')
+
+    def test_response_cache(self):
+        client = Github(response_cache=MemoryCache())
+        body = client.commits.list('JNRowe/misc-overlay', raw='bytes')
+        commits = client.commits.list('JNRowe/misc-overlay')
+        assert_true(isinstance(commits[0], Commit))
+        assert_equals(client.commits.list('JNRowe/misc-overlay',
+                                          raw='bytes'), body)
+
+    def test_modified_cached_result(self):
+        client = Github(response_cache=MemoryCache())
+        client.issues.list('ask/python-github2', raw=True).append('junk')
+        issues = client.issues.list('ask/python-github2')
+        assert_true(all([isinstance(issue, Issue) for issue in issues]))
+
+    def test_disk_cache(self):
+        directory = tempfile.mkdtemp()
+        try:
+            client = Github(response_cache=TieredCache([MemoryCache(),
+                                                        DiskCache(directory)]))
+            body = client.issues.list('ask/python-github2', raw='bytes')
+            assert_equals(type(body), bytes)
+            # Bodies aren't cached with the decoded responses
+            assert_equals(client.request.response_cache.stats()['sets'], 0)
+            assert_true(isinstance(client.issues.list('ask/python-github2')[0],
+                                   Issue))
+        finally:
+            shutil.rmtree(directory)
+
+    def test_object_cache(self):
+        self.client.request.object_cache = MemoryCache()
+        raw = self.client.issues.show('ask/python-github2', 24, raw=True)
+        issue = self.client.issues.show('ask/python-github2', 24)
+        assert_true(isinstance(issue, Issue))
+        assert_equals(self.client.issues.show('ask/python-github2', 24,
+                                              raw=True), raw)
@@ -1,5 +1,16 @@
+import gzip
+import io
+import sys
+import threading
+import time
 import unittest
 
+try:
+    # For Python 3
+    from http.server import (BaseHTTPRequestHandler, HTTPServer)
+except ImportError:
+    from BaseHTTPServer import (BaseHTTPRequestHandler, HTTPServer)
+
 try:
     from urllib.parse import parse_qs  # For Python 3
 except ImportError:
@@ -8,6 +19,7 @@ except ImportError:
     except ImportError:  # For Python <2.6
         from cgi import parse_qs
 
+from nose.tools import (assert_equals, assert_true)
 try:
     from nose.tools import (assert_dict_contains_subset, assert_dict_equal)
 except ImportError:  # for Python <2.7
@@ -19,6 +31,9 @@ except ImportError:  # for Python <2.7
 
 
 from github2 import request
+from github2.client import Github
+
+import utils
 
 
 def assert_params(first, second):
@@ -84,3 +99,356 @@ class TestParameterEncoding(unittest.TestCase):
     def test_multivalue_parameters(self):
         multivals = {'key': ['value1', 'value2']}
         assert_params(multivals, self.r.encode_authentication_data(multivals))
+
+
+class TestIterJsonItems(unittest.TestCase):
+    def test_array(self):
+        assert_equals(list(request.iter_json_items(' [1, {"a": [2]} ,"3"] ')),
+                      [1, {'a': [2]}, '3'])
+
+    def test_keyed_array(self):
+        text = '{"count": 2, "nested": {"commits": []}, ' \
+            '"commits": [{"id": 1}, {"id": 2}], "more": true}'
+        assert_equals(list(request.iter_json_items(text, 'commits')),
+                      [{'id': 1}, {'id': 2}])
+
+    def test_keyed_object(self):
+        text = '{"blobs": {"README": "abc", "setup.py": "def"}}'
+        assert_equals(list(request.iter_json_items(text, 'blobs')),
+                      [('README', 'abc'), ('setup.py', 'def')])
+
+    def test_empty(self):
+        assert_equals(list(request.iter_json_items('{"commits": [ ]}',
+                                                   'commits')), [])
+
+    def test_lazy(self):
+        items = request.iter_json_items('[1, 2, oops]')
+        assert_equals(next(items), 1)
+        assert_equals(next(items), 2)
+        self.assertRaises(ValueError, next, items)
+
+    def test_missing_key(self):
+        items = request.iter_json_items('{"error": "Not found"}', 'commits')
+        self.assertRaises(KeyError, next, items)
+
+
+class TestStream(utils.HttpMockTestCase):
+    def test_stream(self):
+        items = self.client.request.stream('users', 'user', 'show',
+                                           'defunkt', 'followers')
+        assert_equals(list(items),
+                      self.client.users.followers('defunkt'))
+
+
+    def test_network_data_throttled(self):
+        throttled = []
+        self.client.request._throttle = lambda: throttled.append(1)
+        self.client.request._http = utils.ScriptedHttp([utils.response(
+            200, b'{"commits": [{"id": "a"}, {"id": "b"}]}')])
+        commits = self.client.stream_network_data('JNRowe/misc-overlay', 'x')
+        assert_equals([commit['id'] for commit in commits], ['a', 'b'])
+        assert_equals(throttled, [1])
+
+
+class TestConnectionPool(unittest.TestCase):
+    def setUp(self):
+        self.pool = request.ConnectionPool(object, 2)
+
+    def test_reuse(self):
+        http = self.pool.acquire()
+        self.pool.release(http)
+        assert_equals(http, self.pool.acquire())
+        assert_equals(self.pool.stats()['created'], 1)
+
+    def test_stats(self):
+        first = self.pool.acquire()
+        second = self.pool.acquire()
+        self.pool.release(first)
+        assert_dict_contains_subset({'created': 2, 'idle': 1, 'in_use': 1,
+                                     'max_in_use': 2, 'checkouts': 2},
+                                    self.pool.stats())
+        self.pool.release(second)
+
+    def test_blocks_when_exhausted(self):
+        held = [self.pool.acquire(), self.pool.acquire()]
+        result = []
+        thread = threading.Thread(
+            target=lambda: result.append(self.pool.acquire()))
+        thread.start()
+        thread.join(0.1)
+        assert_equals(result, [])
+        self.pool.release(held[0])
+        thread.join()
+        assert_equals(result, [held[0]])
+        assert_equals(self.pool.stats()['waits'], 1)
+
+    def test_invalid_size(self):
+        self.assertRaises(ValueError, request.ConnectionPool, object, 0)
+
+
+class TestPooledRequests(utils.HttpMockTestCase):
+    def test_shared_client(self):
+        client = Github(pool_size=4, coalesce_requests=False)
+        results = []
+
+        def fetch():
+            results.append(client.users.show('defunkt').login)
+        threads = [threading.Thread(target=fetch) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert_equals(results, ['defunkt'] * 8)
+        stats = client.request.pool.stats()
+        assert_equals(stats['checkouts'], 8)
+        assert_equals(stats['in_use'], 0)
+        assert_true(stats['created'] <= 4)
+
+
+class TestSingleFlight(unittest.TestCase):
+    def setUp(self):
+        self.single_flight = request.SingleFlight()
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.calls = []
+
+    def slow_call(self):
+        self.calls.append(1)
+        self.started.set()
+        self.release.wait()
+        return {'login': 'JNRowe'}
+
+    def run_concurrently(self, func, count):
+        results = []
+
+        def call():
+            try:
+                results.append(self.single_flight.do('key', func))
+            except Exception:
+                results.append(sys.exc_info()[1])
+        leader = threading.Thread(target=call)
+        leader.start()
+        self.started.wait()
+        followers = [threading.Thread(target=call) for _ in range(count - 1)]
+        for thread in followers:
+            thread.start()
+        while self.single_flight.stats()['coalesced'] < count - 1:
+            time.sleep(0.01)
+        self.release.set()
+        for thread in [leader] + followers:
+            thread.join()
+        return results
+
+    def test_shared_result(self):
+        results = self.run_concurrently(self.slow_call, 4)
+        assert_equals(len(self.calls), 1)
+        assert_equals(results, [{'login': 'JNRowe'}] * 4)
+        assert_true(all([result is results[0] for result in results]))
+        assert_equals(self.single_flight.stats(),
+                      {'in_flight': 0, 'calls': 1, 'coalesced': 3})
+
+    def test_shared_error(self):
+        def failing_call():
+            self.slow_call()
+            raise request.HttpError('Not found', b'', 404)
+        results = self.run_concurrently(failing_call, 3)
+        assert_equals(len(self.calls), 1)
+        assert_true(all([isinstance(result, request.HttpError)
+                         for result in results]))
+
+    def test_copied_result(self):
+        self.single_flight.copy = request.copy_json
+        results = self.run_concurrently(self.slow_call, 3)
+        assert_equals(results, [{'login': 'JNRowe'}] * 3)
+        assert_equals(len(set([id(result) for result in results])), 3)
+
+    def test_sequential_calls_not_shared(self):
+        self.release.set()
+        self.single_flight.do('key', self.slow_call)
+        self.single_flight.do('key', self.slow_call)
+        assert_equals(len(self.calls), 2)
+
+
+class TestTokenBucket(unittest.TestCase):
+    def setUp(self):
+        self.clock = utils.FakeClock(0.0)
+        self.bucket = request.TokenBucket(2, burst=3, clock=self.clock,
+                                          sleep=self.clock.sleep)
+
+    def test_burst(self):
+        for _ in range(3):
+            assert_equals(self.bucket.acquire(), 0.0)
+        assert_equals(self.bucket.acquire(), 0.5)
+        assert_equals(self.clock.now, 0.5)
+
+    def test_sub_second_rate(self):
+        bucket = request.TokenBucket(4, clock=self.clock,
+                                     sleep=self.clock.sleep)
+        bucket.acquire()
+        assert_equals(bucket.acquire(), 0.25)
+        assert_equals(bucket.acquire(), 0.25)
+
+    def test_refill_capped_at_burst(self):
+        self.clock.now = 100
+        for _ in range(3):
+            assert_true(self.bucket.try_acquire())
+        assert_equals(self.bucket.try_acquire(), False)
+
+    def test_try_acquire(self):
+        for _ in range(3):
+            self.bucket.acquire()
+        assert_equals(self.bucket.try_acquire(), False)
+        assert_equals(self.bucket.wait_time(), 0.5)
+        self.clock.now = 0.5
+        assert_true(self.bucket.try_acquire())
+
+    def test_reservations_are_spaced(self):
+        for _ in range(3):
+            self.bucket.acquire()
+        # Simulate concurrent callers, which reserve tokens before sleeping
+        bucket = request.TokenBucket(2, burst=1, clock=self.clock,
+                                     sleep=lambda duration: None)
+        assert_equals([bucket.acquire() for _ in range(3)], [0.0, 0.5, 1.0])
+
+    def test_stats(self):
+        for _ in range(5):
+            self.bucket.acquire()
+        assert_equals(self.bucket.stats(), {'acquired': 5, 'waits': 2,
+                                            'wait_time': 1.0,
+                                            'max_wait': 0.5})
+
+    def test_invalid_settings(self):
+        self.assertRaises(ValueError, request.TokenBucket, 0)
+        self.assertRaises(ValueError, request.TokenBucket, 1, burst=0)
+
+
+class TestQueryParameters(utils.HttpMockTestCase):
+    def setUp(self):
+        super(TestQueryParameters, self).setUp()
+        self.calls = []
+        http_request = self.client.request._http.request
+
+        def recording_request(uri, method='GET', body=None, headers=None):
+            self.calls.append((uri, method, body))
+            return http_request(uri, method, body, headers)
+        self.client.request._http.request = recording_request
+
+    def test_page_is_get(self):
+        self.client.commits.list('JNRowe/jnrowe-misc', page=2)
+        assert_equals(self.calls, [
+            ('https://github.com/api/v2/json/commits/list/JNRowe/jnrowe-misc/'
+             'master?page=2', 'GET', None),
+        ])
+
+    def test_first_page(self):
+        self.client.commits.list('JNRowe/misc-overlay', page=1)
+        assert_equals(self.calls[0][0], 'https://github.com/api/v2/json/'
+                      'commits/list/JNRowe/misc-overlay/master')
+
+
+class TestBatch(utils.HttpMockTestCase):
+    def test_results_in_order(self):
+        client = Github(pool_size=4)
+        users = ['defunkt', 'mojombo', 'defunkt', 'mojombo']
+        results = client.batch([(client.users.show, user) for user in users])
+        assert_equals([result.login for result, error in results], users)
+        assert_equals([error for result, error in results], [None] * 4)
+
+    def test_errors_captured(self):
+        client = Github(pool_size=2)
+        results = client.batch([(client.users.show, 'defunkt'),
+                                (client.users.show, 'no_such_user')])
+        assert_equals(results[0][0].login, 'defunkt')
+        assert_equals(results[1][0], None)
+        assert_true(isinstance(results[1][1], request.HttpError))
+
+    def test_get_many(self):
+        client = Github(pool_size=2)
+        results = client.request.get_many([('user', 'show', 'defunkt')])
+        assert_equals(results[0][0]['user']['login'], 'defunkt')
+
+    def test_without_pool(self):
+        client = Github()
+        assert_equals(client.request.batch_workers(8), 1)
+        assert_equals(client.batch([]), [])
+
+
+class TestRunBatch(unittest.TestCase):
+    def test_bounded_workers(self):
+        lock = threading.Lock()
+        active = [0, 0]
+
+        def call(value):
+            lock.acquire()
+            active[0] += 1
+            active[1] = max(active)
+            lock.release()
+            time.sleep(0.01)
+            lock.acquire()
+            active[0] -= 1
+            lock.release()
+            return value * 2
+        results = request.run_batch([(call, n) for n in range(10)], 3)
+        assert_equals(results, [(n * 2, None) for n in range(10)])
+        assert_true(active[1] <= 3)
+
+    def test_invalid_workers(self):
+        self.assertRaises(ValueError, request.run_batch, [], 0)
+
+
+class GzipHandler(BaseHTTPRequestHandler):
+    body = ('{"users": [%s]}'
+            % ", ".join(['{"login": "user%d"}' % n for n in range(100)])
+            ).encode('ascii')
+
+    def do_GET(self):
+        body = self.body
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        if 'gzip' in self.headers.get('Accept-Encoding', ''):
+            buf = io.BytesIO()
+            compressed = gzip.GzipFile(fileobj=buf, mode='wb')
+            compressed.write(body)
+            compressed.close()
+            body = buf.getvalue()
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestCompression(unittest.TestCase):
+    def setUp(self):
+        self.server = HTTPServer(('127.0.0.1', 0), GzipHandler)
+        thread = threading.Thread(target=self.server.serve_forever)
+        thread.daemon = True
+        thread.start()
+        self.url = 'http://127.0.0.1:%d' % self.server.server_address[1]
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_compressed(self):
+        client = Github(github_url=self.url)
+        result = client.request.get('user', 'search', 'user')
+        assert_equals(len(result['users']), 100)
+        transfer = client.request.last_transfer()
+        assert_equals(transfer['encoding'], 'gzip')
+        assert_equals(transfer['decoded_bytes'], len(GzipHandler.body))
+        assert_true(transfer['wire_bytes'] < transfer['decoded_bytes'] / 4)
+        assert_equals(client.request.transfer.stats(),
+                      {'responses': 1, 'compressed': 1,
+                       'wire_bytes': transfer['wire_bytes'],
+                       'decoded_bytes': transfer['decoded_bytes']})
+
+    def test_disabled(self):
+        client = Github(github_url=self.url, compression=False)
+        client.request.get('user', 'search', 'user')
+        assert_equals(client.request.last_transfer(),
+                      {'encoding': 'identity',
+                       'wire_bytes': len(GzipHandler.body),
+                       'decoded_bytes': len(GzipHandler.body)})
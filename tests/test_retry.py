@@ -0,0 +1,124 @@
+import socket
+import unittest
+
+from nose.tools import (assert_equals, assert_raises, assert_true)
+
+from github2 import request
+from github2.client import Github
+from github3.client import Github as Github3
+
+from utils import (ScriptedHttp, response)
+
+
+class TestRetryPolicy(unittest.TestCase):
+    def setUp(self):
+        self.delays = []
+        self.policy = request.RetryPolicy(max_retries=3, backoff=1,
+                                          max_backoff=10,
+                                          random=lambda: 0.5,
+                                          clock=lambda: 1000,
+                                          sleep=self.delays.append)
+
+    def test_exponential_backoff(self):
+        assert_equals([self.policy.delay(n) for n in range(1, 6)],
+                      [0.5, 1, 2, 4, 5])
+
+    def test_retry_after(self):
+        assert_equals(self.policy.delay(1, 7), 7)
+        assert_equals(self.policy.delay(1, 11), None)
+
+    def test_retry_after_header(self):
+        headers = response(503, retry_after='3')[0]
+        assert_equals(self.policy.retry_after(headers), 3)
+        headers = response(503, retry_after='Thu, 01 Jan 1970 00:16:45 GMT')[0]
+        assert_equals(self.policy.retry_after(headers), 5)
+        assert_equals(self.policy.retry_after(response(503)[0]), None)
+
+    def test_retryable_response(self):
+        assert_true(self.policy.retryable_response(*response(502)))
+        assert_true(self.policy.retryable_response(
+            *response(403, b'{"message": "abuse detection"}')))
+        assert_true(not self.policy.retryable_response(*response(403)))
+        assert_true(not self.policy.retryable_response(*response(404)))
+
+    def test_budget(self):
+        policy = request.RetryPolicy(budget_ratio=0.5, budget_reserve=2)
+        policy.start('repos/show')
+        assert_true(policy.allow('repos/show', 1, 0))
+        assert_true(policy.allow('repos/show', 1, 0))
+        assert_true(not policy.allow('repos/show', 1, 0))
+        # Budgets are separate for each endpoint
+        assert_true(policy.allow('user/show', 1, 0))
+        policy.start('repos/show')
+        policy.start('repos/show')
+        assert_true(policy.allow('repos/show', 1, 0))
+        assert_equals(policy.stats()['budget_exhausted'], 1)
+
+
+class TestRetries(unittest.TestCase):
+    def setUp(self):
+        self.delays = []
+        self.policy = request.RetryPolicy(random=lambda: 0.5,
+                                          sleep=self.delays.append)
+        self.client = Github(retry_policy=self.policy)
+
+    def script(self, *results):
+        self.http = ScriptedHttp(list(results))
+        self.client.request._http = self.http
+
+    def test_recovers(self):
+        self.script(socket.error('Connection reset by peer'), response(502),
+                    response(200, b'{"user": {"login": "JNRowe"}}'))
+        user = self.client.users.show('JNRowe')
+        assert_equals(user.login, 'JNRowe')
+        assert_equals(self.delays, [0.25, 0.5])
+        stats = self.policy.stats()
+        assert_equals(stats['retries'], 2)
+        assert_equals(stats['recovered'], 1)
+        assert_equals(stats['endpoints'], {'user/show': 2})
+
+    def test_honours_retry_after(self):
+        self.script(response(403, b'{}', retry_after='5'), response(200))
+        self.client.request.get('user', 'show', 'JNRowe')
+        assert_equals(self.delays, [5])
+
+    def test_gives_up(self):
+        self.script(*[response(503)] * 4)
+        assert_raises(request.HttpError, self.client.request.get, 'user',
+                      'show', 'JNRowe')
+        assert_equals(len(self.delays), 3)
+        assert_equals(self.policy.stats()['exhausted'], 1)
+
+    def test_gives_up_on_connection_error(self):
+        self.script(*[socket.error('Connection refused')] * 4)
+        assert_raises(socket.error, self.client.request.get, 'user', 'show',
+                      'JNRowe')
+
+    def test_shared_budget(self):
+        client = Github3(retry_policy=self.policy)
+        client.request._http = ScriptedHttp([response(502), response(200)] * 6)
+        for login in ('JNRowe', 'ask', 'defunkt'):
+            client.users.show(login)
+            client.request.get('users', login)
+        assert_equals(sorted(self.policy.stats()['endpoints']),
+                      ['users', 'users/show'])
+
+    def test_not_idempotent(self):
+        self.script(response(502))
+        assert_raises(request.HttpError, self.client.request.post, 'user',
+                      'follow', 'JNRowe')
+        assert_equals(self.delays, [])
+        assert_equals(self.policy.stats()['requests'], 0)
+
+
+class TestRetryEvents(unittest.TestCase):
+    def test_retry_event(self):
+        client = Github(retry_policy=request.RetryPolicy(sleep=lambda d: None))
+        client.request._http = ScriptedHttp([response(503), response(200)])
+        events = []
+        client.request.hooks.register('retry', events.append)
+        client.request.get('user', 'show', 'JNRowe')
+        assert_equals(len(events), 1)
+        assert_equals((events[0]['attempt'], events[0]['reason']),
+                      (1, 'HTTP 503'))
+        assert_equals(events[0]['endpoint'], 'user/show')
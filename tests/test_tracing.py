@@ -0,0 +1,176 @@
+import random
+import threading
+import unittest
+
+from nose.tools import (assert_equals, assert_raises, assert_true)
+
+from github2 import request
+from github2.cache import MemoryCache
+from github2.client import Github
+from github2.tracing import (InMemoryExporter, SpanExporter, Tracer)
+from github3 import tracing as tracing3
+from github3.client import Github as Github3
+
+import utils
+
+
+class TracerTests(unittest.TestCase):
+    def setUp(self):
+        self.exporter = InMemoryExporter()
+        self.tracer = Tracer(self.exporter, clock=lambda: 100.0,
+                             random=random.Random(0))
+
+    def test_nesting(self):
+        with self.tracer.span('outer', user='ask') as outer:
+            with self.tracer.span('inner') as inner:
+                assert_equals(self.tracer.current_span(), inner)
+        assert_equals(self.tracer.current_span(), None)
+        assert_equals(self.exporter.get_finished_spans(), [inner, outer])
+        assert_equals(inner.trace_id, outer.trace_id)
+        assert_equals(inner.parent_id, outer.span_id)
+        assert_equals(outer.parent_id, None)
+        assert_equals(len(outer.trace_id), 32)
+        assert_equals(len(outer.span_id), 16)
+        assert_equals(outer.attributes, {'user': 'ask'})
+        assert_equals((outer.status, outer.duration), ('ok', 0))
+
+    def test_separate_traces(self):
+        with self.tracer.span('first') as first:
+            pass
+        with self.tracer.span('second') as second:
+            pass
+        assert_true(first.trace_id != second.trace_id)
+
+    def test_error(self):
+        def fail():
+            with self.tracer.span('failing'):
+                raise ValueError('broken')
+        assert_raises(ValueError, fail)
+        span = self.exporter.get_finished_spans()[0]
+        assert_equals(span.status, 'error')
+        assert_equals(span.to_dict()['error'], "ValueError('broken')")
+
+    def test_unfinished_children_closed(self):
+        outer = self.tracer.start_span('outer')
+        self.tracer.start_span('inner')
+        self.tracer.end_span(outer)
+        assert_equals([span.name
+                       for span in self.exporter.get_finished_spans()],
+                      ['inner', 'outer'])
+        assert_equals(self.tracer.current_span(), None)
+
+    def test_wrap(self):
+        spans = []
+
+        def work():
+            with self.tracer.span('worker') as span:
+                spans.append(span)
+        with self.tracer.span('outer') as outer:
+            thread = threading.Thread(target=self.tracer.wrap(work))
+            thread.start()
+            thread.join()
+        assert_equals(spans[0].parent_id, outer.span_id)
+
+    def test_exporter_errors_ignored(self):
+        self.tracer.exporter = SpanExporter()
+        with self.tracer.span('span'):
+            pass
+
+    def test_clear(self):
+        with self.tracer.span('span'):
+            pass
+        self.exporter.clear()
+        assert_equals(self.exporter.get_finished_spans(), [])
+
+
+class InstrumentedTests(utils.HttpMockTestCase):
+    def setUp(self):
+        super(InstrumentedTests, self).setUp()
+        self.exporter = InMemoryExporter()
+        self.client = Github(tracer=Tracer(self.exporter))
+        self.tracer = self.client.request.tracer
+
+    def spans(self):
+        return dict([(span.span_id, span)
+                     for span in self.exporter.get_finished_spans()])
+
+    def test_nested_calls(self):
+        with self.tracer.span('manage_collaborators') as root:
+            for repo in self.client.repos.list('JNRowe')[:2]:
+                self.client.repos.list_collaborators('ask/python-github2')
+        spans = self.spans()
+        calls = [span for span in spans.values()
+                 if span.parent_id == root.span_id]
+        assert_equals(sorted([span.name for span in calls]),
+                      ['repos/list', 'repos/list_collaborators',
+                       'repos/list_collaborators'])
+        for call in calls:
+            children = [span for span in spans.values()
+                        if span.parent_id == call.span_id]
+            assert_equals(len(children), 1)
+            http = children[0]
+            assert_equals((http.name, http.kind), ('HTTP GET', 'client'))
+            assert_equals(http.attributes['http.status_code'], 200)
+            assert_true(http.attributes['http.decoded_content_length'] > 0)
+            assert_equals(http.trace_id, root.trace_id)
+            assert_true(call.start_time <= http.start_time
+                        <= http.end_time <= call.end_time)
+        assert_equals(len(spans), 7)
+
+    def test_call_attributes(self):
+        self.client.users.show('defunkt')
+        call = self.exporter.get_finished_spans()[-1]
+        assert_equals(call.name, 'user/show')
+        assert_equals((call.attributes['github.domain'],
+                       call.attributes['github.command']), ('user', 'show'))
+        assert_equals(call.status, 'ok')
+
+    def test_cache_attributes(self):
+        self.client.request.object_cache = MemoryCache()
+        self.client.users.show('defunkt')
+        self.exporter.clear()
+        self.client.users.show('defunkt')
+        spans = self.exporter.get_finished_spans()
+        assert_equals(len(spans), 1)
+        assert_equals(spans[0].attributes['cache.object'], 'hit')
+
+    def test_error(self):
+        assert_raises(request.HttpError, self.client.users.show, 'nobody')
+        http, call = self.exporter.get_finished_spans()
+        assert_equals(http.attributes['http.status_code'], 404)
+        assert_equals((http.status, call.status), ('error', 'error'))
+        assert_true(isinstance(call.error, request.HttpError))
+
+    def test_batch(self):
+        client = Github(pool_size=2, tracer=self.tracer)
+        with self.tracer.span('batch') as root:
+            client.batch([(client.users.show, 'defunkt'),
+                          (client.users.show, 'JNRowe')])
+        calls = [span for span in self.exporter.get_finished_spans()
+                 if span.name == 'user/show']
+        assert_equals([span.parent_id for span in calls],
+                      [root.span_id, root.span_id])
+
+
+class RetryTracingTests(unittest.TestCase):
+    def test_retry(self):
+        exporter = InMemoryExporter()
+        client = Github(tracer=Tracer(exporter),
+                        retry_policy=request.RetryPolicy(sleep=lambda d: None))
+        client.request._http = utils.ScriptedHttp([
+            utils.response(503), utils.response(200, b'{"user": {}}')])
+        client.users.show('JNRowe')
+        http = exporter.get_finished_spans()[0]
+        assert_equals(http.attributes['http.retries'], 1)
+        assert_equals([(event['name'], event['attributes']['reason'])
+                       for event in http.events], [('retry', 'HTTP 503')])
+
+
+class EncodingTracingTests(unittest.TestCase):
+    def test_unencodable_body(self):
+        client = Github3(tracer=tracing3.Tracer(tracing3.InMemoryExporter()))
+        client.request._http = utils.ScriptedHttp([])
+        assert_raises(TypeError, client.request.post, 'repos', 'create',
+                      name=object())
+        assert_equals(client.request.tracer.current_span(), None)
+        assert_equals(client.request._http.uris, [])
@@ -1,9 +1,9 @@
 # -*- coding: utf-8 -*-
 
-from datetime import datetime as dt
+from datetime import (datetime as dt, timedelta)
 
 from dateutil.tz import tzutc
-from nose.tools import assert_equals
+from nose.tools import (assert_equals, assert_true)
 
 from github2 import core
 from github2.core import (datetime_to_ghdate, datetime_to_commitdate,
@@ -176,3 +176,15 @@ def test_datetime_to_isodate():
                   '2011-04-09T09:53:00Z')
     assert_equals(datetime_to_isodate(dt_utz(2011, 4, 9, 9, 53, 0)),
                   '2011-04-09T09:53:00Z')
+
+
+def test_offsets_shared():
+    first = string_to_datetime('2011/05/22 00:24:15 -0700', 'github')
+    second = string_to_datetime('2011-04-09T10:07:30-07:00', 'commit')
+    assert_true(first.tzinfo is second.tzinfo)
+    assert_equals(first.utcoffset(), timedelta(hours=-7))
+
+
+def test_utc():
+    assert_equals(string_to_datetime('2011-05-22T00:24:15Z', 'iso').tzinfo,
+                  tzutc())
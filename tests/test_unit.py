@@ -1,9 +1,11 @@
 # -*- coding: utf-8 -*-
 
-import datetime
+import time
 import unittest
 
-from nose.tools import (assert_equals, assert_true)
+from datetime import datetime
+
+from nose.tools import (assert_equals, assert_raises, assert_true)
 
 from github2.core import repr_string
 from github2.issues import Issue
@@ -35,19 +37,49 @@ class HostSetting(unittest.TestCase):
 class RateLimits(utils.HttpMockTestCase):
     """Test API rate-limitting"""
     def test_delays(self):
-        """Test call delay is at least one second"""
+        """Test call delay is at least two seconds"""
         client = Github(requests_per_second=.5)
+        start = time.time()
         client.users.show('defunkt')
-        start = datetime.datetime.utcnow()
         client.users.show('mojombo')
-        end = datetime.datetime.utcnow()
-
-        delta = end - start
-        delta_seconds = delta.days * 24 * 60 * 60 + delta.seconds
+        end = time.time()
 
-        assert_true(delta_seconds >= 2,
+        assert_true(end - start >= 2,
                     "Expected .5 reqs per second to require a 2 second delay "
                     "between calls.")
+        assert_equals(client.request.rate_limiter.stats()['waits'], 1)
+
+
+class LazyAttributes(unittest.TestCase):
+    """Date attributes are only converted when read"""
+    def test_converted_on_access(self):
+        issue = Issue(created_at='2009/04/18 13:04:09 -0700')
+        assert_equals(vars(issue)['created_at'], '2009/04/18 13:04:09 -0700')
+        assert_equals(issue.created_at, datetime(2009, 4, 18, 13, 4, 9))
+        # The converted value is kept
+        assert_true(vars(issue)['created_at'] is issue.created_at)
+
+    def test_unset(self):
+        assert_equals(Issue().closed_at, None)
+
+    def test_assignment(self):
+        issue = Issue()
+        issue.updated_at = '2010/04/17 17:24:29 -0700'
+        assert_equals(issue.updated_at, datetime(2010, 4, 17, 17, 24, 29))
+
+    def test_iter(self):
+        issue = Issue(number=1, created_at='2009/04/18 13:04:09 -0700')
+        assert_equals(dict(issue), {'number': 1, 'created_at':
+                                    datetime(2009, 4, 18, 13, 4, 9)})
+
+    def test_compact(self):
+        issue = Issue.compact()(created_at='2009/04/18 13:04:09 -0700')
+        assert_equals(issue.created_at, datetime(2009, 4, 18, 13, 4, 9))
+        assert_true(issue.created_at is issue.created_at)
+
+    def test_invalid_value(self):
+        issue = Issue(created_at='not a date')
+        assert_raises(ValueError, getattr, issue, 'created_at')
 
 
 class BaseDataIter(utils.HttpMockTestCase):
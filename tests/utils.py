@@ -48,6 +48,55 @@ class HttpMock(object):
                     "Resource %r unavailable from test data store" % file)
 
 
+class ScriptedHttp(object):
+    """Fake Http object returning, or raising, a scripted series of results
+
+    .. attribute: uris, methods, headers
+
+       URIs, methods and headers of the requests made, for testing calls
+    """
+
+    def __init__(self, results):
+        self.results = results
+        self.uris = []
+        self.methods = []
+        self.headers = []
+
+    def request(self, uri, method='GET', body=None, headers=None,
+                redirections=5, connection_type=None):
+        self.uris.append(uri)
+        self.methods.append(method)
+        self.headers.append(headers)
+        result = self.results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+def response(status, body=b'{}', **headers):
+    """Scripted result for :class:`ScriptedHttp`
+
+    Header names are given with underscores in place of dashes, such as
+    ``retry_after``.
+    """
+    headers['status'] = str(status)
+    return (httplib2.Response(dict((k.replace('_', '-'), v)
+                                   for k, v in headers.items())), body)
+
+
+class FakeClock(object):
+    """Clock for time dependent tests, which only moves when told to"""
+
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, duration):
+        self.now += duration
+
+
 class HttpMockTestCase(unittest.TestCase):
     def setUp(self):
         """Prepare test fixtures